@@ -20,6 +20,7 @@ from model_service import (
     load_dataset,
     load_direct_results,
     load_reference_results,
+    load_rolling_correlations,
     mean_absolute_percentage_error,
     run_allowlisted_script,
     run_experiment,
@@ -92,6 +93,11 @@ def cached_reference_results() -> tuple[pd.DataFrame, pd.DataFrame]:
     return load_reference_results()
 
 
+@st.cache_data(show_spinner=False)
+def cached_rolling_correlations() -> pd.DataFrame:
+    return load_rolling_correlations()
+
+
 @st.cache_data(show_spinner=False)
 def cached_direct_results() -> tuple[pd.DataFrame, pd.DataFrame]:
     return load_direct_results()
@@ -238,6 +244,8 @@ def render_overview(df: pd.DataFrame) -> None:
             height=360,
         )
 
+    render_rolling_correlations()
+
     st.markdown("### Resumo multi-horizonte")
     st.caption(
         "Comparação temporal dos horizontes de 1, 3, 7 e 14 dias em 352 datas-alvo."
@@ -269,6 +277,31 @@ def render_overview(df: pd.DataFrame) -> None:
     metric_table(metrics)
 
 
+def render_rolling_correlations() -> None:
+    st.markdown("### Correlação móvel com as interrupções")
+    st.caption(
+        "Correlação de Pearson em janelas de 30, 90 e 365 dias terminadas em cada data."
+    )
+    try:
+        rolling = cached_rolling_correlations()
+    except (FileNotFoundError, ValueError) as error:
+        st.warning(f"As correlações móveis não puderam ser carregadas: {error}")
+        return
+
+    variables = [
+        column for column in rolling.columns if column not in ("data", "janela_dias")
+    ]
+    variable = st.selectbox("Variável meteorológica", variables)
+    surface = rolling.pivot(index="data", columns="janela_dias", values=variable)
+    surface.columns = [f"{window} dias" for window in surface.columns]
+    st.line_chart(
+        surface,
+        x_label="Data",
+        y_label="Correlação de Pearson (r)",
+        height=320,
+    )
+
+
 def render_training(df: pd.DataFrame) -> None:
     hero(
         "Treinar e avaliar modelos",
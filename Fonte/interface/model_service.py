@@ -32,14 +32,18 @@ from statsmodels.tsa.statespace.sarimax import SARIMAX
 INTERFACE_DIR = Path(__file__).resolve().parent
 FONTE_DIR = INTERFACE_DIR.parent
 PROJECT_DIR = FONTE_DIR.parent
-MODELS_DIR = FONTE_DIR / "src" / "models"
-DATASET_PATH = FONTE_DIR / "data" / "dataset_engenharia_features.csv"
+SOURCE_DIR = FONTE_DIR / "src"
+MODELS_DIR = SOURCE_DIR / "models"
+DATASET_PATH = FONTE_DIR / "data" / "dataset_engenharia_features.npy"
+ROLLING_CORRELATIONS_PATH = FONTE_DIR / "data" / "correlacoes_moveis.csv"
 ML_RESULTS_DIR = FONTE_DIR / "results" / "ml"
 INTERFACE_RESULTS_DIR = FONTE_DIR / "results" / "interface"
 
-if str(MODELS_DIR) not in sys.path:
-    sys.path.insert(0, str(MODELS_DIR))
+for import_dir in (SOURCE_DIR, MODELS_DIR):
+    if str(import_dir) not in sys.path:
+        sys.path.insert(0, str(import_dir))
 
+from feature_store import load_features  # noqa: E402
 from gru_avancada import AdvancedGRU, train_gru_model  # noqa: E402
 from lstm_bidirecional import (  # noqa: E402
     AdvancedLSTM,
@@ -118,9 +122,13 @@ SCRIPT_CATALOG = {
 
 
 def load_dataset(path: Path | str = DATASET_PATH) -> pd.DataFrame:
-    """Carrega e valida o dataset de engenharia de atributos."""
-    df = pd.read_csv(path, index_col="data", parse_dates=True)
-    df = df.sort_index()
+    """Carrega e valida o dataset de engenharia de atributos.
+
+    ``path`` pode ser o armazenamento ``.npy`` gravado por
+    ``03_feature_engineering.py``, validado e lido sem análise de texto, ou o
+    CSV, usado também quando o armazenamento ainda não foi gerado.
+    """
+    df = load_features(path).sort_index()
     if df.empty:
         raise ValueError("O dataset está vazio.")
     if "interrupcoes" not in df.columns:
@@ -132,6 +140,14 @@ def load_dataset(path: Path | str = DATASET_PATH) -> pd.DataFrame:
     return df
 
 
+def load_rolling_correlations(path: Path | str = ROLLING_CORRELATIONS_PATH) -> pd.DataFrame:
+    """Carrega as correlações móveis geradas por ``05_correlacoes_unificadas.py``."""
+    rolling = pd.read_csv(path, parse_dates=["data"])
+    if "janela_dias" not in rolling.columns:
+        raise ValueError("A coluna obrigatória 'janela_dias' não foi encontrada.")
+    return rolling
+
+
 def load_reference_results() -> tuple[pd.DataFrame, pd.DataFrame]:
     """Carrega métricas e previsões multi-horizonte já reproduzidas."""
     metrics_path = ML_RESULTS_DIR / "metrics_multihorizon.csv"
@@ -3,17 +3,90 @@
 O escopo deste executor cobre as bases, análises e modelos mantidos em
 ``Fonte/src``. Figuras produzidas pelos diretórios históricos ``SegundoPedido``
 e ``TerceiroPedido`` não fazem parte desta execução.
+
+As etapas formam um grafo declarado em ``PIPELINE_STAGES``: cada uma lista os
+artefatos que lê e grava, e uma etapa começa assim que as que produzem suas
+entradas terminam. Até ``--workers`` etapas rodam ao mesmo tempo (padrão: 1,
+execução sequencial). Quando uma etapa começa, os núcleos são divididos entre
+as etapas em execução naquele momento (``OMP_NUM_THREADS``, threads do PyTorch
+e do joblib): as pesadas repartem o que as leves não ocupam, e uma etapa
+sozinha recebe todos. A saída de cada etapa vai para ``logs/<etapa>.log`` na
+área temporária.
+
+``StageCache`` guarda as saídas de cada etapa em ``cache_pipeline/``,
+endereçadas pelo SHA-256 do conteúdo, sob uma chave que resume o script, os
+módulos de ``src`` que ele importa, as entradas declaradas, os parâmetros e as
+versões das bibliotecas. Ao final, o cache é podado até ``--cache-max-gb``.
+Uma etapa cuja chave já está no cache tem as saídas restauradas na área
+temporária em vez de ser executada; a validação e a promoção seguem iguais.
+
+Com ``--runner warm``, os scripts rodam em ``WarmRunner``: processos
+persistentes que importam NumPy, pandas, Matplotlib, scikit-learn,
+statsmodels, XGBoost e PyTorch uma única vez e executam cada etapa como
+``__main__`` com diretório, argumentos, estado do Matplotlib, sementes e
+módulos locais isolados. A suíte de testes continua em um processo próprio.
+
+Com ``--staging link``, a área temporária é montada por ``TreeStager``:
+reflinks (cópia sob escrita) quando o sistema de arquivos permite e, para os
+arquivos que nenhuma etapa grava, hardlinks; só os arquivos declarados como
+saída de alguma etapa são copiados de fato.
+
+Cada execução grava ``data/pipeline_telemetry.json`` com tempo, CPU de
+usuário e de sistema, pico de memória residente e tamanho das saídas de cada
+etapa, imprime um resumo ordenado pelo tempo e, com ``--compare``, aponta as
+etapas que ficaram mais lentas ou mais pesadas que na execução anterior.
+
+``StageJournal`` registra em ``etapas_concluidas.jsonl``, na área temporária,
+a chave e o SHA-256 das saídas de cada etapa concluída. Após uma falha, a área
+é preservada e ``--resume <área>`` a reaproveita: os fontes são atualizados a
+partir do repositório e as etapas cuja chave e cujas saídas ainda conferem com
+o diário não são executadas de novo; a validação e a promoção seguem iguais.
 """
 
 from __future__ import annotations
 
 import argparse
+import ast
+import contextlib
+import functools
+import hashlib
+import importlib
+import importlib.metadata
+import json
+import multiprocessing
+import os
+import random
+import runpy
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+import traceback
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
 
 FONTE_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = FONTE_DIR.parent
@@ -23,15 +96,50 @@ INTERFACE_DIR = FONTE_DIR / "interface"
 DATA_DIR = FONTE_DIR / "data"
 RESULTS_DIR = FONTE_DIR / "results"
 MONOGRAPH_IMAGES = PROJECT_ROOT / "Monografia" / "img"
+PIPELINE_CACHE_DIR = FONTE_DIR / "cache_pipeline"
+STAGE_CACHE_VERSION = 1
+# Bibliotecas cujas versões entram na chave: atualizá-las invalida o cache.
+CACHE_LIBRARIES = (
+    "numpy",
+    "pandas",
+    "scipy",
+    "scikit-learn",
+    "statsmodels",
+    "xgboost",
+    "torch",
+    "matplotlib",
+    "seaborn",
+    "pyarrow",
+)
+PIPELINE_CACHE_MAX_GB = 5.0
+# ioctl FICLONE do Linux: clona um arquivo por cópia sob escrita (Btrfs, XFS).
+FICLONE = 0x40049409
+TELEMETRY_FILENAME = "pipeline_telemetry.json"
+TELEMETRY_VERSION = 1
+# Aumento relativo que marca uma regressão; etapas mais curtas que o mínimo
+# de segundos são ignoradas na comparação de tempo.
+TELEMETRY_TOLERANCE = 0.2
+TELEMETRY_MIN_SECONDS = 5.0
+# ``ru_maxrss`` vem em bytes no macOS e em KiB nos demais sistemas.
+MAXRSS_BYTES = 1 if sys.platform == "darwin" else 1024
+JOURNAL_FILENAME = "etapas_concluidas.jsonl"
+HARDLINKS_FILENAME = "hardlinks.json"
+
+# O mesmo SHA-256 de arquivos usado pela base e pelo armazenamento de atributos.
+sys.path.insert(0, str(SRC_DIR))
+from file_digest import sha256  # noqa: E402
 
 GENERATED_DATA_FILES = (
     "base_diaria_interrupcoes_clima_vento.csv",
     "vento_diario_brasilia.csv",
     "dataset_engenharia_features.csv",
+    "dataset_engenharia_features.npy",
+    "dataset_engenharia_features.json",
     "manifesto_fontes_padronizadas.json",
     "agregados_semanais_canonicos.csv",
     "agregados_mensais_canonicos.csv",
     "correlacoes_consolidadas.csv",
+    "correlacoes_moveis.csv",
 )
 
 REQUIRED_EDA_FILES = (
@@ -98,20 +206,384 @@ REQUIRED_ML_FILES = (
 )
 
 
-def run(script: Path, project_root: Path, *arguments: str) -> None:
-    relative = script.relative_to(project_root)
-    print(f"\n=== {relative} {' '.join(arguments)} ===", flush=True)
-    subprocess.run(
-        [sys.executable, str(script), *arguments],
-        cwd=script.parent,
-        check=True,
-    )
+# Variáveis lidas pelo OpenMP (XGBoost, PyTorch), pelas bibliotecas de álgebra
+# linear e pelo joblib/loky (GridSearchCV) para limitar as threads.
+THREAD_ENVIRONMENT = (
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "LOKY_MAX_CPU_COUNT",
+)
+# Bibliotecas importadas uma vez por worker do ``WarmRunner``.
+WARM_MODULES = (
+    "numpy",
+    "pandas",
+    "matplotlib.pyplot",
+    "seaborn",
+    "scipy.stats",
+    "sklearn.model_selection",
+    "statsmodels.api",
+    "xgboost",
+    "torch",
+)
+STAGE_SEED = 42
+
+
+@dataclass(frozen=True)
+class Stage:
+    """Etapa do pipeline e os artefatos, relativos a ``Fonte``, que lê e grava.
+
+    ``script`` é relativo a ``Fonte``; sem script, a etapa roda a suíte de
+    testes. ``after`` acrescenta dependências que não passam por arquivos, e
+    ``heavy`` marca as etapas que recebem uma fatia maior dos núcleos.
+    """
+
+    name: str
+    script: str | None
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    after: tuple[str, ...] = ()
+    heavy: bool = False
+
+
+def _data(*names: str) -> tuple[str, ...]:
+    return tuple(f"data/{name}" for name in names)
+
 
+def _eda(*names: str) -> tuple[str, ...]:
+    return tuple(f"results/eda/{name}" for name in names)
+
+
+def _ml(*names: str) -> tuple[str, ...]:
+    return tuple(f"results/ml/{name}" for name in names)
+
+
+BASE = _data("base_diaria_interrupcoes_clima_vento.csv")
+FEATURES = _data(
+    "dataset_engenharia_features.npy",
+    "dataset_engenharia_features.json",
+)
+DIRECT_PREDICTIONS = _ml(
+    "predictions_xgboost.csv",
+    "predictions_lstm_bi.csv",
+    "predictions_gru_bi.csv",
+)
+XGBOOST_PARAMS = _ml("xgboost_best_params.json")
+
+PIPELINE_STAGES = (
+    Stage(
+        "build_base_from_standardized",
+        "src/build_base_from_standardized.py",
+        outputs=(
+            *BASE,
+            *_data("vento_diario_brasilia.csv", "manifesto_fontes_padronizadas.json"),
+        ),
+    ),
+    Stage(
+        "03_feature_engineering",
+        "src/03_feature_engineering.py",
+        inputs=BASE,
+        outputs=(
+            *_data("dataset_engenharia_features.csv", "estado_engenharia_features.json"),
+            *FEATURES,
+            # Gravado apenas quando o pyarrow está instalado.
+            *_data("dataset_engenharia_features.arrow"),
+        ),
+    ),
+    Stage(
+        "01_eda_sazonalidade",
+        "src/01_eda_sazonalidade.py",
+        inputs=BASE,
+        outputs=_eda(
+            "decomposicao_interrupcoes.png",
+            "autocorrelacao_interrupcoes.png",
+            "decomposicao_precipitacao.png",
+        ),
+    ),
+    Stage(
+        "02_correlacoes_nao_lineares",
+        "src/02_correlacoes_nao_lineares.py",
+        inputs=BASE,
+        outputs=_eda(
+            "correlacao_spearman.png",
+            "correlacao_kendall.png",
+            "cross_corr_chuva_interrupcoes.png",
+            "cross_corr_vento_interrupcoes.png",
+        ),
+    ),
+    Stage(
+        "04_eda_basica",
+        "src/04_eda_basica.py",
+        inputs=BASE,
+        outputs=_eda(
+            "serie_temporal_completa.png",
+            "distribuicao_interrupcoes.png",
+            "evolucao_anual_interrupcoes.png",
+            "eda_violin_anomalias.png",
+        ),
+    ),
+    Stage(
+        "script_exploration_pipeline",
+        "src/models/script_exploration_pipeline.py",
+        inputs=BASE,
+        outputs=_eda(
+            "eda_heatmap_pearson.png",
+            "eda_boxplot_sazonalidade.png",
+            "eda_scatter_ventos.png",
+        ),
+    ),
+    Stage(
+        "05_correlacoes_unificadas",
+        "src/05_correlacoes_unificadas.py",
+        inputs=(*BASE, *_data("base_mensal_interrupcoes_clima_consumo.csv")),
+        outputs=(
+            *_data(
+                "agregados_semanais_canonicos.csv",
+                "agregados_mensais_canonicos.csv",
+                "correlacoes_consolidadas.csv",
+                "correlacoes_moveis.csv",
+            ),
+            *_eda("correlacoes_escala_temporal.png"),
+        ),
+        # Bootstrap em blocos com milhares de reamostragens por correlação.
+        heavy=True,
+    ),
+    # Os testes validam as bases geradas antes de qualquer modelo ser treinado.
+    Stage("testes", None, inputs=_data(*GENERATED_DATA_FILES)),
+    Stage(
+        "baseline_persistence",
+        "src/models/baseline_persistence.py",
+        inputs=FEATURES,
+        outputs=_ml("metrics_persistence.csv"),
+        after=("testes",),
+    ),
+    Stage(
+        "baseline_xgboost",
+        "src/models/baseline_xgboost.py",
+        inputs=FEATURES,
+        outputs=(
+            *DIRECT_PREDICTIONS[:1],
+            *XGBOOST_PARAMS,
+            *_ml(
+                "metrics_xgboost.csv",
+                "xgboost_cv_results.csv",
+                "feature_importance_xgboost.png",
+                "scatter_pred_xgboost.png",
+                "ts_pred_xgboost.png",
+            ),
+        ),
+        after=("testes",),
+        heavy=True,
+    ),
+    Stage(
+        "lstm_bidirecional",
+        "src/models/lstm_bidirecional.py",
+        inputs=FEATURES,
+        outputs=(
+            DIRECT_PREDICTIONS[1],
+            *_ml(
+                "metrics_lstm_bi.csv",
+                "learning_curve_lstm_bidirecional.png",
+                "scatter_pred_lstm_bi.png",
+                "ts_pred_lstm_bi.png",
+            ),
+        ),
+        after=("testes",),
+        heavy=True,
+    ),
+    Stage(
+        "gru_avancada",
+        "src/models/gru_avancada.py",
+        inputs=FEATURES,
+        outputs=(
+            DIRECT_PREDICTIONS[2],
+            *_ml(
+                "metrics_gru_bi.csv",
+                "learning_curve_gru_bidirecional.png",
+                "scatter_pred_gru_bi.png",
+                "ts_pred_gru_bi.png",
+            ),
+        ),
+        after=("testes",),
+        heavy=True,
+    ),
+    Stage(
+        "advanced_plots",
+        "src/models/advanced_plots.py",
+        inputs=DIRECT_PREDICTIONS,
+        outputs=_ml("kde_residuos_modelos.png", "scatter_heteroscedasticity.png"),
+    ),
+    Stage(
+        "evaluate_severity",
+        "src/models/evaluate_severity.py",
+        inputs=(*_data("dataset_engenharia_features.csv"), *DIRECT_PREDICTIONS),
+        outputs=_ml("metrics_severity.csv"),
+    ),
+    Stage(
+        "robustness_analysis",
+        "src/models/robustness_analysis.py",
+        inputs=(*FEATURES, *DIRECT_PREDICTIONS, *XGBOOST_PARAMS),
+        outputs=_ml(
+            "robustness_model_intervals.csv",
+            "robustness_pairwise_differences.csv",
+            "residual_diagnostics.csv",
+            "ablation_xgboost_metrics.csv",
+            "ablation_xgboost_predictions.csv",
+            "ablation_xgboost_differences.csv",
+            "bootstrap_block_sensitivity.csv",
+            "uncertainty_mae_block_bootstrap.png",
+            "ablation_xgboost.png",
+            "residual_acf_models.png",
+        ),
+        heavy=True,
+    ),
+    Stage(
+        "previsao_multihorizonte",
+        "src/models/previsao_multihorizonte.py",
+        inputs=(*FEATURES, *XGBOOST_PARAMS),
+        outputs=_ml(
+            "predictions_all.csv",
+            "metrics_multihorizon.csv",
+            "previsao_multihorizonte_metricas.csv",
+        ),
+        heavy=True,
+    ),
+    Stage(
+        "plot_multihorizonte",
+        "src/models/plot_multihorizonte.py",
+        inputs=_ml("previsao_multihorizonte_metricas.csv"),
+        outputs=_ml(
+            "previsao_multihorizonte_degradacao.png",
+            "previsao_multihorizonte_degradacao_rmse.png",
+            "previsao_multihorizonte_mae_rmse.png",
+        ),
+    ),
+    Stage(
+        "plot_multihorizonte_temporal",
+        "src/models/plot_multihorizonte_temporal.py",
+        inputs=_ml("predictions_all.csv"),
+        outputs=_ml(
+            "metrics_multihorizon_monthly.csv",
+            "previsao_multihorizonte_mae_mensal.png",
+            "previsao_multihorizonte_temporal_bigru.png",
+            "previsao_multihorizonte_temporal_bilstm.png",
+            "previsao_multihorizonte_temporal_xgboost.png",
+        ),
+    ),
+)
+
+
+def stage_dependencies(stages: Iterable[Stage]) -> dict[str, set[str]]:
+    """Etapas das quais cada etapa depende, derivadas das entradas e de ``after``.
+
+    Entradas que nenhuma etapa grava são arquivos de origem. Rejeita artefatos
+    gravados por mais de uma etapa, dependências desconhecidas e ciclos.
+    """
+    stages = list(stages)
+    producers: dict[str, str] = {}
+    for stage in stages:
+        for output in stage.outputs:
+            if output in producers:
+                raise ValueError(
+                    f"{output} é gravado por {producers[output]} e por {stage.name}."
+                )
+            producers[output] = stage.name
+    names = {stage.name for stage in stages}
+    dependencies = {}
+    for stage in stages:
+        unknown = set(stage.after) - names
+        if unknown:
+            raise ValueError(
+                f"{stage.name} depende de etapas inexistentes: {sorted(unknown)}"
+            )
+        dependencies[stage.name] = {
+            producers[path] for path in stage.inputs if path in producers
+        } | set(stage.after)
+        dependencies[stage.name].discard(stage.name)
+
+    remaining = {name: set(required) for name, required in dependencies.items()}
+    while remaining:
+        ready = [name for name, required in remaining.items() if not required]
+        if not ready:
+            raise ValueError(f"Ciclo entre as etapas: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for required in remaining.values():
+            required.difference_update(ready)
+    return dependencies
+
+
+def thread_budget(
+    stage: Stage,
+    running: Iterable[Stage],
+    cpus: int | None = None,
+) -> int:
+    """Threads de ``stage`` conforme as etapas em execução quando ela começa.
+
+    ``running`` inclui ``stage``. Sem etapas pesadas, as leves dividem todos os
+    núcleos; com elas, cada leve fica com um núcleo e as pesadas dividem o resto.
+    """
+    cpus = cpus or os.cpu_count() or 1
+    running = list(running)
+    heavy = sum(other.heavy for other in running)
+    if not heavy:
+        return max(1, cpus // len(running))
+    if not stage.heavy:
+        return 1
+    return max(1, (cpus - (len(running) - heavy)) // heavy)
+
+
+def schedule_stages(
+    stages: Iterable[Stage],
+    run_stage: Callable[[Stage, int], None],
+    workers: int,
+    cpus: int | None = None,
+) -> None:
+    """Executa ``run_stage`` em cada etapa assim que suas dependências terminam.
 
-def run_tests(staged_fonte: Path, staged_project: Path) -> None:
-    print("\n=== Fonte/tests ===", flush=True)
-    subprocess.run(
-        [
+    Entre as etapas prontas, as pesadas começam primeiro e, depois, vale a
+    ordem de declaração. Cada etapa recebe o número de threads de
+    ``thread_budget`` calculado quando ela começa. Após uma falha nenhuma etapa
+    nova começa; as que já estão rodando terminam e a primeira exceção é
+    propagada.
+    """
+    if workers < 1:
+        raise ValueError("O número de workers deve ser positivo.")
+    stages = list(stages)
+    dependencies = stage_dependencies(stages)
+    pending = sorted(stages, key=lambda stage: not stage.heavy)
+    finished: set[str] = set()
+    failure: BaseException | None = None
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        running: dict[Future[None], Stage] = {}
+        while running or (pending and failure is None):
+            if failure is None:
+                for stage in [s for s in pending if dependencies[s.name] <= finished]:
+                    if len(running) == workers:
+                        break
+                    pending.remove(stage)
+                    threads = thread_budget(stage, [*running.values(), stage], cpus)
+                    running[executor.submit(run_stage, stage, threads)] = stage
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                error = future.exception()
+                if error is None:
+                    finished.add(stage.name)
+                elif failure is None:
+                    failure = error
+    if failure is not None:
+        raise failure
+
+
+def stage_command(
+    stage: Stage,
+    staged_project: Path,
+    staged_fonte: Path,
+) -> tuple[list[str], Path]:
+    """Linha de comando e diretório de trabalho da etapa na área temporária."""
+    if stage.script is None:
+        return [
             sys.executable,
             "-m",
             "unittest",
@@ -121,10 +593,500 @@ def run_tests(staged_fonte: Path, staged_project: Path) -> None:
             "-p",
             "test_*.py",
             "-v",
-        ],
-        cwd=staged_project,
-        check=True,
+        ], staged_project
+    script = staged_fonte / stage.script
+    return [sys.executable, str(script)], script.parent
+
+
+def _usage(usage: object) -> dict[str, float]:
+    return {
+        "cpu_usuario_s": round(usage.ru_utime, 3),
+        "cpu_sistema_s": round(usage.ru_stime, 3),
+        "rss_pico_mb": round(usage.ru_maxrss * MAXRSS_BYTES / 2**20, 1),
+    }
+
+
+def _run_subprocess(
+    command: list[str],
+    cwd: Path,
+    environment: dict[str, str],
+    log_path: Path,
+) -> tuple[int, dict[str, float]]:
+    """Roda ``command`` e devolve o código de saída e o uso de recursos do filho.
+
+    ``os.wait4`` mede apenas este processo (e os subprocessos que ele
+    aguardou), mesmo com outras etapas rodando em paralelo.
+    """
+    with log_path.open("w", encoding="utf-8") as log:
+        process = subprocess.Popen(
+            command,
+            cwd=cwd,
+            env=environment,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+        if not hasattr(os, "wait4"):
+            return process.wait(), {}
+        try:
+            _, status, usage = os.wait4(process.pid, 0)
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return process.returncode, _usage(usage)
+
+
+def run_stage(
+    stage: Stage,
+    staged_project: Path,
+    staged_fonte: Path,
+    log_dir: Path,
+    threads: int,
+    arguments: tuple[str, ...] = (),
+    runner: WarmRunner | None = None,
+) -> dict[str, float]:
+    """Roda a etapa com ``threads`` threads, gravando a saída em ``log_dir``.
+
+    Com ``runner``, o script roda em um worker persistente; sem ele (e sempre
+    para a suíte de testes), em um subprocesso novo. Devolve o tempo, a CPU e
+    o pico de memória medidos.
+    """
+    command, cwd = stage_command(stage, staged_project, staged_fonte)
+    command.extend(arguments)
+    log_path = log_dir / f"{stage.name}.log"
+    print(f"=== {stage.name} ({threads} thread(s)) ===", flush=True)
+    started = time.perf_counter()
+    if runner is not None and stage.script is not None:
+        returncode, usage = runner.run_script(
+            staged_fonte / stage.script, arguments, log_path, threads, staged_fonte
+        )
+    else:
+        environment = {**os.environ, **{name: str(threads) for name in THREAD_ENVIRONMENT}}
+        returncode, usage = _run_subprocess(command, cwd, environment, log_path)
+    elapsed = time.perf_counter() - started
+    if returncode != 0:
+        tail = log_path.read_text(encoding="utf-8", errors="replace").splitlines()[-40:]
+        print(
+            f"[ERRO] {stage.name} falhou após {elapsed:.0f} s; final de {log_path}:\n"
+            + "\n".join(tail),
+            file=sys.stderr,
+            flush=True,
+        )
+        raise subprocess.CalledProcessError(returncode, command)
+    print(f"[OK] {stage.name} em {elapsed:.0f} s", flush=True)
+    return {"tempo_s": round(elapsed, 3), **usage}
+
+
+def _warm_worker(modules: tuple[str, ...]) -> None:
+    """Prepara um worker: Matplotlib sem interface e bibliotecas importadas."""
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    # As etapas importam os módulos de ``src`` da área temporária, não os que
+    # este executor carregou do repositório.
+    _forget_local_modules(SRC_DIR)
+    with contextlib.suppress(ValueError):
+        sys.path.remove(str(SRC_DIR))
+    for name in modules:
+        with contextlib.suppress(ImportError):
+            importlib.import_module(name)
+
+
+def _reset_stage_state(seed: int, threads: int) -> None:
+    """Devolve o worker ao estado de um interpretador recém-iniciado."""
+    random.seed(seed)
+    if "numpy" in sys.modules:
+        sys.modules["numpy"].random.seed(seed)
+    if "torch" in sys.modules:
+        torch = sys.modules["torch"]
+        torch.manual_seed(seed)
+        torch.set_num_threads(threads)
+    if "matplotlib.pyplot" in sys.modules:
+        sys.modules["matplotlib.pyplot"].close("all")
+        sys.modules["matplotlib"].rc_file_defaults()
+
+
+@contextlib.contextmanager
+def _thread_limits(threads: int) -> Iterator[None]:
+    """Limita OpenMP e BLAS já carregados, que não releem as variáveis de ambiente."""
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        yield
+        return
+    with threadpool_limits(limits=threads):
+        yield
+
+
+@contextlib.contextmanager
+def _redirected_output(log_path: Path) -> Iterator[None]:
+    """Envia os descritores 1 e 2 (inclusive a saída de bibliotecas em C) ao log."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = os.dup(1), os.dup(2)
+    try:
+        with log_path.open("w", encoding="utf-8") as log:
+            os.dup2(log.fileno(), 1)
+            os.dup2(log.fileno(), 2)
+            try:
+                yield
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os.dup2(saved[0], 1)
+                os.dup2(saved[1], 2)
+    finally:
+        os.close(saved[0])
+        os.close(saved[1])
+
+
+def _forget_local_modules(root: Path) -> None:
+    """Descarta os módulos do projeto para que a próxima etapa os importe de novo."""
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and Path(path).resolve().is_relative_to(root):
+            del sys.modules[name]
+
+
+def _run_script_in_worker(
+    script: Path,
+    arguments: tuple[str, ...],
+    log_path: Path,
+    threads: int,
+    local_root: Path,
+) -> tuple[int, dict[str, float]]:
+    """Executa ``script`` como ``__main__`` neste worker.
+
+    Devolve o código de saída e a CPU consumida pela etapa.
+    """
+    saved_cwd, saved_argv, saved_path = os.getcwd(), sys.argv, list(sys.path)
+    saved_environment = {name: os.environ.get(name) for name in THREAD_ENVIRONMENT}
+    if resource is not None:
+        before = resource.getrusage(resource.RUSAGE_SELF), resource.getrusage(
+            resource.RUSAGE_CHILDREN
+        )
+    returncode = 0
+    with _redirected_output(log_path):
+        try:
+            os.chdir(script.parent)
+            sys.argv = [str(script), *arguments]
+            sys.path.insert(0, str(script.parent))
+            os.environ.update({name: str(threads) for name in THREAD_ENVIRONMENT})
+            _reset_stage_state(STAGE_SEED, threads)
+            with _thread_limits(threads):
+                runpy.run_path(str(script), run_name="__main__")
+        except SystemExit as exit:
+            if isinstance(exit.code, int):
+                returncode = exit.code
+            elif exit.code is not None:
+                print(exit.code, file=sys.stderr)
+                returncode = 1
+        except BaseException:
+            traceback.print_exc()
+            returncode = 1
+        finally:
+            os.chdir(saved_cwd)
+            sys.argv = saved_argv
+            sys.path[:] = saved_path
+            for name, value in saved_environment.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+            _forget_local_modules(local_root.resolve())
+            _reset_stage_state(STAGE_SEED, threads)
+    if resource is None:
+        return returncode, {}
+    after = resource.getrusage(resource.RUSAGE_SELF), resource.getrusage(
+        resource.RUSAGE_CHILDREN
+    )
+    usage = _usage(after[0])
+    usage["cpu_usuario_s"] = round(
+        sum(end.ru_utime - start.ru_utime for start, end in zip(before, after)), 3
     )
+    usage["cpu_sistema_s"] = round(
+        sum(end.ru_stime - start.ru_stime for start, end in zip(before, after)), 3
+    )
+    # O pico de memória é o do worker desde que foi iniciado.
+    return returncode, usage
+
+
+class WarmRunner:
+    """Pool de processos persistentes que executa scripts com bibliotecas já carregadas.
+
+    Cada worker atende uma etapa por vez; um worker que morre (por exemplo,
+    por falta de memória) conta como falha da etapa em curso.
+    """
+
+    def __init__(self, workers: int, modules: tuple[str, ...] = WARM_MODULES) -> None:
+        self.pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+            initargs=(modules,),
+        )
+
+    def __enter__(self) -> WarmRunner:
+        return self
+
+    def __exit__(self, *exception: object) -> None:
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+    def run_script(
+        self,
+        script: Path,
+        arguments: tuple[str, ...],
+        log_path: Path,
+        threads: int,
+        local_root: Path,
+    ) -> tuple[int, dict[str, float]]:
+        try:
+            return self.pool.submit(
+                _run_script_in_worker, script, arguments, log_path, threads, local_root
+            ).result()
+        except BrokenProcessPool as error:
+            with log_path.open("a", encoding="utf-8") as log:
+                print(f"[ERRO] O worker terminou inesperadamente: {error}", file=log)
+            return -1, {}
+
+
+def path_digest(path: Path) -> str:
+    """SHA-256 de um arquivo ou do conteúdo e dos nomes de um diretório."""
+    if path.is_file():
+        return sha256(path)
+    if not path.is_dir():
+        return "ausente"
+    listing = {
+        str(item.relative_to(path)): sha256(item)
+        for item in sorted(path.rglob("*"))
+        if item.is_file()
+    }
+    encoded = json.dumps(listing, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def imported_modules(script: Path, roots: Iterable[Path]) -> list[Path]:
+    """Módulos locais importados por ``script``, direta ou indiretamente.
+
+    Um nome importado é local se existir como ``<nome>.py`` no diretório do
+    script ou em ``roots``, nessa ordem; bibliotecas instaladas são ignoradas.
+    """
+    roots = list(roots)
+    found: dict[Path, None] = {}
+    pending = [script]
+    while pending:
+        current = pending.pop()
+        tree = ast.parse(current.read_text(encoding="utf-8"), filename=str(current))
+        names = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names.update(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names.add(node.module.split(".")[0])
+        for name in sorted(names):
+            for root in (current.parent, *roots):
+                candidate = root / f"{name}.py"
+                if candidate.is_file():
+                    if candidate != script and candidate not in found:
+                        found[candidate] = None
+                        pending.append(candidate)
+                    break
+    return sorted(found)
+
+
+@functools.cache
+def library_versions() -> dict[str, str]:
+    """Versões instaladas de ``CACHE_LIBRARIES`` neste interpretador."""
+    versions = {}
+    for name in CACHE_LIBRARIES:
+        try:
+            versions[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            versions[name] = "ausente"
+    return versions
+
+
+def stage_key(
+    stage: Stage,
+    staged_fonte: Path,
+    parameters: tuple[str, ...] = (),
+    threads: int = 1,
+) -> str | None:
+    """Chave de cache da etapa; ``None`` para a suíte de testes, sempre executada.
+
+    Nas etapas pesadas, o número de threads entra nos parâmetros: PyTorch e
+    XGBoost podem arredondar de outro modo com outra divisão do trabalho.
+    """
+    if stage.script is None:
+        return None
+    script = staged_fonte / stage.script
+    source = staged_fonte / "src"
+    modules = imported_modules(script, (source, source / "models"))
+    payload = {
+        "versao": STAGE_CACHE_VERSION,
+        "python": sys.version,
+        "bibliotecas": library_versions(),
+        "etapa": stage.name,
+        "script": sha256(script),
+        "modulos": {
+            str(module.relative_to(staged_fonte)): sha256(module)
+            for module in modules
+        },
+        "entradas": {path: path_digest(staged_fonte / path) for path in stage.inputs},
+        "parametros": [*parameters, *([f"threads={threads}"] if stage.heavy else [])],
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class StageCache:
+    """Armazém local das saídas das etapas, endereçado pelo conteúdo.
+
+    ``objetos/`` guarda cada arquivo uma única vez, pelo SHA-256; cada entrada
+    ``etapas/<etapa>/<chave>.json`` lista as saídas e os hashes gravados pela
+    etapa e só é escrita depois de todos os seus objetos. A data de
+    modificação da entrada marca o último uso, que ``prune`` consulta para
+    descartar primeiro as entradas mais antigas.
+    """
+
+    def __init__(self, root: Path = PIPELINE_CACHE_DIR) -> None:
+        self.root = root
+
+    def _object(self, digest: str) -> Path:
+        return self.root / "objetos" / digest[:2] / digest
+
+    def _entry(self, stage: Stage, key: str) -> Path:
+        return self.root / "etapas" / stage.name / f"{key}.json"
+
+    def restore(self, stage: Stage, key: str, staged_fonte: Path) -> bool:
+        """Copia as saídas memorizadas para ``staged_fonte``; falso se ausentes."""
+        entry = self._entry(stage, key)
+        if not entry.is_file():
+            return False
+        outputs = json.loads(entry.read_text(encoding="utf-8"))["saidas"]
+        if not all(self._object(digest).is_file() for digest in outputs.values()):
+            return False
+        for relative, digest in outputs.items():
+            destination = staged_fonte / relative
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            destination.unlink(missing_ok=True)
+            shutil.copy2(self._object(digest), destination)
+        os.utime(entry)
+        return True
+
+    def store(self, stage: Stage, key: str, staged_fonte: Path) -> None:
+        """Memoriza as saídas existentes da etapa sob ``key``."""
+        outputs = {}
+        for relative in stage.outputs:
+            path = staged_fonte / relative
+            if not path.is_file():
+                continue
+            digest = sha256(path)
+            target = self._object(digest)
+            if not target.is_file():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                descriptor, staging = tempfile.mkstemp(dir=target.parent)
+                os.close(descriptor)
+                shutil.copy2(path, staging)
+                Path(staging).replace(target)
+            outputs[relative] = digest
+        entry = self._entry(stage, key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        temporary = entry.with_name(f".{entry.name}.tmp")
+        temporary.write_text(
+            json.dumps({"etapa": stage.name, "saidas": outputs}, indent=2),
+            encoding="utf-8",
+        )
+        temporary.replace(entry)
+
+    def prune(self, max_bytes: int) -> tuple[int, int]:
+        """Descarta as entradas menos usadas até os objetos caberem em ``max_bytes``.
+
+        Objetos que nenhuma entrada restante cita também são apagados. Devolve
+        quantas entradas e quantos bytes foram removidos.
+        """
+        entries = sorted(
+            self.root.glob("etapas/*/*.json"), key=lambda path: path.stat().st_mtime
+        )
+        outputs = {
+            entry: set(json.loads(entry.read_text(encoding="utf-8"))["saidas"].values())
+            for entry in entries
+        }
+        references = Counter(digest for digests in outputs.values() for digest in digests)
+        sizes = {
+            path.name: path.stat().st_size for path in self.root.glob("objetos/*/*")
+        }
+        total = sum(sizes.get(digest, 0) for digest in references)
+        removed = 0
+        for entry in entries:
+            if total <= max_bytes:
+                break
+            entry.unlink()
+            removed += 1
+            for digest in outputs[entry]:
+                references[digest] -= 1
+                if references[digest] == 0:
+                    total -= sizes.get(digest, 0)
+        freed = 0
+        for digest, size in sizes.items():
+            if references[digest] <= 0:
+                self._object(digest).unlink()
+                freed += size
+        return removed, freed
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+class StageJournal:
+    """Diário das etapas concluídas em uma área temporária.
+
+    Cada linha de ``path`` registra a chave da etapa e o SHA-256 das saídas
+    que ela deixou, gravada e sincronizada com o disco assim que a etapa
+    termina. Uma linha truncada por uma interrupção no meio da escrita é
+    ignorada, assim como as seguintes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: dict[str, dict[str, object]] = {}
+        self._lock = threading.Lock()
+        if path.is_file():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                self.entries[entry["etapa"]] = entry
+
+    def completed(self, stage: Stage, key: str | None, staged_fonte: Path) -> bool:
+        """Verdadeiro se a etapa já concluiu com ``key`` e as saídas estão intactas."""
+        entry = self.entries.get(stage.name)
+        if key is None or entry is None or entry["chave"] != key:
+            return False
+        return all(
+            (staged_fonte / relative).is_file()
+            and sha256(staged_fonte / relative) == digest
+            for relative, digest in entry["saidas"].items()
+        )
+
+    def record(self, stage: Stage, key: str | None, staged_fonte: Path) -> None:
+        """Registra a conclusão da etapa; etapas sem chave sempre rodam de novo."""
+        if key is None:
+            return
+        entry = {
+            "etapa": stage.name,
+            "chave": key,
+            "saidas": {
+                relative: sha256(staged_fonte / relative)
+                for relative in stage.outputs
+                if (staged_fonte / relative).is_file()
+            },
+        }
+        with self._lock, self.path.open("a", encoding="utf-8") as journal:
+            journal.write(json.dumps(entry) + "\n")
+            journal.flush()
+            os.fsync(journal.fileno())
+            self.entries[stage.name] = entry
 
 
 def validate_inputs(interruptions: Path, inmet_dir: Path) -> None:
@@ -149,15 +1111,83 @@ def ensure_clean_worktree() -> None:
         )
 
 
-def prepare_workspace(stage_root: Path) -> tuple[Path, Path]:
+class TreeStager:
+    """Replica diretórios na área temporária sem copiar o que não será gravado.
+
+    Cada arquivo vira um reflink, se o sistema de arquivos permitir; senão,
+    um hardlink, exceto os caminhos em ``writable`` (relativos ao projeto),
+    que são copiados para que nenhuma escrita alcance o original. Após a
+    primeira recusa de reflink, o sistema de arquivos não é mais consultado.
+    ``counts`` conta os arquivos por método, e ``hardlinks`` guarda inode,
+    tamanho e mtime de cada hardlink para ``altered_hardlinks``.
+    """
+
+    def __init__(self, writable: Iterable[str] = ()) -> None:
+        self.writable = set(writable)
+        self.reflinks = fcntl is not None and sys.platform.startswith("linux")
+        self.counts: Counter[str] = Counter()
+        self.hardlinks: dict[str, list[int]] = {}
+
+    def _reflink(self, source: Path, destination: Path) -> bool:
+        if not self.reflinks:
+            return False
+        try:
+            with source.open("rb") as origin, destination.open("wb") as target:
+                fcntl.ioctl(target.fileno(), FICLONE, origin.fileno())
+        except OSError:
+            destination.unlink(missing_ok=True)
+            self.reflinks = False
+            return False
+        shutil.copystat(source, destination)
+        return True
+
+    def stage_file(self, source: Path, destination: Path, relative: str) -> None:
+        if self._reflink(source, destination):
+            self.counts["reflink"] += 1
+            return
+        if relative not in self.writable:
+            try:
+                os.link(source, destination)
+            except OSError:
+                pass
+            else:
+                self.counts["hardlink"] += 1
+                stat = destination.stat()
+                self.hardlinks[relative] = [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+                return
+        shutil.copy2(source, destination)
+        self.counts["cópia"] += 1
+
+    def stage_tree(self, source: Path, destination: Path, relative: str) -> None:
+        def stage(origin: str, target: str) -> None:
+            name = Path(origin).relative_to(source).as_posix()
+            self.stage_file(Path(origin), Path(target), f"{relative}/{name}")
+
+        shutil.copytree(source, destination, copy_function=stage)
+
+
+def prepare_workspace(stage_root: Path, staging: str = "copy") -> tuple[Path, Path]:
+    """Monta a área temporária por cópia ou, com ``link``, pelo ``TreeStager``."""
     staged_project = stage_root / "project"
     staged_fonte = staged_project / "Fonte"
     staged_fonte.mkdir(parents=True)
     shutil.copy2(FONTE_DIR / "run_pipeline.py", staged_fonte / "run_pipeline.py")
-    shutil.copytree(SRC_DIR, staged_fonte / "src")
-    shutil.copytree(TESTS_DIR, staged_fonte / "tests")
-    shutil.copytree(INTERFACE_DIR, staged_fonte / "interface")
-    shutil.copytree(DATA_DIR, staged_fonte / "data")
+    stager = None
+    if staging == "link":
+        stager = TreeStager(
+            f"Fonte/{path}" for stage in PIPELINE_STAGES for path in stage.outputs
+        )
+    for source, destination, relative in (
+        (SRC_DIR, staged_fonte / "src", "Fonte/src"),
+        (TESTS_DIR, staged_fonte / "tests", "Fonte/tests"),
+        (INTERFACE_DIR, staged_fonte / "interface", "Fonte/interface"),
+        (DATA_DIR, staged_fonte / "data", "Fonte/data"),
+        (MONOGRAPH_IMAGES, staged_project / "Monografia" / "img", "Monografia/img"),
+    ):
+        if stager is None:
+            shutil.copytree(source, destination)
+        else:
+            stager.stage_tree(source, destination, relative)
     for filename in GENERATED_DATA_FILES:
         path = staged_fonte / "data" / filename
         if path.exists():
@@ -165,7 +1195,68 @@ def prepare_workspace(stage_root: Path) -> tuple[Path, Path]:
 
     (staged_fonte / "results" / "eda").mkdir(parents=True)
     (staged_fonte / "results" / "ml").mkdir(parents=True)
-    shutil.copytree(MONOGRAPH_IMAGES, staged_project / "Monografia" / "img")
+    if stager is not None:
+        summary = ", ".join(
+            f"{count} {method}" for method, count in sorted(stager.counts.items())
+        )
+        print(f"Área temporária montada: {summary or 'nenhum arquivo'}.")
+        (stage_root / HARDLINKS_FILENAME).write_text(
+            json.dumps(stager.hardlinks, indent=2), encoding="utf-8"
+        )
+    return staged_project, staged_fonte
+
+
+def altered_hardlinks(staged_project: Path) -> list[str]:
+    """Hardlinks da área temporária cujo conteúdo foi alterado no lugar.
+
+    Um hardlink compartilha o inode com o arquivo do repositório: uma escrita
+    no lugar também altera o original. Substituir o arquivo (gravar outro e
+    renomear) troca o inode e não é contado.
+    """
+    inventory = staged_project.parent / HARDLINKS_FILENAME
+    if not inventory.is_file():
+        return []
+    altered = []
+    links = json.loads(inventory.read_text(encoding="utf-8"))
+    for relative, (inode, size, mtime_ns) in links.items():
+        try:
+            stat = (staged_project / relative).stat()
+        except FileNotFoundError:
+            continue
+        if stat.st_ino == inode and (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+            altered.append(relative)
+    return altered
+
+
+def resume_workspace(stage_root: Path) -> tuple[Path, Path]:
+    """Reabre a área temporária de uma execução que falhou.
+
+    Os dados e resultados já produzidos são mantidos; ``src``, ``tests``,
+    ``interface`` e o próprio executor são copiados de novo do repositório,
+    para que uma correção feita após a falha seja usada na retomada.
+    """
+    staged_project = stage_root / "project"
+    staged_fonte = staged_project / "Fonte"
+    if not (stage_root / JOURNAL_FILENAME).is_file() or not staged_fonte.is_dir():
+        raise FileNotFoundError(f"Área temporária sem diário de etapas: {stage_root}")
+    rollback = stage_root / "rollback"
+    if rollback.exists():
+        if any(rollback.iterdir()):
+            raise RuntimeError(
+                f"A promoção anterior deixou cópias de segurança em {rollback}; "
+                "restaure-as antes de retomar."
+            )
+        rollback.rmdir()
+    shutil.copy2(FONTE_DIR / "run_pipeline.py", staged_fonte / "run_pipeline.py")
+    for source, destination in (
+        (SRC_DIR, staged_fonte / "src"),
+        (TESTS_DIR, staged_fonte / "tests"),
+        (INTERFACE_DIR, staged_fonte / "interface"),
+    ):
+        shutil.rmtree(destination)
+        shutil.copytree(source, destination)
+    journal = StageJournal(stage_root / JOURNAL_FILENAME)
+    print(f"Retomando {stage_root}: {len(journal.entries)} etapa(s) no diário.")
     return staged_project, staged_fonte
 
 
@@ -188,6 +1279,8 @@ def synchronize_figures(staged_project: Path, staged_fonte: Path) -> int:
     copied = 0
     for group in ("eda", "ml"):
         for image in sorted((staged_fonte / "results" / group).glob("*.png")):
+            # A figura anterior pode ser um hardlink para Monografia/img.
+            (destination / image.name).unlink(missing_ok=True)
             shutil.copy2(image, destination / image.name)
             copied += 1
     return copied
@@ -241,55 +1334,292 @@ def promote_directories(
         _remove_path(backup_root)
 
 
-def execute_pipeline(staged_project: Path, staged_fonte: Path, args: argparse.Namespace) -> None:
-    staged_src = staged_fonte / "src"
-    models = staged_src / "models"
-    build_args = [
-        "--interruptions",
-        str(args.interruptions.resolve()),
-        "--inmet-dir",
-        str(args.inmet_dir.resolve()),
-        "--output-dir",
-        str(staged_fonte / "data"),
+def stage_output_sizes(stage: Stage, staged_fonte: Path) -> dict[str, int]:
+    return {
+        path: (staged_fonte / path).stat().st_size
+        for path in stage.outputs
+        if (staged_fonte / path).is_file()
+    }
+
+
+def compare_telemetry(
+    current: dict[str, object],
+    previous: dict[str, object],
+    tolerance: float = TELEMETRY_TOLERANCE,
+    minimum_seconds: float = TELEMETRY_MIN_SECONDS,
+) -> dict[str, list[str]]:
+    """Etapas executadas em ambas as medições que ficaram mais lentas ou pesadas.
+
+    Só se comparam execuções com o mesmo ``runner`` e o mesmo número de
+    workers. Etapas restauradas do cache, aproveitadas de uma execução
+    retomada ou executadas com outro número de threads não são comparadas. Com
+    ``runner`` ``warm`` o pico de memória é o do worker desde que foi iniciado,
+    e não o da etapa, por isso só o tempo é comparado.
+    """
+    mismatched = [
+        key for key in ("runner", "workers") if current.get(key) != previous.get(key)
+    ]
+    if mismatched:
+        print(
+            "[AVISO] Telemetria anterior com outro "
+            + " e outro ".join(mismatched)
+            + "; comparação omitida."
+        )
+        return {}
+    compare_memory = current.get("runner") != "warm"
+    regressions: dict[str, list[str]] = {}
+    for name, stage in current["etapas"].items():
+        before = previous.get("etapas", {}).get(name)
+        if (
+            before is None
+            or stage.get("threads") != before.get("threads")
+            or any(
+                run.get(flag) for run in (stage, before) for flag in ("cache", "retomada")
+            )
+        ):
+            continue
+        reasons = []
+        if stage["tempo_s"] >= minimum_seconds and stage["tempo_s"] > before["tempo_s"] * (
+            1 + tolerance
+        ):
+            reasons.append(f"tempo {stage['tempo_s'] / before['tempo_s'] - 1:+.0%}")
+        rss, rss_before = stage.get("rss_pico_mb"), before.get("rss_pico_mb")
+        if compare_memory and rss and rss_before and rss > rss_before * (1 + tolerance):
+            reasons.append(f"memória {rss / rss_before - 1:+.0%}")
+        if reasons:
+            regressions[name] = reasons
+    return regressions
+
+
+def format_telemetry(
+    telemetry: dict[str, object],
+    regressions: dict[str, list[str]] | None = None,
+) -> str:
+    """Tabela das etapas, da mais demorada para a mais rápida."""
+    regressions = regressions or {}
+    rows = sorted(
+        telemetry["etapas"].items(), key=lambda item: item[1]["tempo_s"], reverse=True
+    )
+    width = max(len(name) for name, _ in rows)
+    lines = [
+        f"{'etapa':<{width}}  {'tempo (s)':>9}  {'usr (s)':>8}  {'sys (s)':>8}"
+        f"  {'RSS (MiB)':>9}  {'saídas (MiB)':>12}"
     ]
+    for name, stage in rows:
+        def column(key: str, size: int) -> str:
+            value = stage.get(key)
+            return f"{value:>{size}.1f}" if value is not None else f"{'—':>{size}}"
+
+        outputs = sum(stage.get("saidas", {}).values()) / 2**20
+        note = " (cache)" if stage.get("cache") else ""
+        note = " (retomada)" if stage.get("retomada") else note
+        if name in regressions:
+            note += " [REGRESSÃO: " + ", ".join(regressions[name]) + "]"
+        lines.append(
+            f"{name:<{width}}  {column('tempo_s', 9)}  {column('cpu_usuario_s', 8)}"
+            f"  {column('cpu_sistema_s', 8)}  {column('rss_pico_mb', 9)}"
+            f"  {outputs:>12.1f}{note}"
+        )
+    lines.append(f"Tempo total: {telemetry['tempo_total_s']:.0f} s")
+    return "\n".join(lines)
+
+
+def execute_pipeline(
+    staged_project: Path,
+    staged_fonte: Path,
+    args: argparse.Namespace,
+) -> dict[str, object]:
+    """Executa as etapas e devolve a telemetria de cada uma."""
+    log_dir = staged_project.parent / "logs"
+    log_dir.mkdir(exist_ok=True)
+    arguments = {
+        "build_base_from_standardized": (
+            "--interruptions",
+            str(args.interruptions.resolve()),
+            "--inmet-dir",
+            str(args.inmet_dir.resolve()),
+            "--output-dir",
+            str(staged_fonte / "data"),
+        ),
+    }
+    # A chave usa o conteúdo das fontes externas, não os caminhos temporários.
+    parameters = {
+        "build_base_from_standardized": (
+            path_digest(args.interruptions),
+            path_digest(args.inmet_dir),
+        ),
+    }
+    if args.clear_cache:
+        StageCache().clear()
+    cache = None if args.no_cache else StageCache()
+    journal = StageJournal(staged_project.parent / JOURNAL_FILENAME)
+    workers = args.workers
+
+    stages: dict[str, dict[str, object]] = {}
+    started = time.perf_counter()
+
+    def run_one(stage: Stage, threads: int, runner: WarmRunner | None) -> None:
+        key = stage_key(stage, staged_fonte, parameters.get(stage.name, ()), threads)
+        cached = cache is not None and key is not None
+        restore_started = time.perf_counter()
+        if journal.completed(stage, key, staged_fonte):
+            print(f"=== {stage.name} (concluída na execução anterior) ===", flush=True)
+            measured = {"tempo_s": round(time.perf_counter() - restore_started, 3)}
+            measured["retomada"] = True
+        elif cached and cache.restore(stage, key, staged_fonte):
+            print(f"=== {stage.name} (restaurada do cache) ===", flush=True)
+            measured = {"tempo_s": round(time.perf_counter() - restore_started, 3)}
+            measured["cache"] = True
+        else:
+            measured = run_stage(
+                stage,
+                staged_project,
+                staged_fonte,
+                log_dir,
+                threads,
+                arguments.get(stage.name, ()),
+                runner,
+            )
+            altered = altered_hardlinks(staged_project)
+            if altered:
+                raise RuntimeError(
+                    f"Após a etapa {stage.name}, arquivos não declarados como saída "
+                    f"foram alterados no lugar: {', '.join(altered)}. Eles são "
+                    "hardlinks do repositório, e o original também foi alterado; "
+                    "restaure-o (por exemplo, com git checkout) e declare o arquivo "
+                    "em outputs da etapa."
+                )
+            if cached:
+                cache.store(stage, key, staged_fonte)
+        if not measured.get("retomada"):
+            journal.record(stage, key, staged_fonte)
+        stages[stage.name] = {
+            **measured,
+            "threads": threads,
+            "saidas": stage_output_sizes(stage, staged_fonte),
+        }
+
+    if args.runner == "warm":
+        with WarmRunner(workers) as runner:
+            schedule_stages(
+                PIPELINE_STAGES,
+                lambda stage, threads: run_one(stage, threads, runner),
+                workers,
+            )
+    else:
+        schedule_stages(
+            PIPELINE_STAGES, lambda stage, threads: run_one(stage, threads, None), workers
+        )
+    if cache is not None:
+        removed, freed = cache.prune(int(args.cache_max_gb * 2**30))
+        if removed or freed:
+            print(
+                f"Cache podado: {removed} entrada(s) e {freed / 2**20:.0f} MiB removidos.",
+                flush=True,
+            )
+    return {
+        "versao": TELEMETRY_VERSION,
+        "workers": workers,
+        "runner": args.runner,
+        "tempo_total_s": round(time.perf_counter() - started, 3),
+        "etapas": {stage.name: stages[stage.name] for stage in PIPELINE_STAGES},
+    }
+
+
+def report_telemetry(
+    telemetry: dict[str, object],
+    path: Path,
+    previous_path: Path | None = None,
+) -> dict[str, list[str]]:
+    """Grava a telemetria em ``path``, imprime o resumo e devolve as regressões."""
+    regressions = {}
+    if previous_path is not None:
+        if previous_path.is_file():
+            previous = json.loads(previous_path.read_text(encoding="utf-8"))
+            regressions = compare_telemetry(telemetry, previous)
+        else:
+            print(f"[AVISO] Telemetria anterior não encontrada: {previous_path}")
+    temporary = path.with_name(f".{path.name}.tmp")
+    temporary.write_text(json.dumps(telemetry, indent=2), encoding="utf-8")
+    temporary.replace(path)
+    print("\n" + format_telemetry(telemetry, regressions), flush=True)
+    return regressions
+
 
-    run(staged_src / "build_base_from_standardized.py", staged_project, *build_args)
-    run(staged_src / "03_feature_engineering.py", staged_project)
-    run(staged_src / "01_eda_sazonalidade.py", staged_project)
-    run(staged_src / "02_correlacoes_nao_lineares.py", staged_project)
-    run(staged_src / "04_eda_basica.py", staged_project)
-    run(models / "script_exploration_pipeline.py", staged_project)
-    run(staged_src / "05_correlacoes_unificadas.py", staged_project)
-    run_tests(staged_fonte, staged_project)
-    run(models / "baseline_persistence.py", staged_project)
-    run(models / "baseline_xgboost.py", staged_project)
-    run(models / "lstm_bidirecional.py", staged_project)
-    run(models / "gru_avancada.py", staged_project)
-    run(models / "advanced_plots.py", staged_project)
-    run(models / "evaluate_severity.py", staged_project)
-    run(models / "robustness_analysis.py", staged_project)
-    run(models / "previsao_multihorizonte.py", staged_project)
-    run(models / "plot_multihorizonte.py", staged_project)
-    run(models / "plot_multihorizonte_temporal.py", staged_project)
-
-
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--interruptions", type=Path, required=True)
     parser.add_argument("--inmet-dir", type=Path, required=True)
-    return parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="etapas executadas simultaneamente (padrão: 1, execução sequencial)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="executa todas as etapas sem consultar nem gravar o cache",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="esvazia o cache de etapas antes de executar",
+    )
+    parser.add_argument(
+        "--cache-max-gb",
+        type=float,
+        default=PIPELINE_CACHE_MAX_GB,
+        help="tamanho máximo do cache; as entradas menos usadas são descartadas "
+        f"(padrão: {PIPELINE_CACHE_MAX_GB:g})",
+    )
+    parser.add_argument(
+        "--runner",
+        choices=("subprocess", "warm"),
+        default="subprocess",
+        help="um processo novo por etapa ou workers persistentes pré-aquecidos",
+    )
+    parser.add_argument(
+        "--staging",
+        choices=("copy", "link"),
+        default="copy",
+        help="cópia integral ou reflinks/hardlinks na área temporária",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        nargs="?",
+        const=DATA_DIR / TELEMETRY_FILENAME,
+        help="telemetria anterior a comparar (padrão: a da última promoção)",
+    )
+    parser.add_argument(
+        "--resume",
+        type=Path,
+        metavar="AREA_TEMPORARIA",
+        help="retoma a área preservada por uma execução que falhou",
+    )
+    return parser.parse_args(argv)
 
 
-def main() -> None:
-    args = parse_args()
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
     validate_inputs(args.interruptions, args.inmet_dir)
     ensure_clean_worktree()
-    stage_root = Path(tempfile.mkdtemp(prefix=".pipeline-", dir=PROJECT_ROOT))
-    print(f"Área temporária: {stage_root}")
+    if args.resume is None:
+        stage_root = Path(tempfile.mkdtemp(prefix=".pipeline-", dir=PROJECT_ROOT))
+        print(f"Área temporária: {stage_root}")
+    else:
+        stage_root = args.resume.resolve()
     try:
-        staged_project, staged_fonte = prepare_workspace(stage_root)
-        execute_pipeline(staged_project, staged_fonte, args)
+        if args.resume is None:
+            staged_project, staged_fonte = prepare_workspace(stage_root, args.staging)
+        else:
+            staged_project, staged_fonte = resume_workspace(stage_root)
+        telemetry = execute_pipeline(staged_project, staged_fonte, args)
         validate_outputs(staged_fonte)
+        report_telemetry(
+            telemetry, staged_fonte / "data" / TELEMETRY_FILENAME, args.compare
+        )
         copied = synchronize_figures(staged_project, staged_fonte)
         promote_directories(
             [
@@ -303,7 +1633,8 @@ def main() -> None:
     except BaseException:
         print(
             "\n[ERRO] Nenhum resultado incompleto deve ser promovido. "
-            f"A área temporária foi preservada para diagnóstico: {stage_root}",
+            f"A área temporária foi preservada para diagnóstico: {stage_root}\n"
+            f"Para continuar a partir da etapa que falhou, use --resume {stage_root}",
             file=sys.stderr,
         )
         raise
@@ -23,6 +23,12 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import os
 
+from correlation_engine import correlation_matrix, correlation_pairs, lagged_correlations
+
+METEO_COLUMNS = ['temperatura_media', 'precipitacao_total_mm',
+                 'vento_velocidade_media_ms', 'vento_velocidade_max_ms',
+                 'vento_rajada_max_ms', 'vento_dir_sin', 'vento_dir_cos']
+
 plt.style.use('seaborn-v0_8-whitegrid')
 plt.rcParams.update({'figure.dpi': 300, 'font.size': 12})
 
@@ -34,9 +40,9 @@ def load_data(filepath):
     return df
 
 
-def plot_correlation_matrix(df, method, title, save_path):
-    print(f"Calculando matriz de correlação de {method.capitalize()}...")
-    corr = df.corr(method=method)
+def plot_correlation_matrix(correlations, method, title, save_path):
+    """Mapa de calor a partir da tabela longa de correlation_engine."""
+    corr = correlation_matrix(correlations, method)
 
     mask = np.triu(np.ones_like(corr, dtype=bool))
 
@@ -50,22 +56,10 @@ def plot_correlation_matrix(df, method, title, save_path):
     print(f"  -> {save_path}")
 
 
-def plot_cross_correlation(df, col_x, col_y, max_lag, title, save_path):
-    print(f"Calculando cross-correlation entre {col_x} e {col_y}...")
-    df_clean = df[[col_x, col_y]].dropna()
-    x = df_clean[col_x].values
-    y = df_clean[col_y].values
-
-    # Normalização para [-1, 1]
-    x = (x - np.mean(x)) / (np.std(x) * len(x))
-    y = (y - np.mean(y)) / np.std(y)
-
-    corr = np.correlate(y, x, mode='full')
-    lags = np.arange(-len(x) + 1, len(x))
-
-    lag_mask = (lags >= -max_lag) & (lags <= max_lag)
-    filtered_lags = lags[lag_mask]
-    filtered_corr = corr[lag_mask]
+def plot_cross_correlation(lagged, col_x, title, save_path):
+    """Gráfico de hastes de uma coluna da matriz defasagem x variável."""
+    filtered_lags = lagged.index.to_numpy()
+    filtered_corr = lagged[col_x].to_numpy()
 
     plt.figure(figsize=(12, 5))
     try:
@@ -99,26 +93,34 @@ if __name__ == "__main__":
     df_subset.columns = ['Interrupções', 'Temp. Média', 'Precipitação (mm)',
                          'Vento Médio', 'Vento Máximo', 'Rajada Máxima']
 
+    # Ranks calculados uma vez por coluna; Kendall pelo algoritmo de Knight.
+    print("Calculando correlações de Spearman e Kendall...")
+    correlations = correlation_pairs(df_subset, methods=('spearman', 'kendall'))
+
     plot_correlation_matrix(
-        df_subset, method='spearman',
+        correlations, method='spearman',
         title='Correlação de Spearman (Não-Linear) - Interrupções vs Clima',
         save_path='../results/eda/correlacao_spearman.png'
     )
 
     plot_correlation_matrix(
-        df_subset, method='kendall',
+        correlations, method='kendall',
         title='Correlação de Kendall (Ordinal) - Interrupções vs Clima',
         save_path='../results/eda/correlacao_kendall.png'
     )
 
+    # Todas as variaveis meteorologicas contra interrupcoes, so na janela de +-14 dias.
+    print("Calculando correlacoes cruzadas (+-14 dias)...")
+    lagged = lagged_correlations(df, 'interrupcoes', METEO_COLUMNS, max_lag=14)
+
     plot_cross_correlation(
-        df, col_x='precipitacao_total_mm', col_y='interrupcoes', max_lag=14,
+        lagged, col_x='precipitacao_total_mm',
         title='Correlação Cruzada: Chuva (t-lag) influenciando Interrupções (t)',
         save_path='../results/eda/cross_corr_chuva_interrupcoes.png'
     )
 
     plot_cross_correlation(
-        df, col_x='vento_rajada_max_ms', col_y='interrupcoes', max_lag=14,
+        lagged, col_x='vento_rajada_max_ms',
         title='Correlação Cruzada: Rajadas de Vento (t-lag) influenciando Interrupções (t)',
         save_path='../results/eda/cross_corr_vento_interrupcoes.png'
     )
@@ -24,22 +24,37 @@ Fonte de dados:
 
 Saida:
   ../data/dataset_engenharia_features.csv
+  ../data/dataset_engenharia_features.npy/.json/.arrow (armazenamento binario
+    versionado lido pelos modelos, ver feature_store.py)
+  ../data/estado_engenharia_features.json (estado para o modo incremental)
 
 Execucao:
   cd Fonte/src && python 03_feature_engineering.py
+  cd Fonte/src && python 03_feature_engineering.py --incremental [--verificar]
+  cd Fonte/src && python 03_feature_engineering.py --incremental --imputacao locf
+
+No modo incremental, apenas os dias da base posteriores ao ultimo dia do
+dataset sao processados: as EMAs continuam a partir do ultimo valor salvo e
+lags e desvio movel usam as ultimas linhas guardadas no estado.
+
+Com --imputacao locf|kalman, as lacunas meteorologicas sao preenchidas de forma
+causal (ultimo valor observado ou filtro de Kalman de nivel local), dia a dia,
+sem consultar dias futuros; o estado do imputador e salvo junto com o estado
+incremental, permitindo processar o dia mais recente sem revisitar o historico.
 """
+import argparse
+import json
+import os
+
 import pandas as pd
 import numpy as np
-import os
 
-LAG_DAYS = [1, 2, 3, 7]
-EMA_SPANS = [3, 7, 14]
-ROLLING_STD_WINDOW = 7
+from feature_spec import FEATURE_SPEC, build_feature_matrix
+from feature_store import FEATURE_STORE_PATH, write_feature_store
 
-LAG_COLUMNS = ['interrupcoes', 'precipitacao_total_mm',
-               'temperatura_media', 'vento_rajada_max_ms']
-EMA_COLUMNS = ['precipitacao_total_mm', 'temperatura_media', 'vento_rajada_max_ms']
-STD_COLUMNS = ['precipitacao_total_mm', 'temperatura_media', 'vento_rajada_max_ms']
+# Linhas anteriores necessarias para lags e desvio movel de um novo dia.
+CONTEXT_ROWS = FEATURE_SPEC.context_rows
+STATE_VERSION = 2
 
 # Variaveis meteorologicas que podem ser interpoladas linearmente.
 # interrupcoes NAO e interpolada: NaN de contagem nao tem valor fisico interpolavel.
@@ -48,6 +63,11 @@ METEO_COLUMNS = ['temperatura_media', 'precipitacao_total_mm',
                  'vento_rajada_max_ms', 'vento_dir_sin',
                  'vento_dir_cos']
 
+# Modos de imputacao causal aceitos por CausalImputer; 'linear' usa
+# fix_continuity (reconstrucao historica, nao causal).
+CAUSAL_METHODS = ('locf', 'kalman')
+IMPUTATION_MODES = ('linear',) + CAUSAL_METHODS
+
 
 def normalize_wind_direction_components(df):
     """Restaura vetores unitários após interpolar seno e cosseno."""
@@ -112,67 +132,324 @@ def fix_continuity(df):
     return df
 
 
-def add_calendar_features(df):
-    df['mes'] = df.index.month
-    df['dia_semana'] = df.index.dayofweek
-    df['dia_ano'] = df.index.dayofyear
-    df['mes_sin'] = np.sin(2 * np.pi * df['mes'] / 12)
-    df['mes_cos'] = np.cos(2 * np.pi * df['mes'] / 12)
-    return df
-
-
-def add_lags(df, columns, lags):
-    for col in columns:
-        for k in lags:
-            df[f'{col}_lag_{k}'] = df[col].shift(k)
-    return df
-
+class CausalImputer:
+    """
+    Imputacao causal das variaveis meteorologicas, um dia por vez.
 
-def add_emas(df, columns, spans):
-    for col in columns:
-        for s in spans:
-            df[f'{col}_ema_{s}'] = df[col].ewm(span=s, adjust=False).mean()
-    return df
+    O estado e O(1) por coluna: o ultimo valor observado ('locf') ou o nivel
+    filtrado e sua variancia relativa em um filtro de Kalman de nivel local
+    ('kalman'). Dias sem observacao recebem o ultimo valor ou o nivel previsto;
+    nenhum dia posterior e consultado. Antes da primeira observacao de uma
+    coluna, o dia permanece NaN.
+    """
 
+    def __init__(self, columns, method='locf', signal_to_noise=1.0):
+        if method not in CAUSAL_METHODS:
+            raise ValueError(f"Metodo de imputacao causal desconhecido: {method}")
+        self.columns = list(columns)
+        self.method = method
+        # Razao entre a variancia do passeio aleatorio e a do ruido de medicao;
+        # o ganho do filtro depende apenas dela.
+        self.signal_to_noise = signal_to_noise
+        self.level = np.full(len(self.columns), np.nan)
+        self.variance = np.full(len(self.columns), np.nan)
+        self.last_day = None
+        self.wind = [self.columns.index(c) for c in ('vento_dir_sin', 'vento_dir_cos')
+                     if c in self.columns]
+
+    def step(self, day, values):
+        """Imputa um dia; `values` segue a ordem de `columns` (NaN = ausente)."""
+        values = np.asarray(values, dtype=np.float64)
+        observed = ~np.isnan(values)
+        if self.method == 'kalman':
+            started = ~np.isnan(self.level)
+            self.variance[started] += self.signal_to_noise
+            update = observed & started
+            gain = self.variance[update] / (self.variance[update] + 1.0)
+            self.level[update] += gain * (values[update] - self.level[update])
+            self.variance[update] *= 1.0 - gain
+            first = observed & ~started
+            self.level[first] = values[first]
+            self.variance[first] = 1.0
+        else:
+            self.level[observed] = values[observed]
+        filled = np.where(observed, values, self.level)
+
+        if len(self.wind) == 2 and not observed[self.wind].all():
+            norm = np.hypot(*filled[self.wind])
+            if norm < 1e-12:
+                raise ValueError(
+                    f'Direção do vento indefinida após imputação em {day.date()}'
+                )
+            filled[self.wind] = filled[self.wind] / norm
+        self.last_day = day
+        return filled
+
+    def to_state(self):
+        return {
+            'metodo': self.method,
+            'colunas': self.columns,
+            'razao_sinal_ruido': self.signal_to_noise,
+            'ultimo_dia': None if self.last_day is None else str(self.last_day.date()),
+            'nivel': [None if np.isnan(v) else float(v) for v in self.level],
+            'variancia': [None if np.isnan(v) else float(v) for v in self.variance],
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        imputer = cls(state['colunas'], state['metodo'], state['razao_sinal_ruido'])
+        imputer.level = np.array(state['nivel'], dtype=np.float64)
+        imputer.variance = np.array(state['variancia'], dtype=np.float64)
+        if state['ultimo_dia'] is not None:
+            imputer.last_day = pd.Timestamp(state['ultimo_dia'])
+        return imputer
+
+
+def impute_causal(batches, imputer):
+    """
+    Gerador que imputa blocos diarios em sequencia (um dia ou varios por bloco).
 
-def add_rolling_std(df, columns, window):
-    for col in columns:
-        df[f'{col}_std_{window}d'] = df[col].rolling(window=window).std()
+    Cada bloco e reindexado para dias consecutivos a partir do ultimo dia ja
+    processado pelo `imputer`, de modo que lacunas entre blocos tambem sao
+    preenchidas causalmente. Apenas as colunas do `imputer` sao alteradas.
+    """
+    for batch in batches:
+        start = batch.index.min()
+        if imputer.last_day is not None:
+            if start <= imputer.last_day:
+                raise ValueError(
+                    f"O bloco comeca em {start.date()}, antes do ultimo dia "
+                    f"imputado ({imputer.last_day.date()})."
+                )
+            start = imputer.last_day + pd.Timedelta(days=1)
+        batch = batch.reindex(pd.date_range(start, batch.index.max(), freq='D'))
+        batch.index.name = 'data'
+        values = batch[imputer.columns].to_numpy(dtype=np.float64, copy=True)
+        for row, day in enumerate(batch.index):
+            values[row] = imputer.step(day, values[row])
+        batch[imputer.columns] = values
+        yield batch
+
+
+def causal_continuity(df, imputer):
+    """Equivalente causal de `fix_continuity`, usando apenas dias passados."""
+    if 'n_registros' in df.columns:
+        df = df.drop(columns=['n_registros'])
+    meteo_present = [c for c in METEO_COLUMNS if c in df.columns]
+    n_before = df[meteo_present].isnull().sum().sum()
+    df = pd.concat(impute_causal([df], imputer))
+    n_after = df[meteo_present].isnull().sum().sum()
+    print(f"Imputacao causal ({imputer.method}): {n_before} NaN -> {n_after} NaN")
     return df
 
 
-def build_feature_dataset(filepath_in, filepath_out):
-    df = load_base(filepath_in)
-    print(f"Base de entrada: {df.shape[0]} dias, {df.shape[1]} colunas")
+def new_imputer(imputation):
+    """Imputador causal das colunas meteorologicas; None no modo 'linear'."""
+    if imputation == 'linear':
+        return None
+    return CausalImputer(METEO_COLUMNS, imputation)
 
-    df = fix_continuity(df)
-    print(f"Apos reindexacao/interpolacao: {df.shape[0]} dias, {df.shape[1]} colunas")
 
-    df = add_calendar_features(df)
-    df = add_lags(df, LAG_COLUMNS, LAG_DAYS)
-    df = add_emas(df, EMA_COLUMNS, EMA_SPANS)
-    df = add_rolling_std(df, STD_COLUMNS, ROLLING_STD_WINDOW)
+def tail_is_imputed(df):
+    """Indica se o ultimo dia da base depende de interpolacao meteorologica."""
+    full_idx = pd.date_range(df.index.min(), df.index.max(), freq='D')
+    meteo_present = [c for c in METEO_COLUMNS if c in df.columns]
+    return bool(df.reindex(full_idx)[meteo_present].iloc[-1].isnull().any())
 
-    df = df.dropna()
-    print(f"Dataset final:  {df.shape[0]} dias, {df.shape[1]} colunas")
 
-    # Verificacao final
+def check_final_dataset(df):
     assert df.isnull().sum().sum() == 0, "NaNs restantes no dataset final!"
     diffs = df.index.to_series().diff().dropna()
     gaps = diffs[diffs > pd.Timedelta(days=1)]
     assert len(gaps) == 0, f"Gaps temporais no dataset final: {gaps}"
+
+
+def compute_feature_dataset(filepath_in, imputer=None):
+    """
+    Recalcula todo o dataset; devolve tambem a base continua e o flag de cauda.
+    Com um `imputer` causal, as lacunas sao preenchidas por ele (que termina
+    com o estado do ultimo dia) em vez da interpolacao linear; nesse caso a
+    cauda nunca e revisada por dias futuros.
+    """
+    df = load_base(filepath_in)
+    print(f"Base de entrada: {df.shape[0]} dias, {df.shape[1]} colunas")
+    if imputer is None:
+        imputed_tail = tail_is_imputed(df)
+        continuous = fix_continuity(df)
+    else:
+        imputed_tail = False
+        continuous = causal_continuity(df, imputer)
+    print(f"Apos reindexacao/interpolacao: {continuous.shape[0]} dias, "
+          f"{continuous.shape[1]} colunas")
+
+    # Janelas incompletas das primeiras linhas sao descartadas pelo motor.
+    matrix = build_feature_matrix(FEATURE_SPEC, continuous, dtype=np.float64)
+    df = matrix.to_frame()
+    print(f"Dataset final:  {df.shape[0]} dias, {df.shape[1]} colunas")
+    check_final_dataset(df)
     print("Verificacao OK: sem NaNs, sem gaps temporais.")
+    return df, continuous, imputed_tail
+
 
+def save_feature_state(state_path, features, continuous, imputed_tail, imputer=None):
+    """
+    Guarda o necessario para continuar o dataset sem recalcular o historico:
+    a ultima EMA de cada coluna/span, as ultimas CONTEXT_ROWS linhas da base
+    continua (apos imputacao) e, no modo causal, o estado do imputador.
+    """
+    context = continuous.iloc[-CONTEXT_ROWS:]
+    ema_columns = FEATURE_SPEC.ema_names()
+    state = {
+        'versao': STATE_VERSION,
+        'ultima_data': str(features.index[-1].date()),
+        'cauda_interpolada': imputed_tail,
+        'imputacao': None if imputer is None else imputer.to_state(),
+        'colunas': list(features.columns),
+        'ema': {name: float(features[name].iloc[-1]) for name in ema_columns},
+        'contexto': {
+            'data': [str(day.date()) for day in context.index],
+            **{col: context[col].tolist() for col in context.columns},
+        },
+    }
+    temporary = f'{state_path}.tmp'
+    with open(temporary, 'w', encoding='utf-8') as stream:
+        json.dump(state, stream, indent=2)
+    os.replace(temporary, state_path)
+
+
+def load_feature_state(state_path):
+    if not os.path.exists(state_path):
+        return None
+    with open(state_path, encoding='utf-8') as stream:
+        state = json.load(stream)
+    if state.get('versao') != STATE_VERSION:
+        return None
+    return state
+
+
+def build_feature_dataset(filepath_in, filepath_out, state_path=None, matrix_path=None,
+                          imputation='linear'):
+    imputer = new_imputer(imputation)
+    df, continuous, imputed_tail = compute_feature_dataset(filepath_in, imputer)
     df.to_csv(filepath_out)
     print(f"  -> {filepath_out}")
+    if matrix_path is not None:
+        write_feature_store(df, matrix_path, base_path=filepath_in)
+        print(f"  -> {matrix_path}")
+    if state_path is not None:
+        save_feature_state(state_path, df, continuous, imputed_tail, imputer)
 
 
-if __name__ == "__main__":
-    os.makedirs('../data', exist_ok=True)
+def update_feature_dataset(filepath_in, filepath_out, state_path, matrix_path=None,
+                           imputation='linear'):
+    """
+    Acrescenta ao dataset apenas os dias da base posteriores ao estado salvo,
+    em tempo proporcional aos dias novos. Recorre ao recalculo completo quando
+    nao ha estado compativel, quando o estado usa outro modo de imputacao ou
+    quando o ultimo dia processado foi interpolado (a interpolacao linear desse
+    dia mudaria com os novos pontos). No modo causal, os dias novos passam pelo
+    imputador salvo e o historico nunca e revisitado.
+    """
+    state = load_feature_state(state_path)
+    outputs = [filepath_out] + ([matrix_path] if matrix_path is not None else [])
+    saved_mode = 'linear' if state is None or state['imputacao'] is None \
+        else state['imputacao']['metodo']
+    if (state is None or state['cauda_interpolada'] or saved_mode != imputation
+            or not all(os.path.exists(path) for path in outputs)):
+        print("Estado incremental ausente ou invalido; recalculo completo.")
+        return build_feature_dataset(filepath_in, filepath_out, state_path, matrix_path,
+                                     imputation)
+
+    last_day = pd.Timestamp(state['ultima_data'])
+    base = load_base(filepath_in)
+    new = base.loc[base.index > last_day]
+    if new.empty:
+        print(f"Dataset ja cobre ate {last_day.date()}; nada a acrescentar.")
+        return
+
+    saved = state['contexto']
+    context = pd.DataFrame(
+        {col: values for col, values in saved.items() if col != 'data'},
+        index=pd.DatetimeIndex(pd.to_datetime(saved['data']), name='data'),
+    )
+    new = new[new.columns.intersection(context.columns)]
+    if state['imputacao'] is None:
+        imputer = None
+        imputed_tail = tail_is_imputed(new)
+        continuous = fix_continuity(pd.concat([context, new]))
+    else:
+        imputer = CausalImputer.from_state(state['imputacao'])
+        imputed_tail = False
+        continuous = pd.concat([context, causal_continuity(new, imputer)])
+
+    # As linhas do contexto so alimentam lags e desvio movel; as EMAs
+    # continuam a partir do ultimo valor salvo.
+    matrix = build_feature_matrix(
+        FEATURE_SPEC, continuous, dtype=np.float64,
+        keep_from=len(context), ema_initial=state['ema'],
+    )
+    df = matrix.to_frame()[state['colunas']]
+    if df.index[0] != last_day + pd.Timedelta(days=1):
+        raise ValueError(f"Os novos dias nao continuam o dataset apos {last_day.date()}.")
+    check_final_dataset(df)
+
+    df.to_csv(filepath_out, mode='a', header=False)
+    print(f"Acrescentados {len(df)} dias ({df.index[0].date()} a {df.index[-1].date()})")
+    print(f"  -> {filepath_out}")
+    if matrix_path is not None:
+        write_feature_store(df, matrix_path, base_path=filepath_in, append=True)
+        print(f"  -> {matrix_path}")
+    save_feature_state(state_path, df, continuous, imputed_tail, imputer)
+
 
-    build_feature_dataset(
-        filepath_in='../data/base_diaria_interrupcoes_clima_vento.csv',
-        filepath_out='../data/dataset_engenharia_features.csv'
+def check_against_full_recompute(filepath_in, filepath_out, rtol=1e-9, atol=1e-6,
+                                 imputation='linear'):
+    """
+    Confere o dataset gravado contra um recalculo completo em memoria.
+
+    A tolerancia absoluta cobre o erro de arredondamento acumulado pelo desvio
+    movel do pandas ao longo de todo o historico (da ordem de 1e-7 em janelas
+    de chuva constante), ausente quando a janela e calculada isoladamente.
+    """
+    expected, _, _ = compute_feature_dataset(filepath_in, new_imputer(imputation))
+    written = load_base(filepath_out)
+    written.index = written.index.rename(expected.index.name)
+    pd.testing.assert_frame_equal(
+        written, expected, check_dtype=False, check_freq=False,
+        check_exact=False, rtol=rtol, atol=atol,
     )
+    print(f"Verificacao incremental OK: {len(written)} dias iguais ao recalculo.")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--incremental', action='store_true',
+                        help='acrescenta apenas os dias novos da base')
+    parser.add_argument('--verificar', action='store_true',
+                        help='compara o resultado com um recalculo completo')
+    parser.add_argument('--imputacao', choices=IMPUTATION_MODES, default='linear',
+                        help='linear (historico, nao causal) ou imputacao causal '
+                             'locf/kalman para a previsao diaria')
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    os.makedirs('../data', exist_ok=True)
+    paths = {
+        'filepath_in': '../data/base_diaria_interrupcoes_clima_vento.csv',
+        'filepath_out': '../data/dataset_engenharia_features.csv',
+    }
+    state_path = '../data/estado_engenharia_features.json'
+    matrix_path = FEATURE_STORE_PATH
+
+    if arguments.incremental:
+        update_feature_dataset(**paths, state_path=state_path, matrix_path=matrix_path,
+                               imputation=arguments.imputacao)
+    else:
+        build_feature_dataset(**paths, state_path=state_path, matrix_path=matrix_path,
+                              imputation=arguments.imputacao)
+    if arguments.verificar:
+        check_against_full_recompute(**paths, imputation=arguments.imputacao)
 
     print("\n[OK] Engenharia de atributos concluida.")
@@ -1,11 +1,17 @@
-"""Gera agregações, correlações canônicas e a figura comparativa."""
+"""Gera agregações, correlações canônicas e móveis e a figura comparativa."""
 
 from __future__ import annotations
 
 import argparse
 from pathlib import Path
 
-from aggregation import build_correlation_table, load_daily_base, plot_correlation_table
+from aggregation import (
+    BOOTSTRAP_RESAMPLES,
+    build_correlation_table,
+    build_rolling_correlations,
+    load_daily_base,
+    plot_correlation_table,
+)
 
 
 SOURCE_DIR = Path(__file__).resolve().parent
@@ -14,12 +20,17 @@ DEFAULT_DATA_DIR = FONTE_DIR / "data"
 DEFAULT_RESULTS_DIR = FONTE_DIR / "results" / "eda"
 
 
-def generate(data_dir: Path, results_dir: Path) -> None:
+def generate(
+    data_dir: Path,
+    results_dir: Path,
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+) -> None:
     results_dir.mkdir(parents=True, exist_ok=True)
     daily = load_daily_base(data_dir / "base_diaria_interrupcoes_clima_vento.csv")
     table, frames = build_correlation_table(
         daily,
         data_dir / "base_mensal_interrupcoes_clima_consumo.csv",
+        n_resamples,
     )
     table.to_csv(data_dir / "correlacoes_consolidadas.csv", index=False)
     frames["semanal"].rename_axis("data_referencia").to_csv(
@@ -28,6 +39,9 @@ def generate(data_dir: Path, results_dir: Path) -> None:
     frames["mensal"].rename_axis("data_referencia").to_csv(
         data_dir / "agregados_mensais_canonicos.csv"
     )
+    build_rolling_correlations(daily).to_csv(
+        data_dir / "correlacoes_moveis.csv", index=False
+    )
     plot_correlation_table(table, results_dir / "correlacoes_escala_temporal.png")
     print("[OK] Agregações, correlações e figura canônicas geradas.")
 
@@ -36,9 +50,16 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR)
     parser.add_argument("--results-dir", type=Path, default=DEFAULT_RESULTS_DIR)
+    parser.add_argument(
+        "--bootstrap-resamples",
+        type=int,
+        default=BOOTSTRAP_RESAMPLES,
+        help="reamostras do IC95%% por block bootstrap; 0 omite ic95_inf e ic95_sup "
+        f"(padrão: {BOOTSTRAP_RESAMPLES})",
+    )
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     arguments = parse_args()
-    generate(arguments.data_dir, arguments.results_dir)
+    generate(arguments.data_dir, arguments.results_dir, arguments.bootstrap_resamples)
@@ -2,16 +2,37 @@
 
 As semanas usam ``W-MON``: cada grupo termina na segunda-feira e reúne os dias
 da terça-feira anterior até essa segunda-feira.
+
+``ScaleProvider`` entrega a base diária e seus agregados sob demanda; os
+agregados são memorizados por hash do conteúdo da base e frequência em um
+cache LRU do processo, compartilhado entre correlações, figuras e scripts de
+entrega.
+
+``build_rolling_correlations`` resume a correlação móvel de Pearson entre as
+interrupções e cada variável em janelas de 30, 90 e 365 dias, em formato
+compacto para o painel. A tabela canônica traz, para cada Pearson, o IC95% por
+block bootstrap circular com blocos de uma semana, um mês ou um trimestre,
+conforme a escala.
 """
 
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+from correlation_engine import (
+    BOOTSTRAP_RESAMPLES,
+    bootstrap_intervals,
+    correlation_table,
+    rolling_correlations,
+)
+
 
 VARIABLE_LABELS = {
     "temperatura_media": "Temperatura média",
@@ -25,6 +46,10 @@ VARIABLE_LABELS = {
 }
 
 SCALE_FREQUENCIES = {"diario": None, "semanal": "W-MON", "mensal": "MS"}
+SCALE_CACHE_SIZE = 16
+ROLLING_WINDOWS = (30, 90, 365)
+# Blocos do bootstrap de cerca de uma semana, um mês e um trimestre.
+BOOTSTRAP_BLOCK_LENGTHS = {"diario": 7, "semanal": 4, "mensal": 3}
 AGGREGATION_COLUMNS = [
     "interrupcoes",
     "precipitacao_total_mm",
@@ -44,6 +69,22 @@ def load_daily_base(path: Path | str) -> pd.DataFrame:
     return frame
 
 
+def load_station_bases(path: Path | str) -> dict[str, pd.DataFrame]:
+    """Separa a tabela longa por estação em bases diárias independentes.
+
+    A entrada é ``clima_diario_estacoes.csv``; cada base resultante tem o
+    mesmo formato de ``load_daily_base`` e pode ser usada em
+    ``aggregate_daily`` e ``build_correlation_table``.
+    """
+    long = pd.read_csv(path, parse_dates=["data"])
+    bases: dict[str, pd.DataFrame] = {}
+    for station, frame in long.groupby("estacao", sort=True):
+        frame = frame.drop(columns="estacao").set_index("data").sort_index()
+        _validate_daily_frame(frame)
+        bases[str(station)] = frame
+    return bases
+
+
 def _validate_daily_frame(frame: pd.DataFrame) -> None:
     missing = sorted(set(AGGREGATION_COLUMNS) - set(frame.columns))
     if missing:
@@ -54,60 +95,294 @@ def _validate_daily_frame(frame: pd.DataFrame) -> None:
         raise ValueError("A base diária contém datas duplicadas.")
 
 
+SUM_COLUMNS = ("interrupcoes", "precipitacao_total_mm")
+MEAN_COLUMNS = (
+    "temperatura_media",
+    "vento_velocidade_media_ms",
+    "vento_dir_sin",
+    "vento_dir_cos",
+)
+MAX_COLUMNS = ("vento_velocidade_max_ms", "vento_rajada_max_ms")
+
+
+class AggregationIndex:
+    """Somas acumuladas e tabela esparsa de máximos sobre a base diária.
+
+    O índice é construído uma vez em O(n log n). Depois, qualquer intervalo de
+    dias (um período ``W-MON`` ou ``MS``, blocos de N dias ou datas
+    arbitrárias) é agregado em O(1) por intervalo: somas e médias vêm da
+    diferença de somas acumuladas e contagens de valores válidos, e máximos da
+    sobreposição de dois blocos de potência de dois na tabela esparsa.
+
+    Dias ausentes da base contam como valores inválidos, como no ``resample``.
+    As colunas reais são centradas antes da soma acumulada para limitar o erro
+    de arredondamento das diferenças.
+    """
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        _validate_daily_frame(frame)
+        frame = frame.sort_index()
+        self.dates = pd.date_range(
+            frame.index.min(), frame.index.max(), freq="D", name=frame.index.name
+        )
+        daily = frame.reindex(self.dates)
+        self.integer_columns = [
+            name
+            for name in SUM_COLUMNS
+            if pd.api.types.is_integer_dtype(frame[name])
+        ]
+
+        additive = [*SUM_COLUMNS, *MEAN_COLUMNS]
+        values = daily[additive].to_numpy(dtype=np.float64, copy=True)
+        valid = ~np.isnan(values)
+        # Contagens inteiras ficam sem deslocamento para que as somas sejam exatas.
+        centered_columns = [
+            i for i, name in enumerate(additive) if name not in self.integer_columns
+        ]
+        valid_days = valid.sum(axis=0)
+        self.offsets = np.zeros(len(additive))
+        self.offsets[centered_columns] = np.nansum(
+            values[:, centered_columns], axis=0
+        ) / np.maximum(valid_days[centered_columns], 1)
+        centered = np.where(valid, values - self.offsets, 0.0)
+        self.sums = np.vstack([np.zeros(len(additive)), np.cumsum(centered, axis=0)])
+        self.counts = np.vstack(
+            [np.zeros(len(additive), dtype=np.int64), np.cumsum(valid, axis=0)]
+        )
+        self.additive_position = {name: i for i, name in enumerate(additive)}
+
+        maxima = daily[list(MAX_COLUMNS)].to_numpy(dtype=np.float64, copy=True)
+        self.max_counts = np.vstack(
+            [np.zeros(len(MAX_COLUMNS), dtype=np.int64), np.cumsum(~np.isnan(maxima), axis=0)]
+        )
+        self.sparse = [np.where(np.isnan(maxima), -np.inf, maxima)]
+        width = 1
+        while 2 * width <= len(maxima):
+            previous = self.sparse[-1]
+            self.sparse.append(np.maximum(previous[:-width], previous[width:]))
+            width *= 2
+        self._bounds: dict[str, tuple[pd.DatetimeIndex, np.ndarray, np.ndarray]] = {}
+
+    def bounds(self, frequency: str) -> tuple[pd.DatetimeIndex, np.ndarray, np.ndarray]:
+        """Rótulos e posições ``[início, fim)`` dos períodos de ``frequency``."""
+        if frequency not in self._bounds:
+            positions = pd.Series(np.arange(len(self.dates)), index=self.dates)
+            limits = positions.resample(frequency).agg(["min", "max"]).dropna()
+            self._bounds[frequency] = (
+                limits.index,
+                limits["min"].to_numpy(dtype=np.int64),
+                limits["max"].to_numpy(dtype=np.int64) + 1,
+            )
+        return self._bounds[frequency]
+
+    def _range_max(self, starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+        level = np.floor(np.log2(stops - starts)).astype(np.int64)
+        result = np.empty((len(starts), len(MAX_COLUMNS)))
+        for k in np.unique(level):
+            rows = level == k
+            table = self.sparse[k]
+            result[rows] = np.maximum(
+                table[starts[rows]], table[stops[rows] - (1 << k)]
+            )
+        counts = self.max_counts[stops] - self.max_counts[starts]
+        return np.where(counts > 0, result, np.nan)
+
+    def aggregate_positions(
+        self,
+        starts: np.ndarray,
+        stops: np.ndarray,
+        index: pd.Index,
+    ) -> pd.DataFrame:
+        """Agrega os intervalos de posições ``[starts, stops)`` da base."""
+        starts = np.asarray(starts, dtype=np.int64)
+        stops = np.asarray(stops, dtype=np.int64)
+        if len(starts) and (
+            (starts < 0).any() or (stops > len(self.dates)).any() or (stops <= starts).any()
+        ):
+            raise ValueError("Intervalo de agregação fora da base diária.")
+        counts = self.counts[stops] - self.counts[starts]
+        centered = self.sums[stops] - self.sums[starts]
+        totals = centered + counts * self.offsets
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = totals / counts
+        result = pd.DataFrame(index=index)
+        for name in SUM_COLUMNS:
+            i = self.additive_position[name]
+            result[name] = np.where(counts[:, i] > 0, totals[:, i], np.nan)
+        for name in MEAN_COLUMNS:
+            i = self.additive_position[name]
+            result[name] = np.where(counts[:, i] > 0, means[:, i], np.nan)
+        for name, column in zip(MAX_COLUMNS, self._range_max(starts, stops).T):
+            result[name] = column
+        for name in self.integer_columns:
+            if result[name].notna().all():
+                result[name] = np.rint(result[name]).astype(np.int64)
+
+        norm = np.hypot(result["vento_dir_sin"], result["vento_dir_cos"])
+        valid_direction = norm >= 1e-12
+        result.loc[~valid_direction, ["vento_dir_sin", "vento_dir_cos"]] = np.nan
+        result.loc[valid_direction, "vento_dir_sin"] = (
+            result.loc[valid_direction, "vento_dir_sin"] / norm.loc[valid_direction]
+        )
+        result.loc[valid_direction, "vento_dir_cos"] = (
+            result.loc[valid_direction, "vento_dir_cos"] / norm.loc[valid_direction]
+        )
+        return result[AGGREGATION_COLUMNS]
+
+    def aggregate(self, frequency: str) -> pd.DataFrame:
+        """Equivalente a ``resample(frequency)`` com as regras canônicas."""
+        labels, starts, stops = self.bounds(frequency)
+        return self.aggregate_positions(starts, stops, labels)
+
+    def window(self, start: str | pd.Timestamp, end: str | pd.Timestamp) -> pd.Series:
+        """Agregado do intervalo de datas ``[start, end]``, inclusive."""
+        first = max(self.dates.searchsorted(pd.Timestamp(start)), 0)
+        stop = self.dates.searchsorted(pd.Timestamp(end), side="right")
+        if stop <= first:
+            raise ValueError(f"Nenhum dia da base entre {start} e {end}.")
+        row = self.aggregate_positions(
+            np.array([first]), np.array([stop]), pd.Index([pd.Timestamp(end)])
+        )
+        return row.iloc[0]
+
+
 def aggregate_daily(frame: pd.DataFrame, frequency: str) -> pd.DataFrame:
     """Aplica uma regra física documentada a cada variável."""
-    _validate_daily_frame(frame)
-    frame = frame.sort_index()
-    grouped = frame.resample(frequency)
-    result = grouped.agg(
-        temperatura_media=("temperatura_media", "mean"),
-        vento_velocidade_media_ms=("vento_velocidade_media_ms", "mean"),
-        vento_velocidade_max_ms=("vento_velocidade_max_ms", "max"),
-        vento_rajada_max_ms=("vento_rajada_max_ms", "max"),
-        vento_dir_sin=("vento_dir_sin", "mean"),
-        vento_dir_cos=("vento_dir_cos", "mean"),
-    )
-    result["interrupcoes"] = grouped["interrupcoes"].sum(min_count=1)
-    result["precipitacao_total_mm"] = grouped["precipitacao_total_mm"].sum(
-        min_count=1
-    )
-
-    norm = np.hypot(result["vento_dir_sin"], result["vento_dir_cos"])
-    valid_direction = norm >= 1e-12
-    result.loc[~valid_direction, ["vento_dir_sin", "vento_dir_cos"]] = np.nan
-    result.loc[valid_direction, "vento_dir_sin"] = (
-        result.loc[valid_direction, "vento_dir_sin"] / norm.loc[valid_direction]
-    )
-    result.loc[valid_direction, "vento_dir_cos"] = (
-        result.loc[valid_direction, "vento_dir_cos"] / norm.loc[valid_direction]
-    )
-    return result[AGGREGATION_COLUMNS]
-
-
-def frames_by_scale(frame: pd.DataFrame) -> dict[str, pd.DataFrame]:
-    _validate_daily_frame(frame)
-    return {
-        name: frame.copy() if frequency is None else aggregate_daily(frame, frequency)
-        for name, frequency in SCALE_FREQUENCIES.items()
-    }
+    return AggregationIndex(frame).aggregate(frequency)
+
+
+def frame_digest(frame: pd.DataFrame) -> str:
+    """SHA-256 do conteúdo de ``frame`` (índice, colunas e valores)."""
+    digest = hashlib.sha256()
+    digest.update("\x1f".join(map(str, frame.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class ScaleCache:
+    """Cache LRU de agregados por (hash da base, frequência), comum ao processo."""
+
+    def __init__(self, maxsize: int = SCALE_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str], pd.DataFrame] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[str, str]) -> pd.DataFrame | None:
+        frame = self._entries.get(key)
+        if frame is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return frame
+
+    def put(self, key: tuple[str, str], frame: pd.DataFrame) -> None:
+        self._entries[key] = frame
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+SCALE_CACHE = ScaleCache()
+
+
+class ScaleProvider(Mapping[str, pd.DataFrame]):
+    """Base diária e agregados por escala, calculados no primeiro acesso.
+
+    Os agregados ficam em ``SCALE_CACHE``; outra chamada no mesmo processo
+    com uma base de mesmo conteúdo reutiliza o resultado sem reagregar. Os
+    quadros devolvidos são compartilhados: copie antes de modificá-los.
+    """
+
+    def __init__(
+        self,
+        frame: pd.DataFrame,
+        scales: dict[str, str | None] | None = None,
+        cache: ScaleCache | None = None,
+    ) -> None:
+        _validate_daily_frame(frame)
+        self.frame = frame.sort_index()
+        self.scales = dict(SCALE_FREQUENCIES if scales is None else scales)
+        self.cache = SCALE_CACHE if cache is None else cache
+        self._digest: str | None = None
+        self._index: AggregationIndex | None = None
+
+    @property
+    def digest(self) -> str:
+        if self._digest is None:
+            self._digest = frame_digest(self.frame)
+        return self._digest
+
+    def at(self, frequency: str | None) -> pd.DataFrame:
+        """Agregado de ``frequency`` (``None`` devolve a base diária)."""
+        if frequency is None:
+            return self.frame
+        key = (self.digest, frequency)
+        result = self.cache.get(key)
+        if result is None:
+            if self._index is None:
+                self._index = AggregationIndex(self.frame)
+            result = self._index.aggregate(frequency)
+            self.cache.put(key, result)
+        return result
+
+    def __getitem__(self, scale: str) -> pd.DataFrame:
+        return self.at(self.scales[scale])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.scales)
+
+    def __len__(self) -> int:
+        return len(self.scales)
+
+
+def frames_by_scale(frame: pd.DataFrame) -> ScaleProvider:
+    return ScaleProvider(frame)
+
+
+def _correlation_intervals(
+    frames: Mapping[str, pd.DataFrame],
+    variables: list[str],
+    n_resamples: int,
+) -> pd.DataFrame:
+    """IC95% por block bootstrap do Pearson de cada escala."""
+    intervals = [
+        bootstrap_intervals(
+            frame, "interrupcoes", variables, BOOTSTRAP_BLOCK_LENGTHS[scale], n_resamples
+        )
+        .reset_index()
+        .assign(nivel_temporal=scale)
+        for scale, frame in frames.items()
+    ]
+    return pd.concat(intervals, ignore_index=True)
 
 
 def build_correlation_table(
     daily: pd.DataFrame,
     monthly_consumption_path: Path | str | None = None,
-) -> tuple[pd.DataFrame, dict[str, pd.DataFrame]]:
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+) -> tuple[pd.DataFrame, ScaleProvider]:
+    """Pearson com as interrupções por escala, com IC95% por block bootstrap.
+
+    Com ``n_resamples=0`` os intervalos não são calculados e a tabela mantém
+    o esquema anterior, sem ``ic95_inf`` e ``ic95_sup``.
+    """
+    if n_resamples < 0:
+        raise ValueError("O número de reamostras não pode ser negativo.")
     frames = frames_by_scale(daily)
-    rows: list[dict[str, object]] = []
     variables = list(VARIABLE_LABELS)[:-1]
-    for scale, frame in frames.items():
-        for variable in variables:
-            rows.append(
-                {
-                    "nivel_temporal": scale,
-                    "variavel": variable,
-                    "pearson_r": float(frame["interrupcoes"].corr(frame[variable])),
-                }
-            )
+    tables = [correlation_table(frames, "interrupcoes", variables)]
+    intervals = []
+    if n_resamples:
+        intervals.append(_correlation_intervals(frames, variables, n_resamples))
 
     if monthly_consumption_path and Path(monthly_consumption_path).exists():
         consumption = pd.read_csv(monthly_consumption_path)
@@ -119,20 +394,59 @@ def build_correlation_table(
             consumption[["consumo_total_kwh"]],
             how="inner",
         )
-        rows.append(
-            {
-                "nivel_temporal": "mensal",
-                "variavel": "consumo_total_kwh",
-                "pearson_r": float(
-                    joined["interrupcoes"].corr(joined["consumo_total_kwh"])
-                ),
-            }
+        tables.append(
+            correlation_table(
+                {"mensal": joined}, "interrupcoes", ["consumo_total_kwh"]
+            )
         )
-    table = pd.DataFrame(rows)
+        if n_resamples:
+            intervals.append(
+                _correlation_intervals(
+                    {"mensal": joined}, ["consumo_total_kwh"], n_resamples
+                )
+            )
+    table = pd.concat(tables, ignore_index=True)
+    columns = ["nivel_temporal", "variavel", "pearson_r"]
+    if intervals:
+        table = table.merge(
+            pd.concat(intervals), on=["nivel_temporal", "variavel_y"], how="left"
+        )
+        columns += ["ic95_inf", "ic95_sup"]
+    table = table.rename(
+        columns={
+            "variavel_y": "variavel",
+            "r": "pearson_r",
+            "ic_inferior": "ic95_inf",
+            "ic_superior": "ic95_sup",
+        }
+    )[columns]
     table["rotulo"] = table["variavel"].map(VARIABLE_LABELS)
     return table, frames
 
 
+def build_rolling_correlations(
+    daily: pd.DataFrame,
+    windows: tuple[int, ...] = ROLLING_WINDOWS,
+) -> pd.DataFrame:
+    """Correlações móveis com as interrupções, uma linha por dia e janela.
+
+    Dias ausentes da base entram como lacunas para que cada janela cubra
+    exatamente ``window`` dias de calendário. A tabela tem as colunas ``data``,
+    ``janela_dias`` e uma coluna por variável, arredondada a quatro casas;
+    os dias anteriores à primeira janela completa são omitidos.
+    """
+    calendar = daily.asfreq("D")
+    variables = [column for column in AGGREGATION_COLUMNS if column != "interrupcoes"]
+    tables = []
+    for window in windows:
+        rolling = rolling_correlations(calendar, "interrupcoes", variables, window)
+        rolling = rolling.dropna(how="all").round(4)
+        tables.append(
+            rolling.rename_axis("data").reset_index().assign(janela_dias=window)
+        )
+    return pd.concat(tables, ignore_index=True)[["data", "janela_dias", *variables]]
+
+
 def plot_correlation_table(table: pd.DataFrame, output_path: Path | str) -> None:
     pivot = table.pivot(index="rotulo", columns="nivel_temporal", values="pearson_r")
     order = pivot.abs().max(axis=1).sort_values(ascending=False).index
@@ -11,12 +11,38 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import math
+import os
 import re
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from csv import reader as csv_reader
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+from file_digest import sha256
+from hourly_base import (
+    HOURLY_BASE_DIRNAME,
+    LOCAL_UTC_OFFSET,
+    append_hourly_base,
+    write_hourly_base,
+)
+from source_schema import (
+    ANEEL_SCHEMA,
+    INMET_SCHEMA,
+    PYARROW_AVAILABLE,
+    SCHEMA_VERSION,
+    csv_engine,
+    iter_typed_csv,
+    parse_datetimes,
+    parse_throughput,
+    read_typed_csv,
+)
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_INPUT_ROOT = PROJECT_ROOT.parents[1]
@@ -31,6 +57,11 @@ END_DATE = pd.Timestamp("2025-05-31")
 
 EVENT_ID_COLUMN = "NumOrdemInterrupcao"
 START_COLUMN = "DatInicioInterrupcao"
+BASE_FILENAME = "base_diaria_interrupcoes_clima_vento.csv"
+WEATHER_FILENAME = "vento_diario_brasilia.csv"
+MANIFEST_FILENAME = "manifesto_fontes_padronizadas.json"
+STATIONS_FILENAME = "clima_diario_estacoes.csv"
+
 HOURLY_KEY = ["data", "hora_utc"]
 INMET_COLUMNS = [
     "data",
@@ -42,14 +73,174 @@ INMET_COLUMNS = [
     "vento_velocidade_horaria_ms",
 ]
 INMET_VALUE_COLUMNS = INMET_COLUMNS[2:]
+STATION_COLUMN = "estacao"
+INMET_FILE_PATTERN = re.compile(
+    r"_(?P<uf>[A-Z]{2})_(?P<estacao>[A-Z]\d{3})_.+_\d{2}-\d{2}-(?P<ano>20\d{2})_A_"
+)
+DAILY_WEATHER_COLUMNS = [
+    "temperatura_media",
+    "precipitacao_total_mm",
+    "vento_velocidade_media_ms",
+    "vento_velocidade_max_ms",
+    "vento_rajada_max_ms",
+    "vento_direcao_media_circular_gr",
+    "vento_dir_sin",
+    "vento_dir_cos",
+    "n_registros",
+]
 
+EVENT_INDEX_DIRNAME = "indice_eventos_aneel"
+EVENT_INDEX_VERSION = 3
+EVENT_CHUNK_ROWS = 250_000
+TAIL_FINGERPRINT_BYTES = 1024 * 1024
+SPILL_BYTES_PER_EVENT = 256
+CACHE_DIRNAME = "cache_fontes"
+HASH_CACHE_FILENAME = "hashes_fontes.json"
+CACHE_VERSION = 1
+SOURCE_CACHE_KEEP = 2
 
-def sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as stream:
-        for block in iter(lambda: stream.read(1024 * 1024), b""):
-            digest.update(block)
-    return digest.hexdigest()
+
+def load_hash_cache(path: Path) -> dict[str, dict[str, object]]:
+    if not path.is_file():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_hash_cache(path: Path, cache: dict[str, dict[str, object]]) -> None:
+    temporary = path.with_name(f".{path.name}.tmp")
+    temporary.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+    temporary.replace(path)
+
+
+def cached_sha256(
+    path: Path,
+    cache: dict[str, dict[str, object]],
+    verify: bool = False,
+) -> str:
+    """Reaproveita o SHA-256 anterior quando tamanho, mtime e inode não mudaram.
+
+    Com ``verify=True`` o arquivo é sempre relido; uma divergência com o valor
+    memorizado para os mesmos metadados é informada.
+    """
+    stat = path.stat()
+    key = str(path.resolve())
+    signature = {
+        "tamanho": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "inode": stat.st_ino,
+    }
+    entry = cache.get(key)
+    unchanged = entry is not None and all(
+        entry.get(name) == value for name, value in signature.items()
+    )
+    if unchanged and not verify:
+        return str(entry["sha256"])
+
+    digest = sha256(path)
+    if unchanged and entry["sha256"] != digest:
+        print(
+            f"[AVISO] {path.name} mudou sem alterar tamanho, mtime ou inode; "
+            "o hash memorizado foi substituído."
+        )
+    cache[key] = {**signature, "sha256": digest}
+    return digest
+
+
+def _cache_root(cache_dir: Path) -> Path:
+    return cache_dir / f"v{CACHE_VERSION}-esquema{SCHEMA_VERSION}"
+
+
+def _cache_entry(cache_dir: Path, kind: str, digest: str) -> Path:
+    return _cache_root(cache_dir) / kind / digest
+
+
+def load_cached_columns(entry: Path) -> tuple[dict[str, np.ndarray], dict] | None:
+    """Lê as colunas binárias de uma entrada do cache, se ela existir.
+
+    O mtime de ``meta.json`` é atualizado a cada leitura e marca o último uso
+    da entrada para ``prune_source_cache``.
+    """
+    meta_path = entry / "meta.json"
+    if not meta_path.is_file():
+        return None
+    os.utime(meta_path)
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    columns = {
+        name: np.load(entry / f"{position:02d}.npy", allow_pickle=False)
+        for position, name in enumerate(meta["colunas"])
+    }
+    return columns, meta
+
+
+def save_cached_columns(
+    entry: Path,
+    columns: dict[str, np.ndarray],
+    meta: dict[str, object] | None = None,
+) -> None:
+    """Grava uma entrada do cache; ``meta.json`` por último marca a conclusão."""
+    staging = entry.with_name(f".{entry.name}.tmp")
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+    for position, values in enumerate(columns.values()):
+        np.save(staging / f"{position:02d}.npy", values, allow_pickle=False)
+    (staging / "meta.json").write_text(
+        json.dumps({"colunas": list(columns), **(meta or {})}, indent=2),
+        encoding="utf-8",
+    )
+    if entry.exists():
+        shutil.rmtree(entry)
+    staging.replace(entry)
+
+
+def prune_source_cache(cache_dir: Path, keep: int = SOURCE_CACHE_KEEP) -> tuple[int, int]:
+    """Mantém, para cada fonte, só as ``keep`` entradas usadas mais recentemente.
+
+    Diretórios de outras versões do cache ou do esquema, que nunca mais serão
+    lidos, e gravações interrompidas também são apagados. Devolve quantas
+    entradas e quantos bytes foram removidos.
+    """
+    if keep < 1:
+        raise ValueError("O cache deve manter ao menos uma entrada por fonte.")
+    if not cache_dir.is_dir():
+        return 0, 0
+    current = _cache_root(cache_dir)
+    obsolete = [path for path in cache_dir.iterdir() if path.is_dir() and path != current]
+    obsolete.extend(current.glob("*/.*.tmp"))
+    sources: dict[tuple[str, object], list[Path]] = {}
+    for meta_path in current.glob("*/*/meta.json"):
+        source = json.loads(meta_path.read_text(encoding="utf-8")).get("fonte")
+        sources.setdefault((meta_path.parent.parent.name, source), []).append(meta_path)
+    for meta_paths in sources.values():
+        meta_paths.sort(key=lambda path: path.stat().st_mtime_ns, reverse=True)
+        obsolete.extend(path.parent for path in meta_paths[keep:])
+    freed = 0
+    for path in obsolete:
+        freed += sum(file.stat().st_size for file in path.rglob("*") if file.is_file())
+        shutil.rmtree(path)
+    return len(obsolete), freed
+
+
+def _report_source_cache_pruning(cache_dir: Path | None, keep: int) -> None:
+    if cache_dir is None:
+        return
+    removed, freed = prune_source_cache(cache_dir, keep)
+    if removed:
+        print(
+            f"[OK] Cache das fontes podado: {removed} entrada(s) e "
+            f"{freed / 2**20:.0f} MiB removidos."
+        )
+
+
+def _encode_event_ids(ids: np.ndarray) -> np.ndarray:
+    """Usa ``int64`` quando a conversão preserva exatamente o texto original."""
+    try:
+        numeric = ids.astype(np.int64)
+    except (TypeError, ValueError, OverflowError):
+        return ids.astype(str)
+    if np.array_equal(numeric.astype(str), ids.astype(str)):
+        return numeric
+    return ids.astype(str)
 
 
 def circular_mean_degrees(values: pd.Series | np.ndarray) -> float:
@@ -66,52 +257,532 @@ def circular_mean_degrees(values: pd.Series | np.ndarray) -> float:
     return float(np.degrees(np.arctan2(mean_sin, mean_cos)) % 360.0)
 
 
-def load_unique_interruption_events(path: Path) -> tuple[pd.DataFrame, int]:
+def _deduplicate_event_chunks(
+    chunks: list[pd.DataFrame],
+) -> pd.DataFrame:
+    """Mantém a primeira ocorrência de cada evento e valida as datas iniciais."""
+    events = pd.concat(chunks, ignore_index=True).drop_duplicates(EVENT_ID_COLUMN)
+    events[START_COLUMN] = parse_datetimes(events[START_COLUMN], ANEEL_SCHEMA)
+    if events[EVENT_ID_COLUMN].isna().any() or events[START_COLUMN].isna().any():
+        raise ValueError(
+            "A fonte ANEEL contém identificadores nulos ou datas iniciais inválidas."
+        )
+    return events
+
+
+def _read_unique_events(
+    path: Path,
+    parse_stats: dict[str, object] | None = None,
+) -> tuple[pd.DataFrame, int]:
+    """Lê toda a fonte ANEEL e devolve os eventos únicos, sem recorte de período.
+
+    Com o ``pyarrow`` o arquivo é lido de uma vez; sem ele, em blocos pelo motor
+    C. ``parse_stats`` recebe a vazão da leitura.
+    """
     required = [EVENT_ID_COLUMN, START_COLUMN]
+    started = time.perf_counter()
+    if PYARROW_AVAILABLE:
+        frames = iter([read_typed_csv(path, ANEEL_SCHEMA, required)])
+    else:
+        frames = iter_typed_csv(
+            path, ANEEL_SCHEMA, required, chunksize=EVENT_CHUNK_ROWS
+        )
     chunks: list[pd.DataFrame] = []
     raw_rows = 0
-    for chunk in pd.read_csv(path, usecols=required, dtype=str, chunksize=250_000):
+    for chunk in frames:
         raw_rows += len(chunk)
         chunks.append(chunk.drop_duplicates(EVENT_ID_COLUMN))
 
-    if not chunks:
+    if raw_rows == 0:
         raise ValueError("A fonte ANEEL não contém registros.")
+    events = _deduplicate_event_chunks(chunks)
+    if parse_stats is not None:
+        parse_stats.update(
+            parse_throughput(
+                raw_rows,
+                path.stat().st_size,
+                started,
+                csv_engine(chunked=not PYARROW_AVAILABLE),
+            )
+        )
+    return events, raw_rows
 
-    events = pd.concat(chunks, ignore_index=True).drop_duplicates(EVENT_ID_COLUMN)
-    events[START_COLUMN] = pd.to_datetime(events[START_COLUMN], errors="coerce")
-    if events[EVENT_ID_COLUMN].isna().any() or events[START_COLUMN].isna().any():
-        raise ValueError(
-            "A fonte ANEEL contém identificadores nulos ou datas iniciais inválidas."
+
+def _read_unique_events_cached(
+    path: Path,
+    cache_dir: Path | None,
+    digest: str | None,
+    parse_stats: dict[str, object] | None = None,
+) -> tuple[pd.DataFrame, int]:
+    if cache_dir is None or digest is None:
+        return _read_unique_events(path, parse_stats)
+
+    entry = _cache_entry(cache_dir, "eventos", digest)
+    cached = load_cached_columns(entry)
+    if cached is not None:
+        columns, meta = cached
+        events = pd.DataFrame(
+            {
+                EVENT_ID_COLUMN: columns[EVENT_ID_COLUMN].astype(str),
+                START_COLUMN: columns[START_COLUMN],
+            }
         )
+        if parse_stats is not None:
+            parse_stats.update({"esquema": SCHEMA_VERSION, "motor": "cache"})
+        return events, int(meta["linhas_entrada"])
+
+    events, raw_rows = _read_unique_events(path, parse_stats)
+    save_cached_columns(
+        entry,
+        {
+            EVENT_ID_COLUMN: _encode_event_ids(
+                events[EVENT_ID_COLUMN].to_numpy(dtype=str)
+            ),
+            START_COLUMN: events[START_COLUMN].to_numpy(),
+        },
+        {"fonte": path.name, "linhas_entrada": raw_rows},
+    )
+    return events, raw_rows
 
+
+def load_unique_interruption_events(
+    path: Path,
+    cache_dir: Path | None = None,
+    digest: str | None = None,
+    parse_stats: dict[str, object] | None = None,
+    *,
+    start: pd.Timestamp = START_DATE,
+    end: pd.Timestamp = END_DATE,
+) -> tuple[pd.DataFrame, int]:
+    """Carrega os eventos únicos do período.
+
+    Com ``cache_dir`` e o ``digest`` SHA-256 da fonte, os eventos deduplicados
+    são lidos de colunas binárias em vez de reprocessar o CSV. ``parse_stats``
+    recebe a vazão da leitura do CSV ou ``motor="cache"``.
+    """
+    events, raw_rows = _read_unique_events_cached(path, cache_dir, digest, parse_stats)
     events = events.loc[
         events[START_COLUMN].between(
-            START_DATE,
-            END_DATE + pd.Timedelta(days=1),
+            start,
+            end + pd.Timedelta(days=1),
             inclusive="left",
         )
     ].copy()
     return events, raw_rows
 
 
-def build_daily_target(
-    events: pd.DataFrame,
+def peak_rss_mb() -> float | None:
+    """Pico de memória residente do processo, quando a plataforma o informa."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss é medido em KiB no Linux e em bytes no macOS.
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def count_unique_events_bounded(
+    path: Path,
+    memory_budget_mb: float,
+    spill_dir: Path | None = None,
+    parse_stats: dict[str, object] | None = None,
+) -> tuple[pd.Series, int, dict[str, object]]:
+    """Conta eventos únicos por dia com memória limitada por ``memory_budget_mb``.
+
+    Os eventos são distribuídos em arquivos temporários pelo hash do
+    identificador, de modo que cada evento aparece em uma única partição. Cada
+    partição é deduplicada isoladamente, preservando a primeira ocorrência, e
+    apenas as contagens diárias permanecem em memória.
+    """
+    if memory_budget_mb <= 0:
+        raise ValueError("O orçamento de memória deve ser positivo.")
+    budget = memory_budget_mb * 1024 * 1024
+    chunk_rows = max(10_000, int(budget // (4 * SPILL_BYTES_PER_EVENT)))
+    partitions = max(1, math.ceil(2 * path.stat().st_size / budget))
+    required = [EVENT_ID_COLUMN, START_COLUMN]
+
+    days = np.array([], dtype="datetime64[D]")
+    counts = np.array([], dtype=np.int64)
+    raw_rows = 0
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="aneel-particoes-", dir=spill_dir) as tmp:
+        spill_root = Path(tmp)
+        for chunk in iter_typed_csv(path, ANEEL_SCHEMA, required, chunksize=chunk_rows):
+            raw_rows += len(chunk)
+            chunk = chunk.drop_duplicates(EVENT_ID_COLUMN)[required]
+            buckets = pd.util.hash_pandas_object(
+                chunk[EVENT_ID_COLUMN], index=False
+            ).to_numpy() % partitions
+            for bucket in np.unique(buckets):
+                chunk.loc[buckets == bucket].to_csv(
+                    spill_root / f"{bucket:05d}.csv",
+                    mode="a",
+                    header=False,
+                    index=False,
+                )
+
+        if raw_rows == 0:
+            raise ValueError("A fonte ANEEL não contém registros.")
+        if parse_stats is not None:
+            parse_stats.update(
+                parse_throughput(
+                    raw_rows, path.stat().st_size, started, csv_engine(chunked=True)
+                )
+            )
+
+        for partition in sorted(spill_root.glob("*.csv")):
+            events = _deduplicate_event_chunks(
+                [read_typed_csv(partition, ANEEL_SCHEMA, names=required)]
+            )
+            new_days, new_counts = _count_events_by_day(events)
+            days, counts = _merge_day_counts(days, counts, new_days, new_counts)
+            partition.unlink()
+
+    daily_counts = pd.Series(
+        counts,
+        index=pd.DatetimeIndex(days.astype("datetime64[ns]"), name="data"),
+        name="interrupcoes",
+    )
+    stats: dict[str, object] = {
+        "orcamento_memoria_mb": memory_budget_mb,
+        "particoes": partitions,
+        "linhas_por_bloco": chunk_rows,
+        "pico_rss_mb": peak_rss_mb(),
+    }
+    return daily_counts, raw_rows, stats
+
+
+def _count_events_by_day(events: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    days = events[START_COLUMN].to_numpy(dtype="datetime64[ns]").astype(
+        "datetime64[D]"
+    )
+    unique_days, counts = np.unique(days, return_counts=True)
+    return unique_days, counts.astype(np.int64)
+
+
+def _merge_day_counts(
+    days: np.ndarray,
+    counts: np.ndarray,
+    new_days: np.ndarray,
+    new_counts: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    merged_days, inverse = np.unique(
+        np.concatenate([days, new_days]), return_inverse=True
+    )
+    merged_counts = np.bincount(
+        inverse,
+        weights=np.concatenate([counts, new_counts]),
+        minlength=len(merged_days),
+    )
+    return merged_days, merged_counts.astype(np.int64)
+
+
+def _tail_fingerprint(path: Path, offset: int) -> str:
+    """Resume os bytes imediatamente anteriores ao ponto de retomada."""
+    start = max(0, offset - TAIL_FINGERPRINT_BYTES)
+    with path.open("rb") as stream:
+        stream.seek(start)
+        return hashlib.sha256(stream.read(offset - start)).hexdigest()
+
+
+def _range_sha256(path: Path, start: int, stop: int) -> str:
+    """SHA-256 dos bytes de ``start`` (inclusive) a ``stop`` (exclusive)."""
+    digest = hashlib.sha256()
+    with path.open("rb") as stream:
+        stream.seek(start)
+        remaining = stop - start
+        while remaining > 0:
+            block = stream.read(min(1024 * 1024, remaining))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest()
+
+
+def _chain_digest(previous: str, kind: str, digest: str) -> str:
+    """Encadeia o hash do conteúdo já indexado com o de um trecho novo."""
+    return hashlib.sha256(f"{previous}:{kind}:{digest}".encode("ascii")).hexdigest()
+
+
+def event_index_digest(index_dir: Path) -> str:
+    """Hash encadeado de tudo o que o índice de eventos já incorporou.
+
+    Após uma reconstrução ele é o SHA-256 da fonte; cada trecho acrescentado
+    ou ``delta`` encadeia o hash apenas dos bytes novos, sem reler o histórico.
+    """
+    meta = json.loads((index_dir / "meta.json").read_text(encoding="utf-8"))
+    return str(meta["sha256_encadeado"])
+
+
+def _read_header(path: Path) -> str:
+    with path.open("rb") as stream:
+        return stream.readline().decode("utf-8").rstrip("\r\n")
+
+
+def _segment_path(index_dir: Path, generation: int) -> Path:
+    return index_dir / f"ids-{generation:06d}.npy"
+
+
+def _counts_paths(index_dir: Path, generation: int) -> tuple[Path, Path]:
+    return (
+        index_dir / f"dias-{generation:06d}.npy",
+        index_dir / f"contagens-{generation:06d}.npy",
+    )
+
+
+def load_event_index(index_dir: Path) -> dict[str, object] | None:
+    """Carrega o índice persistido; os segmentos de IDs são mapeados, não copiados."""
+    meta_path = index_dir / "meta.json"
+    if not meta_path.is_file():
+        return None
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    if (
+        meta.get("versao") != EVENT_INDEX_VERSION
+        or meta.get("esquema") != SCHEMA_VERSION
+    ):
+        return None
+    days_path, counts_path = _counts_paths(index_dir, int(meta["geracao"]))
+    return {
+        "meta": meta,
+        "segmentos": [
+            np.load(index_dir / name, mmap_mode="r") for name in meta["segmentos"]
+        ],
+        "dias": np.load(days_path),
+        "contagens": np.load(counts_path),
+    }
+
+
+def _write_meta(index_dir: Path, meta: dict[str, object]) -> None:
+    staging = index_dir / ".meta.json.tmp"
+    staging.write_text(
+        json.dumps(
+            {"versao": EVENT_INDEX_VERSION, "esquema": SCHEMA_VERSION, **meta},
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    staging.replace(index_dir / "meta.json")
+
+
+def save_event_index(
+    index_dir: Path,
+    ids: np.ndarray,
+    days: np.ndarray,
+    counts: np.ndarray,
+    meta: dict[str, object],
+) -> dict[str, object]:
+    """Grava um índice novo, com um único segmento, e o substitui por inteiro."""
+    staging = index_dir.with_name(f".{index_dir.name}.tmp")
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+    meta = {**meta, "geracao": 0, "segmentos": [_segment_path(staging, 0).name]}
+    np.save(_segment_path(staging, 0), ids, allow_pickle=False)
+    days_path, counts_path = _counts_paths(staging, 0)
+    np.save(days_path, days, allow_pickle=False)
+    np.save(counts_path, counts, allow_pickle=False)
+    _write_meta(staging, meta)
+    if index_dir.exists():
+        shutil.rmtree(index_dir)
+    staging.replace(index_dir)
+    return meta
+
+
+def _known_ids(segments: list[np.ndarray], candidates: np.ndarray) -> np.ndarray:
+    """Marca os candidatos já presentes em algum dos segmentos ordenados."""
+    known = np.zeros(len(candidates), dtype=bool)
+    for segment in segments:
+        positions = np.searchsorted(segment, candidates)
+        inside = positions < len(segment)
+        known[inside] |= segment[positions[inside]] == candidates[inside]
+    return known
+
+
+def _append_event_segment(
+    index_dir: Path,
+    index: dict[str, object],
+    new_ids: np.ndarray,
+    days: np.ndarray,
+    counts: np.ndarray,
+    meta: dict[str, object],
+) -> None:
+    """Acrescenta um segmento de IDs novos sem reescrever o histórico.
+
+    Os segmentos finais são fundidos enquanto o anterior não for maior que o
+    acumulado, o que mantém O(log n) segmentos e custo amortizado O(log n) por
+    identificador. ``meta.json`` é trocado por último e só então os arquivos
+    da geração anterior são removidos; uma interrupção deixa o índice antigo.
+    """
+    generation = int(meta["geracao"]) + 1
+    names = list(meta["segmentos"])
+    segments = list(index["segmentos"])
+    if len(new_ids):
+        merged = new_ids
+        while segments and len(segments[-1]) <= len(merged):
+            # Alarga a largura ``<U`` para não truncar IDs mais longos.
+            merged = np.sort(np.concatenate([segments.pop(), merged]))
+            names.pop()
+        np.save(_segment_path(index_dir, generation), merged, allow_pickle=False)
+        names.append(_segment_path(index_dir, generation).name)
+    days_path, counts_path = _counts_paths(index_dir, generation)
+    np.save(days_path, days, allow_pickle=False)
+    np.save(counts_path, counts, allow_pickle=False)
+    previous = int(meta["geracao"])
+    obsolete = set(meta["segmentos"]) - set(names)
+    meta.update(geracao=generation, segmentos=names)
+    # Libera os mapeamentos antes de remover arquivos, exigência do Windows.
+    segments.clear()
+    index.clear()
+    _write_meta(index_dir, meta)
+    for name in [*obsolete, *(path.name for path in _counts_paths(index_dir, previous))]:
+        (index_dir / name).unlink(missing_ok=True)
+
+
+def _rebuild_event_index(path: Path, index_dir: Path) -> dict[str, object]:
+    events, raw_rows = _read_unique_events(path)
+    ids = np.sort(events[EVENT_ID_COLUMN].to_numpy(dtype=str))
+    days, counts = _count_events_by_day(events)
+    offset = path.stat().st_size
+    meta: dict[str, object] = {
+        "fonte": path.name,
+        "cabecalho": _read_header(path),
+        "offset_bytes": offset,
+        "impressao_final": _tail_fingerprint(path, offset),
+        "sha256_encadeado": _range_sha256(path, 0, offset),
+        "linhas_entrada": raw_rows,
+        "deltas": [],
+    }
+    meta = save_event_index(index_dir, ids, days, counts, meta)
+    return {"meta": meta, "segmentos": [ids], "dias": days, "contagens": counts}
+
+
+def _source_was_only_appended(path: Path, meta: dict[str, object]) -> bool:
+    offset = int(meta["offset_bytes"])
+    return (
+        path.stat().st_size >= offset
+        and _read_header(path) == meta["cabecalho"]
+        and _tail_fingerprint(path, offset) == meta["impressao_final"]
+    )
+
+
+def _read_appended_rows(path: Path, meta: dict[str, object]) -> list[pd.DataFrame]:
+    """Lê apenas as linhas acrescentadas após o último offset indexado."""
+    offset = int(meta["offset_bytes"])
+    if path.stat().st_size == offset:
+        return []
+    names = next(csv_reader([str(meta["cabecalho"])]))
+    with path.open("rb") as stream:
+        stream.seek(offset)
+        return list(
+            iter_typed_csv(
+                stream,
+                ANEEL_SCHEMA,
+                [EVENT_ID_COLUMN, START_COLUMN],
+                chunksize=EVENT_CHUNK_ROWS,
+                names=names,
+            )
+        )
+
+
+def update_event_index(
+    path: Path,
+    index_dir: Path,
+    delta: Path | None = None,
+) -> tuple[pd.Series, int]:
+    """Atualiza o índice de eventos em tempo proporcional às linhas novas.
+
+    Sem ``delta``, lê somente o trecho acrescentado ao final de ``path`` desde a
+    última execução. Com ``delta``, incorpora um arquivo separado com cabeçalho
+    próprio; um ``delta`` cujo SHA-256 já foi incorporado é ignorado. Se a
+    fonte principal tiver sido reescrita em vez de estendida, o índice é
+    reconstruído integralmente.
+    """
+    index = load_event_index(index_dir)
+    if index is None or not _source_was_only_appended(path, index["meta"]):
+        if index is not None:
+            print("[AVISO] A fonte ANEEL foi reescrita; reconstruindo o índice.")
+        index = _rebuild_event_index(path, index_dir)
+        rebuilt = True
+    else:
+        rebuilt = False
+
+    meta = dict(index["meta"])
+    chunks: list[pd.DataFrame] = []
+    if delta is not None:
+        delta_digest = sha256(delta)
+        if any(entry["sha256"] == delta_digest for entry in meta["deltas"]):
+            print(f"[AVISO] {delta.name} já foi incorporado ao índice; ignorado.")
+        else:
+            chunks = list(
+                iter_typed_csv(
+                    delta,
+                    ANEEL_SCHEMA,
+                    [EVENT_ID_COLUMN, START_COLUMN],
+                    chunksize=EVENT_CHUNK_ROWS,
+                )
+            )
+            meta["deltas"] = [
+                *meta["deltas"],
+                {"arquivo": delta.name, "sha256": delta_digest},
+            ]
+            meta["sha256_encadeado"] = _chain_digest(
+                str(meta["sha256_encadeado"]), "delta", delta_digest
+            )
+    elif not rebuilt:
+        offset = int(meta["offset_bytes"])
+        size = path.stat().st_size
+        if size > offset:
+            chunks = _read_appended_rows(path, meta)
+            meta["sha256_encadeado"] = _chain_digest(
+                str(meta["sha256_encadeado"]), "trecho", _range_sha256(path, offset, size)
+            )
+            meta["offset_bytes"] = size
+            meta["impressao_final"] = _tail_fingerprint(path, size)
+
+    days, counts = index["dias"], index["contagens"]
+    new_ids = np.array([], dtype=str)
+    new_rows = sum(len(chunk) for chunk in chunks)
+    if new_rows:
+        events = _deduplicate_event_chunks(
+            [chunk.drop_duplicates(EVENT_ID_COLUMN) for chunk in chunks]
+        )
+        candidates = events[EVENT_ID_COLUMN].to_numpy(dtype=str)
+        events = events.loc[~_known_ids(index["segmentos"], candidates)]
+        if not events.empty:
+            new_ids = np.sort(events[EVENT_ID_COLUMN].to_numpy(dtype=str))
+            new_days, new_counts = _count_events_by_day(events)
+            days, counts = _merge_day_counts(days, counts, new_days, new_counts)
+        meta["linhas_entrada"] = int(meta["linhas_entrada"]) + new_rows
+    if new_rows or meta != index["meta"]:
+        _append_event_segment(index_dir, index, new_ids, days, counts, meta)
+
+    daily_counts = pd.Series(
+        counts,
+        index=pd.DatetimeIndex(days.astype("datetime64[ns]"), name="data"),
+        name="interrupcoes",
+    )
+    return daily_counts, int(meta["linhas_entrada"])
+
+
+def build_daily_target_from_counts(
+    counts: pd.Series,
+    *,
+    start: pd.Timestamp = START_DATE,
+    end: pd.Timestamp = END_DATE,
 ) -> tuple[pd.DataFrame, dict[str, int | float]]:
-    """Conta toda interrupção única por dia, sem filtrar a causa."""
-    events = events.copy()
-    events["data"] = events[START_COLUMN].dt.floor("D")
+    """Monta o alvo diário a partir de contagens já deduplicadas por dia."""
     daily = (
-        events.groupby("data")[EVENT_ID_COLUMN]
-        .nunique()
+        counts.reindex(pd.date_range(start, end, freq="D"), fill_value=0)
         .rename("interrupcoes")
-        .reindex(pd.date_range(START_DATE, END_DATE, freq="D"), fill_value=0)
         .rename_axis("data")
         .reset_index()
     )
     daily["interrupcoes"] = daily["interrupcoes"].astype(int)
 
     summary: dict[str, int | float] = {
-        "eventos_unicos": int(len(events)),
+        "eventos_unicos": int(daily["interrupcoes"].sum()),
         "dias": int(len(daily)),
         "dias_sem_interrupcao": int((daily["interrupcoes"] == 0).sum()),
         "media_diaria": float(daily["interrupcoes"].mean()),
@@ -121,7 +792,25 @@ def build_daily_target(
     return daily, summary
 
 
-def find_inmet_a001_files(directory: Path) -> list[Path]:
+def build_daily_target(
+    events: pd.DataFrame,
+    *,
+    start: pd.Timestamp = START_DATE,
+    end: pd.Timestamp = END_DATE,
+) -> tuple[pd.DataFrame, dict[str, int | float]]:
+    """Conta toda interrupção única por dia, sem filtrar a causa."""
+    events = events.copy()
+    events["data"] = events[START_COLUMN].dt.floor("D")
+    counts = events.groupby("data")[EVENT_ID_COLUMN].nunique()
+    return build_daily_target_from_counts(counts, start=start, end=end)
+
+
+def find_inmet_a001_files(
+    directory: Path,
+    *,
+    start: pd.Timestamp = START_DATE,
+    end: pd.Timestamp = END_DATE,
+) -> list[Path]:
     """Seleciona exatamente um arquivo da estação A001 para cada ano."""
     candidates = sorted(directory.rglob("*A001_BRASILIA*.CSV"))
     by_year: dict[int, list[Path]] = {}
@@ -130,7 +819,7 @@ def find_inmet_a001_files(directory: Path) -> list[Path]:
         if match and path.parent.name == match.group(1):
             by_year.setdefault(int(match.group(1)), []).append(path)
 
-    expected = set(range(START_DATE.year, END_DATE.year + 1))
+    expected = set(range(start.year, end.year + 1))
     missing = sorted(expected - set(by_year))
     duplicated = {year: paths for year, paths in by_year.items() if len(paths) != 1}
     if missing or duplicated:
@@ -144,14 +833,60 @@ def find_inmet_a001_files(directory: Path) -> list[Path]:
     return [by_year[year][0] for year in sorted(expected)]
 
 
-def _deduplicate_hourly_weather(hourly: pd.DataFrame) -> pd.DataFrame:
+def find_inmet_station_files(
+    directory: Path,
+    uf: str = "DF",
+    *,
+    start: pd.Timestamp = START_DATE,
+    end: pd.Timestamp = END_DATE,
+) -> dict[str, list[Path]]:
+    """Descobre os arquivos anuais de todas as estações da unidade federativa.
+
+    Diferentemente de ``find_inmet_a001_files``, anos ausentes são aceitos,
+    pois as estações foram instaladas em datas diferentes; cada ano do período
+    deve ter no máximo um arquivo por estação.
+    """
+    by_station: dict[str, dict[int, list[Path]]] = {}
+    for path in sorted(directory.rglob("*.CSV")):
+        match = INMET_FILE_PATTERN.search(path.name)
+        if not match or match.group("uf") != uf or path.parent.name != match.group("ano"):
+            continue
+        year = int(match.group("ano"))
+        if start.year <= year <= end.year:
+            by_station.setdefault(match.group("estacao"), {}).setdefault(
+                year, []
+            ).append(path)
+
+    duplicated = {
+        f"{station}/{year}": [path.name for path in paths]
+        for station, years in by_station.items()
+        for year, paths in years.items()
+        if len(paths) != 1
+    }
+    if duplicated:
+        raise FileNotFoundError(
+            "Arquivos INMET inválidos: estações/anos com mais de um arquivo="
+            f"{duplicated}"
+        )
+    if not by_station:
+        raise FileNotFoundError(f"Nenhum arquivo INMET da UF {uf} em {directory}.")
+    return {
+        station: [years[year][0] for year in sorted(years)]
+        for station, years in sorted(by_station.items())
+    }
+
+
+def _deduplicate_hourly_weather(
+    hourly: pd.DataFrame,
+    key: list[str] = HOURLY_KEY,
+) -> pd.DataFrame:
     """Remove cópias idênticas e recusa duplicatas horárias conflitantes."""
-    duplicated = hourly.loc[hourly.duplicated(HOURLY_KEY, keep=False)]
+    duplicated = hourly.loc[hourly.duplicated(key, keep=False)]
     if duplicated.empty:
         return hourly
 
     conflicts = (
-        duplicated.groupby(HOURLY_KEY, dropna=False)[INMET_VALUE_COLUMNS]
+        duplicated.groupby(key, dropna=False, observed=True)[INMET_VALUE_COLUMNS]
         .nunique(dropna=False)
         .gt(1)
         .any(axis=1)
@@ -162,24 +897,173 @@ def _deduplicate_hourly_weather(hourly: pd.DataFrame) -> pd.DataFrame:
             "A fonte INMET contém duplicatas conflitantes para data/hora; "
             f"exemplos={examples}"
         )
-    return hourly.drop_duplicates(HOURLY_KEY, keep="first")
+    return hourly.drop_duplicates(key, keep="first")
+
 
+def read_inmet_hourly(
+    path: Path,
+    cache_dir: Path | None = None,
+    digest: str | None = None,
+    parse_stats: dict[str, object] | None = None,
+) -> pd.DataFrame:
+    """Lê um arquivo horário do INMET com datas e valores já convertidos.
 
-def build_daily_weather(paths: list[Path]) -> pd.DataFrame:
+    Com ``cache_dir`` e o ``digest`` SHA-256 do arquivo, reutiliza as colunas
+    binárias gravadas por uma execução anterior. ``parse_stats`` recebe a vazão
+    da leitura do CSV ou ``motor="cache"``.
+    """
+    entry = None
+    if cache_dir is not None and digest is not None:
+        entry = _cache_entry(cache_dir, "inmet", digest)
+        cached = load_cached_columns(entry)
+        if cached is not None:
+            if parse_stats is not None:
+                parse_stats.update({"esquema": SCHEMA_VERSION, "motor": "cache"})
+            return pd.DataFrame(cached[0])
+
+    started = time.perf_counter()
+    hourly = read_typed_csv(path, INMET_SCHEMA, INMET_COLUMNS)[INMET_COLUMNS]
+    hourly["data"] = parse_datetimes(hourly["data"], INMET_SCHEMA)
+    if hourly[HOURLY_KEY].isna().any().any():
+        raise ValueError("A fonte INMET contém data ou hora inválida.")
+    if parse_stats is not None:
+        parse_stats.update(
+            parse_throughput(len(hourly), path.stat().st_size, started, csv_engine())
+        )
+
+    if entry is not None:
+        columns = {
+            "data": hourly["data"].to_numpy(),
+            "hora_utc": hourly["hora_utc"].to_numpy(dtype=str),
+        }
+        columns.update(
+            {
+                column: hourly[column].to_numpy(dtype=np.float64)
+                for column in INMET_VALUE_COLUMNS
+            }
+        )
+        save_cached_columns(entry, columns, {"fonte": path.name})
+    return hourly
+
+
+def _daily_weather_for_file(
+    path: Path,
+    cache_dir: Path | None,
+    digest: str | None,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+) -> tuple[pd.DataFrame, dict[str, object]]:
+    parse_stats: dict[str, object] = {}
+    hourly = read_inmet_hourly(path, cache_dir, digest, parse_stats)
+    return aggregate_hourly_weather(hourly, start=start, end=end), parse_stats
+
+
+def build_daily_weather(
+    paths: list[Path],
+    cache_dir: Path | None = None,
+    digests: dict[Path, str] | None = None,
+    workers: int = 1,
+    parse_stats: dict[Path, dict[str, object]] | None = None,
+    *,
+    start: pd.Timestamp = START_DATE,
+    end: pd.Timestamp = END_DATE,
+) -> pd.DataFrame:
+    """Agrega os arquivos horários do INMET em uma série diária.
+
+    Com ``workers > 1``, cada arquivo anual é lido, limpo e agregado em um
+    processo separado, e apenas as linhas diárias são reunidas. Nesse modo as
+    duplicatas horárias só são comparadas dentro de cada arquivo; uma data
+    presente em mais de um arquivo é recusada. ``parse_stats`` recebe a vazão
+    da leitura de cada arquivo.
+    """
     if not paths:
         raise ValueError("Nenhum arquivo INMET foi informado.")
 
-    frames = [pd.read_csv(path, usecols=INMET_COLUMNS) for path in paths]
+    digests = digests or {}
+    parse_stats = {} if parse_stats is None else parse_stats
+    if workers <= 1 or len(paths) == 1:
+        frames = [
+            read_inmet_hourly(
+                path, cache_dir, digests.get(path), parse_stats.setdefault(path, {})
+            )
+            for path in paths
+        ]
+        hourly = pd.concat(frames, ignore_index=True)
+        return aggregate_hourly_weather(hourly, start=start, end=end)
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        results = list(
+            executor.map(
+                _daily_weather_for_file,
+                paths,
+                [cache_dir] * len(paths),
+                [digests.get(path) for path in paths],
+                [start] * len(paths),
+                [end] * len(paths),
+            )
+        )
+    frames = []
+    for path, (frame, stats) in zip(paths, results):
+        frames.append(frame)
+        parse_stats[path] = stats
+    daily = pd.concat(frames, ignore_index=True)
+    repeated = daily.loc[daily["data"].duplicated(), "data"]
+    if not repeated.empty:
+        examples = [str(value.date()) for value in repeated.iloc[:5]]
+        raise ValueError(
+            "Datas presentes em mais de um arquivo INMET não podem ser agregadas "
+            f"em paralelo; exemplos={examples}"
+        )
+    return daily.sort_values("data", ignore_index=True)
+
+
+def build_daily_weather_stations(
+    files_by_station: dict[str, list[Path]],
+    cache_dir: Path | None = None,
+    digests: dict[Path, str] | None = None,
+    *,
+    start: pd.Timestamp = START_DATE,
+    end: pd.Timestamp = END_DATE,
+) -> pd.DataFrame:
+    """Agrega todas as estações em uma única passada agrupada por estação e data.
+
+    Devolve uma tabela longa com a coluna ``estacao`` antes das colunas de
+    ``build_daily_weather``.
+    """
+    if not files_by_station:
+        raise ValueError("Nenhum arquivo INMET foi informado.")
+
+    digests = digests or {}
+    frames = [
+        read_inmet_hourly(path, cache_dir, digests.get(path)).assign(
+            **{STATION_COLUMN: station}
+        )
+        for station, paths in files_by_station.items()
+        for path in paths
+    ]
     hourly = pd.concat(frames, ignore_index=True)
-    hourly["data"] = pd.to_datetime(hourly["data"], errors="coerce")
-    if hourly[HOURLY_KEY].isna().any().any():
-        raise ValueError("A fonte INMET contém data ou hora inválida.")
+    hourly[STATION_COLUMN] = hourly[STATION_COLUMN].astype("category")
+    daily = aggregate_hourly_weather(
+        hourly, group_keys=[STATION_COLUMN, "data"], start=start, end=end
+    )
+    daily[STATION_COLUMN] = daily[STATION_COLUMN].astype(str)
+    return daily
 
-    for column in INMET_VALUE_COLUMNS:
-        hourly[column] = pd.to_numeric(hourly[column], errors="coerce")
 
-    hourly = hourly.loc[hourly["data"].between(START_DATE, END_DATE)].copy()
-    hourly = _deduplicate_hourly_weather(hourly)
+def clean_hourly_weather(
+    hourly: pd.DataFrame,
+    extra_keys: list[str] | None = None,
+    *,
+    start: pd.Timestamp = START_DATE,
+    end: pd.Timestamp = END_DATE,
+) -> pd.DataFrame:
+    """Recorta o período, remove duplicatas e anula valores fora da faixa física.
+
+    ``extra_keys`` (por exemplo, a estação) precede ``data``/``hora_utc`` na
+    chave de unicidade.
+    """
+    hourly = hourly.loc[hourly["data"].between(start, end)].copy()
+    hourly = _deduplicate_hourly_weather(hourly, [*(extra_keys or []), *HOURLY_KEY])
 
     for column in INMET_VALUE_COLUMNS:
         hourly.loc[hourly[column] <= -999, column] = np.nan
@@ -191,11 +1075,45 @@ def build_daily_weather(paths: list[Path]) -> pd.DataFrame:
         hourly.loc[hourly[column] < 0, column] = np.nan
     direction = "vento_direcao_horaria_gr"
     hourly.loc[~hourly[direction].between(0, 360), direction] = np.nan
+    return hourly
+
+
+def hourly_weather_moments(hourly: pd.DataFrame) -> pd.DataFrame:
+    """Converte ``data``/``hora_utc`` em instantes no horário local (UTC-3)."""
+    hours = (
+        hourly["hora_utc"]
+        .astype(str)
+        .str.replace(r"\D", "", regex=True)
+        .str.zfill(4)
+        .str[:2]
+        .astype(int)
+    )
+    moments = hourly["data"] + pd.to_timedelta(hours, unit="h") + LOCAL_UTC_OFFSET
+    return pd.concat(
+        [moments.rename("momento"), hourly[INMET_VALUE_COLUMNS]], axis=1
+    ).reset_index(drop=True)
 
+
+def aggregate_hourly_weather(
+    hourly: pd.DataFrame,
+    group_keys: list[str] | None = None,
+    *,
+    start: pd.Timestamp = START_DATE,
+    end: pd.Timestamp = END_DATE,
+) -> pd.DataFrame:
+    """Limpa os registros horários do período e os agrega por dia.
+
+    ``group_keys`` termina sempre em ``data``; chaves anteriores, como a
+    estação, são preservadas na saída.
+    """
+    group_keys = group_keys or ["data"]
+    hourly = clean_hourly_weather(hourly, group_keys[:-1], start=start, end=end)
+
+    direction = "vento_direcao_horaria_gr"
     radians = np.deg2rad(hourly[direction] % 360.0)
     hourly["_dir_sin"] = np.sin(radians)
     hourly["_dir_cos"] = np.cos(radians)
-    grouped = hourly.groupby("data", sort=True)
+    grouped = hourly.groupby(group_keys, sort=True, observed=True)
     daily = grouped.agg(
         temperatura_media=("temperatura_ar_bulbo_seco_c", "mean"),
         vento_velocidade_media_ms=("vento_velocidade_horaria_ms", "mean"),
@@ -224,50 +1142,216 @@ def build_daily_weather(paths: list[Path]) -> pd.DataFrame:
         % 360.0
     )
     daily = daily.drop(columns=["_dir_sin", "_dir_cos"]).reset_index()
-    return daily[
-        [
-            "data",
-            "temperatura_media",
-            "precipitacao_total_mm",
-            "vento_velocidade_media_ms",
-            "vento_velocidade_max_ms",
-            "vento_rajada_max_ms",
-            "vento_direcao_media_circular_gr",
-            "vento_dir_sin",
-            "vento_dir_cos",
-            "n_registros",
-        ]
-    ]
+    return daily[[*group_keys, *DAILY_WEATHER_COLUMNS]]
+
+
+def _build_target(
+    interruption_csv: Path,
+    output_dir: Path,
+    digest: str | None,
+    *,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    incremental: bool,
+    delta: Path | None,
+    event_index_dir: Path | None,
+    cache_dir: Path | None,
+    memory_budget_mb: float | None,
+    spill_dir: Path | None,
+    parse_stats: dict[str, object] | None = None,
+) -> tuple[pd.DataFrame, dict[str, int | float], int, pd.DataFrame | None, dict]:
+    """Lê a ANEEL no modo escolhido e devolve o alvo diário de ``start`` a ``end``.
+
+    Os eventos individuais só são devolvidos na leitura completa; os modos
+    incremental e de memória limitada trabalham apenas com contagens diárias.
+    ``parse_stats`` recebe a vazão da leitura completa ou limitada.
+    """
+    bounded_stats: dict[str, object] = {}
+    if incremental:
+        index_dir = event_index_dir or output_dir / EVENT_INDEX_DIRNAME
+        counts, raw_rows = update_event_index(interruption_csv, index_dir, delta)
+        target, summary = build_daily_target_from_counts(counts, start=start, end=end)
+        return target, summary, raw_rows, None, bounded_stats
+    if memory_budget_mb is not None:
+        counts, raw_rows, bounded_stats = count_unique_events_bounded(
+            interruption_csv, memory_budget_mb, spill_dir, parse_stats
+        )
+        target, summary = build_daily_target_from_counts(counts, start=start, end=end)
+        return target, summary, raw_rows, None, bounded_stats
+
+    events, raw_rows = load_unique_interruption_events(
+        interruption_csv, cache_dir, digest, parse_stats, start=start, end=end
+    )
+    target, summary = build_daily_target(events, start=start, end=end)
+    return target, summary, raw_rows, events, bounded_stats
+
+
+def _validate_reading_modes(
+    incremental: bool,
+    memory_budget_mb: float | None,
+    hourly: bool = False,
+) -> None:
+    if incremental and memory_budget_mb is not None:
+        raise ValueError(
+            "O modo incremental e o orçamento de memória não podem ser combinados."
+        )
+    if hourly and (incremental or memory_budget_mb is not None):
+        raise ValueError(
+            "A base horária exige os eventos individuais; use a leitura completa."
+        )
+
+
+def _station_table(
+    stations: list[str],
+    target: pd.DataFrame,
+    station_weather: pd.DataFrame,
+) -> pd.DataFrame:
+    """Uma linha por estação e dia do alvo; dias sem medição ficam vazios."""
+    grid = pd.MultiIndex.from_product(
+        [stations, target["data"]],
+        names=[STATION_COLUMN, "data"],
+    ).to_frame(index=False)
+    return (
+        grid.merge(target, on="data")
+        .merge(
+            station_weather,
+            on=[STATION_COLUMN, "data"],
+            how="left",
+            validate="one_to_one",
+        )
+        .drop(columns=["vento_direcao_media_circular_gr"])
+    )
 
 
 def build_base(
     interruption_csv: Path,
     inmet_dir: Path,
     output_dir: Path,
+    *,
+    start: pd.Timestamp = START_DATE,
+    end: pd.Timestamp = END_DATE,
+    incremental: bool = False,
+    delta: Path | None = None,
+    event_index_dir: Path | None = None,
+    cache_dir: Path | None = None,
+    no_cache: bool = False,
+    cache_keep: int = SOURCE_CACHE_KEEP,
+    workers: int = 1,
+    memory_budget_mb: float | None = None,
+    spill_dir: Path | None = None,
+    verify_hashes: bool = False,
+    all_stations: bool = False,
+    hourly: bool = False,
 ) -> dict[str, object]:
+    incremental = incremental or delta is not None
+    _validate_reading_modes(incremental, memory_budget_mb, hourly)
     output_dir.mkdir(parents=True, exist_ok=True)
-    events, raw_rows = load_unique_interruption_events(interruption_csv)
-    target, target_summary = build_daily_target(events)
-    inmet_files = find_inmet_a001_files(inmet_dir)
-    weather = build_daily_weather(inmet_files)
+    cache_dir = None if no_cache else cache_dir or output_dir / CACHE_DIRNAME
+    hash_cache_path = output_dir / HASH_CACHE_FILENAME
+    hash_cache = load_hash_cache(hash_cache_path)
+    # No modo incremental, o hash vem do índice e cobre só os bytes novos.
+    interruption_digest = (
+        None
+        if incremental and not verify_hashes
+        else cached_sha256(interruption_csv, hash_cache, verify_hashes)
+    )
+    interruption_reading: dict[str, object] = {}
+    inmet_reading: dict[Path, dict[str, object]] = {}
+    target, target_summary, raw_rows, events, bounded_stats = _build_target(
+        interruption_csv,
+        output_dir,
+        interruption_digest,
+        start=start,
+        end=end,
+        incremental=incremental,
+        delta=delta,
+        event_index_dir=event_index_dir,
+        cache_dir=cache_dir,
+        memory_budget_mb=memory_budget_mb,
+        spill_dir=spill_dir,
+        parse_stats=interruption_reading,
+    )
+    chained = interruption_digest is None
+    if chained:
+        interruption_digest = event_index_digest(
+            event_index_dir or output_dir / EVENT_INDEX_DIRNAME
+        )
+    inmet_files = find_inmet_a001_files(inmet_dir, start=start, end=end)
+    inmet_digests = {
+        path: cached_sha256(path, hash_cache, verify_hashes) for path in inmet_files
+    }
+    station_files: dict[str, list[Path]] = {}
+    if all_stations:
+        station_files = find_inmet_station_files(inmet_dir, start=start, end=end)
+        for paths in station_files.values():
+            inmet_digests.update(
+                {
+                    path: inmet_digests.get(path)
+                    or cached_sha256(path, hash_cache, verify_hashes)
+                    for path in paths
+                }
+            )
+    save_hash_cache(hash_cache_path, hash_cache)
+    weather = build_daily_weather(
+        inmet_files,
+        cache_dir,
+        inmet_digests,
+        workers,
+        inmet_reading,
+        start=start,
+        end=end,
+    )
 
     base = target.merge(weather, on="data", how="left", validate="one_to_one")
-    expected_days = (END_DATE - START_DATE).days + 1
+    expected_days = (end - start).days + 1
     if len(base) != expected_days:
         raise ValueError(f"Esperados {expected_days} dias; obtidos {len(base)}.")
 
-    weather_path = output_dir / "vento_diario_brasilia.csv"
-    base_path = output_dir / "base_diaria_interrupcoes_clima_vento.csv"
-    manifest_path = output_dir / "manifesto_fontes_padronizadas.json"
+    weather_path = output_dir / WEATHER_FILENAME
+    base_path = output_dir / BASE_FILENAME
+    manifest_path = output_dir / MANIFEST_FILENAME
     weather.to_csv(weather_path, index=False)
     base.drop(columns=["vento_direcao_media_circular_gr"]).to_csv(
         base_path,
         index=False,
     )
 
+    outputs = [base_path.name, weather_path.name]
+    if hourly:
+        hourly_weather = clean_hourly_weather(
+            pd.concat(
+                [
+                    read_inmet_hourly(path, cache_dir, inmet_digests[path])
+                    for path in inmet_files
+                ],
+                ignore_index=True,
+            ),
+            start=start,
+            end=end,
+        )
+        hourly_dir = write_hourly_base(
+            output_dir / HOURLY_BASE_DIRNAME,
+            events[START_COLUMN],
+            hourly_weather_moments(hourly_weather),
+            start,
+            end,
+        )
+        outputs.append(f"{hourly_dir.name}/")
+    if station_files:
+        stations_path = output_dir / STATIONS_FILENAME
+        station_weather = build_daily_weather_stations(
+            station_files, cache_dir, inmet_digests, start=start, end=end
+        )
+        _station_table(list(station_files), target, station_weather).to_csv(
+            stations_path,
+            index=False,
+        )
+        outputs.append(stations_path.name)
+
     manifest: dict[str, object] = {
         "formato_entrada": "arquivos oficiais previamente padronizados",
-        "periodo": {"inicio": str(START_DATE.date()), "fim": str(END_DATE.date())},
+        "periodo": {"inicio": str(start.date()), "fim": str(end.date())},
+        "verificacao_hashes": "completa" if verify_hashes else "metadados",
         "alvo": {
             "definicao": "total diario de interrupcoes unicas da ANEEL",
             "filtro_por_causa": False,
@@ -275,36 +1359,446 @@ def build_base(
         },
         "interrupcoes": {
             "arquivo": interruption_csv.name,
-            "sha256": sha256(interruption_csv),
+            "sha256": interruption_digest,
+            **({"sha256_modo": "encadeado"} if chained else {}),
             "linhas_entrada": raw_rows,
             **target_summary,
+            **({"delta": delta.name} if delta is not None else {}),
+            **({"memoria_limitada": bounded_stats} if bounded_stats else {}),
+            **({"leitura": interruption_reading} if interruption_reading else {}),
         },
         "inmet": [
-            {"arquivo": path.name, "sha256": sha256(path)} for path in inmet_files
+            {
+                "arquivo": path.name,
+                "sha256": inmet_digests[path],
+                "leitura": inmet_reading[path],
+            }
+            for path in inmet_files
         ],
-        "saidas": [base_path.name, weather_path.name],
+        **(
+            {
+                "inmet_estacoes": [
+                    {
+                        STATION_COLUMN: station,
+                        "arquivo": path.name,
+                        "sha256": inmet_digests[path],
+                    }
+                    for station, paths in station_files.items()
+                    for path in paths
+                ]
+            }
+            if station_files
+            else {}
+        ),
+        "saidas": outputs,
     }
     manifest_path.write_text(
         json.dumps(manifest, indent=2, ensure_ascii=False),
         encoding="utf-8",
     )
+    _report_source_cache_pruning(cache_dir, cache_keep)
     return manifest
 
 
+def _validate_seam(
+    existing: pd.DataFrame,
+    appended: pd.DataFrame,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    name: str,
+    complete: bool = True,
+) -> None:
+    """Exige as mesmas colunas e datas crescentes, sem sobreposição, na emenda.
+
+    Com ``complete`` as novas datas devem cobrir todo o intervalo; o clima
+    diário, que omite dias sem medição, só precisa ficar dentro dele.
+    """
+    if list(appended.columns) != list(existing.columns):
+        raise ValueError(
+            f"As colunas novas de {name} não coincidem com as existentes: "
+            f"{list(appended.columns)} != {list(existing.columns)}"
+        )
+    dates = pd.DatetimeIndex(appended["data"])
+    if complete:
+        contiguous = dates.equals(pd.date_range(start, end, freq="D"))
+    else:
+        contiguous = (
+            dates.is_monotonic_increasing
+            and dates.is_unique
+            and (dates.empty or (dates[0] >= start and dates[-1] <= end))
+        )
+    if not contiguous or (not existing.empty and existing["data"].max() >= start):
+        raise ValueError(f"As datas acrescentadas a {name} não são contíguas à base.")
+
+
+def append_base(
+    interruption_csv: Path,
+    inmet_dir: Path,
+    output_dir: Path,
+    *,
+    end: pd.Timestamp = END_DATE,
+    incremental: bool = False,
+    delta: Path | None = None,
+    event_index_dir: Path | None = None,
+    cache_dir: Path | None = None,
+    no_cache: bool = False,
+    cache_keep: int = SOURCE_CACHE_KEEP,
+    workers: int = 1,
+    memory_budget_mb: float | None = None,
+    spill_dir: Path | None = None,
+    verify_hashes: bool = False,
+) -> dict[str, object]:
+    """Acrescenta à base e ao clima diário apenas as datas após a última gravada.
+
+    Somente os arquivos INMET dos anos novos são localizados e resumidos; as
+    linhas existentes não são regravadas. A base horária e o clima por
+    estação, quando presentes, são estendidos até a mesma data. O intervalo
+    acrescentado fica registrado em ``anexacoes`` no manifesto.
+    """
+    incremental = incremental or delta is not None
+    base_path = output_dir / BASE_FILENAME
+    weather_path = output_dir / WEATHER_FILENAME
+    manifest_path = output_dir / MANIFEST_FILENAME
+    hourly_dir = output_dir / HOURLY_BASE_DIRNAME
+    stations_path = output_dir / STATIONS_FILENAME
+    _validate_reading_modes(incremental, memory_budget_mb, hourly_dir.is_dir())
+    for path in (base_path, weather_path, manifest_path):
+        if not path.is_file():
+            raise FileNotFoundError(f"Base existente não encontrada: {path}")
+
+    existing_base = pd.read_csv(base_path, parse_dates=["data"])
+    existing_weather = pd.read_csv(weather_path, parse_dates=["data"])
+    last_date = existing_base["data"].max()
+    if existing_weather["data"].max() > last_date:
+        raise ValueError(f"{WEATHER_FILENAME} vai além da última data de {BASE_FILENAME}.")
+    if existing_base["data"].diff().dropna().ne(pd.Timedelta(days=1)).any():
+        raise ValueError(f"{BASE_FILENAME} contém lacunas ou datas fora de ordem.")
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    start = last_date + pd.Timedelta(days=1)
+    if start > end:
+        print(f"[OK] A base já cobre até {last_date.date()}; nada a acrescentar.")
+        return manifest
+
+    cache_dir = None if no_cache else cache_dir or output_dir / CACHE_DIRNAME
+    hash_cache_path = output_dir / HASH_CACHE_FILENAME
+    hash_cache = load_hash_cache(hash_cache_path)
+    # No modo incremental, o hash vem do índice e cobre só os bytes novos.
+    interruption_digest = (
+        None
+        if incremental and not verify_hashes
+        else cached_sha256(interruption_csv, hash_cache, verify_hashes)
+    )
+    interruption_reading: dict[str, object] = {}
+    inmet_reading: dict[Path, dict[str, object]] = {}
+    target, _, raw_rows, events, bounded_stats = _build_target(
+        interruption_csv,
+        output_dir,
+        interruption_digest,
+        start=start,
+        end=end,
+        incremental=incremental,
+        delta=delta,
+        event_index_dir=event_index_dir,
+        cache_dir=cache_dir,
+        memory_budget_mb=memory_budget_mb,
+        spill_dir=spill_dir,
+        parse_stats=interruption_reading,
+    )
+    chained = interruption_digest is None
+    if chained:
+        interruption_digest = event_index_digest(
+            event_index_dir or output_dir / EVENT_INDEX_DIRNAME
+        )
+    inmet_files = find_inmet_a001_files(inmet_dir, start=start, end=end)
+    inmet_digests = {
+        path: cached_sha256(path, hash_cache, verify_hashes) for path in inmet_files
+    }
+    station_files: dict[str, list[Path]] = {}
+    if stations_path.is_file():
+        station_files = find_inmet_station_files(inmet_dir, start=start, end=end)
+        for paths in station_files.values():
+            inmet_digests.update(
+                {
+                    path: inmet_digests.get(path)
+                    or cached_sha256(path, hash_cache, verify_hashes)
+                    for path in paths
+                }
+            )
+    save_hash_cache(hash_cache_path, hash_cache)
+    weather = build_daily_weather(
+        inmet_files,
+        cache_dir,
+        inmet_digests,
+        workers,
+        inmet_reading,
+        start=start,
+        end=end,
+    )
+    base = target.merge(weather, on="data", how="left", validate="one_to_one").drop(
+        columns=["vento_direcao_media_circular_gr"]
+    )
+    _validate_seam(existing_base, base, start, end, BASE_FILENAME)
+    _validate_seam(
+        existing_weather, weather, start, end, WEATHER_FILENAME, complete=False
+    )
+    stations = None
+    if station_files:
+        stations = _append_station_rows(
+            pd.read_csv(stations_path, parse_dates=["data"], dtype={STATION_COLUMN: str}),
+            existing_base[target.columns],
+            target,
+            station_files,
+            build_daily_weather_stations(
+                station_files, cache_dir, inmet_digests, start=start, end=end
+            ),
+        )
+    base.to_csv(base_path, mode="a", header=False, index=False)
+    weather.to_csv(weather_path, mode="a", header=False, index=False)
+    if stations is not None:
+        stations.to_csv(stations_path, index=False)
+    if hourly_dir.is_dir():
+        hourly_weather = clean_hourly_weather(
+            pd.concat(
+                [
+                    read_inmet_hourly(path, cache_dir, inmet_digests[path])
+                    for path in inmet_files
+                ],
+                ignore_index=True,
+            ),
+            start=start,
+            end=end,
+        )
+        append_hourly_base(
+            hourly_dir,
+            events[START_COLUMN],
+            hourly_weather_moments(hourly_weather),
+            end,
+        )
+
+    period_start = pd.Timestamp(manifest["periodo"]["inicio"])
+    full_counts = pd.concat([existing_base, base]).set_index("data")["interrupcoes"]
+    _, summary = build_daily_target_from_counts(full_counts, start=period_start, end=end)
+    manifest["periodo"]["fim"] = str(end.date())
+    manifest["verificacao_hashes"] = "completa" if verify_hashes else "metadados"
+    manifest["interrupcoes"].update(
+        {
+            "arquivo": interruption_csv.name,
+            "sha256": interruption_digest,
+            **({"sha256_modo": "encadeado"} if chained else {}),
+            "linhas_entrada": raw_rows,
+            **summary,
+            **({"leitura": interruption_reading} if interruption_reading else {}),
+        }
+    )
+    inmet_entries = {entry["arquivo"]: entry for entry in manifest["inmet"]}
+    for path in inmet_files:
+        inmet_entries[path.name] = {
+            "arquivo": path.name,
+            "sha256": inmet_digests[path],
+            "leitura": inmet_reading[path],
+        }
+    manifest["inmet"] = [inmet_entries[name] for name in sorted(inmet_entries)]
+    if station_files:
+        station_entries = {
+            (entry[STATION_COLUMN], entry["arquivo"]): entry
+            for entry in manifest.get("inmet_estacoes", [])
+        }
+        for station, paths in station_files.items():
+            for path in paths:
+                station_entries[station, path.name] = {
+                    STATION_COLUMN: station,
+                    "arquivo": path.name,
+                    "sha256": inmet_digests[path],
+                }
+        manifest["inmet_estacoes"] = list(station_entries.values())
+    manifest.setdefault("anexacoes", []).append(
+        {
+            "inicio": str(start.date()),
+            "fim": str(end.date()),
+            "dias": int(len(base)),
+            "interrupcoes_sha256": interruption_digest,
+            "inmet": [path.name for path in inmet_files],
+            **({"delta": delta.name} if delta is not None else {}),
+            **({"memoria_limitada": bounded_stats} if bounded_stats else {}),
+        }
+    )
+    manifest_path.write_text(
+        json.dumps(manifest, indent=2, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    _report_source_cache_pruning(cache_dir, cache_keep)
+    return manifest
+
+
+def _append_station_rows(
+    existing: pd.DataFrame,
+    existing_target: pd.DataFrame,
+    target: pd.DataFrame,
+    station_files: dict[str, list[Path]],
+    station_weather: pd.DataFrame,
+) -> pd.DataFrame:
+    """Clima por estação com os dias novos, na ordem de uma gravação completa.
+
+    Estações que só aparecem nos anos novos recebem também os dias antigos,
+    sem medição, como aconteceria ao montar a tabela do período inteiro.
+    """
+    known = set(existing[STATION_COLUMN])
+    stations = list(dict.fromkeys([*existing[STATION_COLUMN], *station_files]))
+    appended = _station_table(stations, target, station_weather)
+    if list(appended.columns) != list(existing.columns):
+        raise ValueError(
+            f"As colunas novas de {STATIONS_FILENAME} não coincidem com as existentes: "
+            f"{list(appended.columns)} != {list(existing.columns)}"
+        )
+    earlier = _station_table(
+        [station for station in stations if station not in known],
+        existing_target,
+        station_weather,
+    )
+    order = {station: position for position, station in enumerate(stations)}
+    frames = [frame for frame in (existing, earlier, appended) if not frame.empty]
+    return pd.concat(frames, ignore_index=True).sort_values(
+        [STATION_COLUMN, "data"],
+        key=lambda column: column.map(order) if column.name == STATION_COLUMN else column,
+        kind="stable",
+        ignore_index=True,
+    )
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--interruptions", type=Path, default=DEFAULT_INTERRUPTION_CSV)
     parser.add_argument("--inmet-dir", type=Path, default=DEFAULT_INMET_DIR)
     parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument(
+        "--start",
+        type=pd.Timestamp,
+        default=START_DATE,
+        help=f"primeiro dia da base (padrão: {START_DATE.date()}; ignorado com --append)",
+    )
+    parser.add_argument(
+        "--end",
+        type=pd.Timestamp,
+        default=END_DATE,
+        help=f"último dia da base (padrão: {END_DATE.date()})",
+    )
+    parser.add_argument(
+        "--append",
+        action="store_true",
+        help="acrescenta somente as datas posteriores à base existente em --output-dir",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="usa o índice persistido de eventos e lê somente as linhas novas",
+    )
+    parser.add_argument(
+        "--delta",
+        type=Path,
+        help="arquivo ANEEL adicional a incorporar ao índice (implica --incremental)",
+    )
+    parser.add_argument(
+        "--event-index-dir",
+        type=Path,
+        help=f"diretório do índice (padrão: <output-dir>/{EVENT_INDEX_DIRNAME})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help=f"cache binário por SHA-256 (padrão: <output-dir>/{CACHE_DIRNAME})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="sempre relê os CSVs, sem consultar nem gravar o cache binário",
+    )
+    parser.add_argument(
+        "--cache-keep",
+        type=int,
+        default=SOURCE_CACHE_KEEP,
+        help="versões mantidas no cache para cada arquivo de origem "
+        f"(padrão: {SOURCE_CACHE_KEEP})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processos para ler e agregar os arquivos anuais do INMET em paralelo",
+    )
+    parser.add_argument(
+        "--memory-budget-mb",
+        type=float,
+        help="deduplica a ANEEL em partições no disco sem exceder este orçamento",
+    )
+    parser.add_argument(
+        "--spill-dir",
+        type=Path,
+        help="diretório para as partições temporárias (padrão: temporário do sistema)",
+    )
+    parser.add_argument(
+        "--verify-hashes",
+        action="store_true",
+        help="recalcula todos os SHA-256 em vez de reutilizar o cache por metadados",
+    )
+    parser.add_argument(
+        "--all-stations",
+        action="store_true",
+        help="gera também clima_diario_estacoes.csv com todas as estações do DF",
+    )
+    parser.add_argument(
+        "--hourly",
+        action="store_true",
+        help=(
+            "gera também a base horária mapeada em memória em "
+            f"<output-dir>/{HOURLY_BASE_DIRNAME}"
+        ),
+    )
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     arguments = parse_args()
-    result = build_base(arguments.interruptions, arguments.inmet_dir, arguments.output_dir)
+    reading_options = {
+        "end": arguments.end,
+        "incremental": arguments.incremental,
+        "delta": arguments.delta,
+        "event_index_dir": arguments.event_index_dir,
+        "cache_dir": arguments.cache_dir,
+        "no_cache": arguments.no_cache,
+        "cache_keep": arguments.cache_keep,
+        "workers": arguments.workers,
+        "memory_budget_mb": arguments.memory_budget_mb,
+        "spill_dir": arguments.spill_dir,
+        "verify_hashes": arguments.verify_hashes,
+    }
+    if arguments.append:
+        result = append_base(
+            arguments.interruptions,
+            arguments.inmet_dir,
+            arguments.output_dir,
+            **reading_options,
+        )
+    else:
+        result = build_base(
+            arguments.interruptions,
+            arguments.inmet_dir,
+            arguments.output_dir,
+            start=arguments.start,
+            all_stations=arguments.all_stations,
+            hourly=arguments.hourly,
+            **reading_options,
+        )
     stats = result["interrupcoes"]
     print(
         "[OK] Alvo total diário (sem filtro por causa): "
         f"{stats['eventos_unicos']:,} eventos únicos; "
         f"média diária={stats['media_diaria']:.2f}; máximo={stats['maximo_diario']}"
     )
+    if "memoria_limitada" in stats:
+        bounded = stats["memoria_limitada"]
+        peak = bounded["pico_rss_mb"]
+        print(
+            f"     Deduplicação em {bounded['particoes']} partições; "
+            f"pico de RSS={'indisponível' if peak is None else f'{peak:.0f} MB'}"
+        )
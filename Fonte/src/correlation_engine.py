@@ -0,0 +1,418 @@
+"""Motor vetorizado de correlações de Pearson, Spearman e Kendall.
+
+As correlações seguem a convenção do ``DataFrame.corr`` do pandas: cada par de
+variáveis usa apenas as linhas em que ambas são válidas. Os pares são
+agrupados pela máscara conjunta de valores válidos; dentro de um grupo, cada
+coluna é padronizada (e, para Spearman, ranqueada) uma única vez e todos os
+coeficientes de Pearson e Spearman saem de um único produto matricial. O tau-b
+de Kendall usa o algoritmo de Knight, O(n log n) por par: ordena pelo primeiro
+eixo e conta as inversões do segundo com um merge sort vetorizado.
+
+O resultado é uma tabela longa (``variavel_x``, ``variavel_y``, ``metodo``,
+``r``, ``n``) usada tanto pela tabela canônica quanto pelos mapas de calor.
+
+``lagged_correlations`` calcula a correlação cruzada de várias variáveis com o
+alvo apenas na janela de defasagens pedida: diretamente, em O(n·L), ou por FFT
+quando a janela é larga, como em séries horárias. ``rolling_correlations``
+calcula o Pearson móvel em O(n) a partir de somas acumuladas, e
+``bootstrap_intervals`` dá intervalos de confiança por block bootstrap
+somando estatísticas suficientes de blocos, sem materializar as reamostras.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy.fft import irfft, next_fast_len, rfft
+from scipy.stats import rankdata
+
+
+METHODS = ("pearson", "spearman", "kendall")
+TIDY_COLUMNS = ["variavel_x", "variavel_y", "metodo", "r", "n"]
+# Acima desta quantidade de defasagens, a FFT supera os produtos diretos.
+FFT_LAG_THRESHOLD = 64
+# Variância relativa abaixo da qual uma janela móvel é tratada como constante.
+CONSTANT_TOLERANCE = 1e-10
+BOOTSTRAP_RESAMPLES = 10_000
+# Reamostras somadas de cada vez; limita a tabela de estatísticas dos blocos.
+BOOTSTRAP_CHUNK = 64
+
+
+def _standardize(values: np.ndarray) -> np.ndarray:
+    """Colunas com média zero e norma um; colunas constantes viram ``NaN``."""
+    centered = values - values.mean(axis=0)
+    norm = np.sqrt((centered**2).sum(axis=0))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return centered / np.where(norm > 0, norm, np.nan)
+
+
+def _tie_pairs(dense: np.ndarray) -> int:
+    counts = np.bincount(dense)
+    return int((counts * (counts - 1) // 2).sum())
+
+
+def _count_inversions(values: np.ndarray) -> int:
+    """Pares ``i < j`` com ``values[i] > values[j]`` (inteiros de 0 a n - 1).
+
+    Merge sort de baixo para cima: em cada nível, os blocos de largura
+    ``width`` já estão ordenados e as inversões entre cada bloco esquerdo e o
+    direito vizinho são contadas de uma vez com ``searchsorted``.
+    """
+    n = len(values)
+    current = values.astype(np.int64)
+    inversions = 0
+    width = 1
+    positions = np.arange(n)
+    while width < n:
+        pair = positions // (2 * width)
+        right = (positions // width) % 2 == 1
+        keys = pair * n + current
+        left_keys = keys[~right]
+        left_pair = pair[~right]
+        # Início de cada bloco esquerdo dentro de ``left_keys``.
+        left_start = np.searchsorted(left_pair, pair[right], side="left")
+        left_size = np.minimum(width, n - pair[right] * 2 * width)
+        not_greater = np.searchsorted(left_keys, keys[right], side="right") - left_start
+        inversions += int((left_size - not_greater).sum())
+        current = np.sort(keys) - pair * n
+        width *= 2
+    return inversions
+
+
+def kendall_tau_b(x: np.ndarray, y: np.ndarray) -> float:
+    """Tau-b de Kendall pelo algoritmo de Knight (sem valores ausentes)."""
+    n = len(x)
+    if n < 2:
+        return np.nan
+    x_rank = np.unique(x, return_inverse=True)[1].ravel()
+    y_rank = np.unique(y, return_inverse=True)[1].ravel()
+    order = np.lexsort((y_rank, x_rank))
+    total = n * (n - 1) // 2
+    x_ties = _tie_pairs(x_rank)
+    y_ties = _tie_pairs(y_rank)
+    joint = np.unique(x_rank * (y_rank.max() + 1) + y_rank, return_inverse=True)[1]
+    joint_ties = _tie_pairs(joint.ravel())
+    discordant = _count_inversions(y_rank[order])
+    denominator = np.sqrt(float(total - x_ties) * float(total - y_ties))
+    if denominator == 0:
+        return np.nan
+    concordant_minus_discordant = total - x_ties - y_ties + joint_ties - 2 * discordant
+    return float(np.clip(concordant_minus_discordant / denominator, -1.0, 1.0))
+
+
+def _group_pairs(
+    valid: np.ndarray,
+    pairs: Sequence[tuple[int, int]],
+) -> dict[bytes, list[tuple[int, int]]]:
+    groups: dict[bytes, list[tuple[int, int]]] = {}
+    for left, right in pairs:
+        key = np.packbits(valid[:, left] & valid[:, right]).tobytes()
+        groups.setdefault(key, []).append((left, right))
+    return groups
+
+
+def correlation_pairs(
+    frame: pd.DataFrame,
+    pairs: Iterable[tuple[str, str]] | None = None,
+    methods: Sequence[str] = ("pearson",),
+) -> pd.DataFrame:
+    """Correlações dos ``pairs`` de colunas de ``frame`` em formato longo.
+
+    Sem ``pairs``, calcula todos os pares ``(a, b)`` com ``a`` antes de ``b``
+    na ordem das colunas, além da diagonal.
+    """
+    unknown = sorted(set(methods) - set(METHODS))
+    if unknown:
+        raise ValueError(f"Métodos de correlação desconhecidos: {unknown}")
+    columns = list(frame.columns)
+    position = {name: i for i, name in enumerate(columns)}
+    if pairs is None:
+        pairs = [
+            (columns[i], columns[j])
+            for i in range(len(columns))
+            for j in range(i, len(columns))
+        ]
+    pairs = list(pairs)
+    values = frame[columns].to_numpy(dtype=np.float64)
+    valid = ~np.isnan(values)
+    indexed = [(position[left], position[right]) for left, right in pairs]
+
+    results: dict[tuple[int, int, str], tuple[float, int]] = {}
+    for key, group in _group_pairs(valid, indexed).items():
+        rows = np.unpackbits(np.frombuffer(key, dtype=np.uint8), count=len(values))
+        rows = rows.astype(bool)
+        used = sorted({i for pair in group for i in pair})
+        block = values[np.ix_(rows, used)]
+        local = {column: i for i, column in enumerate(used)}
+        count = int(rows.sum())
+        for method in methods:
+            if method == "kendall":
+                for left, right in group:
+                    r = kendall_tau_b(block[:, local[left]], block[:, local[right]])
+                    results[(left, right, method)] = (r, count)
+                continue
+            data = rankdata(block, axis=0) if method == "spearman" else block
+            standardized = _standardize(data) if count >= 2 else np.full_like(data, np.nan)
+            left_columns = sorted({left for left, _ in group})
+            right_columns = sorted({right for _, right in group})
+            product = standardized[:, [local[c] for c in left_columns]].T @ standardized[
+                :, [local[c] for c in right_columns]
+            ]
+            product = np.clip(product, -1.0, 1.0)
+            row_of = {c: i for i, c in enumerate(left_columns)}
+            column_of = {c: i for i, c in enumerate(right_columns)}
+            for left, right in group:
+                results[(left, right, method)] = (
+                    float(product[row_of[left], column_of[right]]),
+                    count,
+                )
+
+    records = [
+        {
+            "variavel_x": left,
+            "variavel_y": right,
+            "metodo": method,
+            "r": results[(position[left], position[right], method)][0],
+            "n": results[(position[left], position[right], method)][1],
+        }
+        for method in methods
+        for left, right in pairs
+    ]
+    return pd.DataFrame(records, columns=TIDY_COLUMNS)
+
+
+def correlation_table(
+    frames: Mapping[str, pd.DataFrame],
+    target: str,
+    variables: Sequence[str],
+    methods: Sequence[str] = ("pearson",),
+) -> pd.DataFrame:
+    """Correlações ``target`` x ``variables`` em cada escala de ``frames``."""
+    tables = []
+    for scale, frame in frames.items():
+        table = correlation_pairs(
+            frame[[target, *variables]],
+            [(target, variable) for variable in variables],
+            methods,
+        )
+        tables.append(table.assign(nivel_temporal=scale))
+    return pd.concat(tables, ignore_index=True)[["nivel_temporal", *TIDY_COLUMNS]]
+
+
+def correlation_matrix(tidy: pd.DataFrame, method: str) -> pd.DataFrame:
+    """Matriz simétrica de ``method`` a partir da tabela longa."""
+    rows = tidy[tidy["metodo"] == method]
+    order = list(dict.fromkeys([*rows["variavel_x"], *rows["variavel_y"]]))
+    matrix = pd.DataFrame(np.nan, index=order, columns=order)
+    for left, right, r in rows[["variavel_x", "variavel_y", "r"]].itertuples(index=False):
+        matrix.loc[left, right] = r
+        matrix.loc[right, left] = r
+    return matrix
+
+
+def lagged_correlations(
+    frame: pd.DataFrame,
+    target: str,
+    variables: Sequence[str],
+    max_lag: int,
+    method: str = "auto",
+) -> pd.DataFrame:
+    """Correlação cruzada ``variável(t - lag)`` x ``target(t)`` por defasagem.
+
+    Cada variável e o alvo são padronizados (desvio populacional) nas linhas
+    em que ambos são válidos; linhas ausentes contribuem com zero, sem
+    deslocar o eixo do tempo. A soma dos produtos é dividida pelo número de
+    linhas válidas, como na normalização de ``np.correlate`` usada antes.
+    Devolve uma matriz defasagem x variável, com defasagens de ``-max_lag`` a
+    ``max_lag``; ``method`` escolhe ``"direct"``, ``"fft"`` ou ``"auto"``.
+    """
+    if method not in ("auto", "direct", "fft"):
+        raise ValueError(f"Método de correlação cruzada desconhecido: {method}")
+    y = frame[target].to_numpy(dtype=np.float64)[:, np.newaxis]
+    x = frame[list(variables)].to_numpy(dtype=np.float64)
+    valid = ~np.isnan(x) & ~np.isnan(y)
+    counts = valid.sum(axis=0)
+
+    def standardized(values: np.ndarray) -> np.ndarray:
+        values = np.where(valid, values, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = values.sum(axis=0) / counts
+            centered = np.where(valid, values - mean, 0.0)
+            std = np.sqrt((centered**2).sum(axis=0) / counts)
+            return centered / np.where(std > 0, std, np.nan)
+
+    zx = standardized(x)
+    zy = standardized(np.broadcast_to(y, x.shape))
+    rows = len(frame)
+    lags = np.arange(-max_lag, max_lag + 1)
+    if method == "auto":
+        method = "fft" if len(lags) > FFT_LAG_THRESHOLD else "direct"
+
+    if method == "fft":
+        size = next_fast_len(2 * rows - 1, real=True)
+        spectrum = rfft(zy, size, axis=0) * np.conj(rfft(zx, size, axis=0))
+        full = irfft(spectrum, size, axis=0)
+        sums = full[lags % size]
+        sums[np.abs(lags) >= rows] = 0.0
+    else:
+        sums = np.zeros((len(lags), x.shape[1]))
+        for i, lag in enumerate(lags):
+            if abs(lag) >= rows:
+                continue
+            if lag >= 0:
+                sums[i] = (zy[lag:] * zx[: rows - lag]).sum(axis=0)
+            else:
+                sums[i] = (zy[: rows + lag] * zx[-lag:]).sum(axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = sums / counts
+    return pd.DataFrame(result, index=pd.Index(lags, name="lag"), columns=list(variables))
+
+
+def _centered_pairs(
+    frame: pd.DataFrame,
+    target: str,
+    variables: Sequence[str],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Máscara de pares válidos e as séries centradas, com zero nas lacunas.
+
+    Centrar pela média global reduz o cancelamento nas diferenças de somas.
+    """
+    y = frame[target].to_numpy(dtype=np.float64)[:, np.newaxis]
+    x = frame[list(variables)].to_numpy(dtype=np.float64)
+    valid = ~np.isnan(x) & ~np.isnan(y)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x = np.where(valid, x - np.nanmean(np.where(valid, x, np.nan), axis=0), 0.0)
+        y = np.where(valid, y - np.nanmean(np.where(valid, y, np.nan), axis=0), 0.0)
+    return valid.astype(np.float64), x, y
+
+
+def _pearson_from_sums(
+    count: np.ndarray,
+    sum_x: np.ndarray,
+    sum_y: np.ndarray,
+    sum_xy: np.ndarray,
+    sum_xx: np.ndarray,
+    sum_yy: np.ndarray,
+) -> np.ndarray:
+    """Pearson a partir das somas de um conjunto de pares; constantes viram ``NaN``."""
+    square_x, square_y = count * sum_xx, count * sum_yy
+    covariance = count * sum_xy - sum_x * sum_y
+    variance_x = square_x - sum_x**2
+    variance_y = square_y - sum_y**2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = covariance / np.sqrt(variance_x * variance_y)
+    # Séries constantes (por exemplo, semanas sem chuva) não têm correlação
+    # definida; a variância residual nelas é apenas erro de arredondamento.
+    varies = (variance_x > CONSTANT_TOLERANCE * square_x) & (
+        variance_y > CONSTANT_TOLERANCE * square_y
+    )
+    return np.where(varies, np.clip(result, -1, 1), np.nan)
+
+
+def rolling_correlations(
+    frame: pd.DataFrame,
+    target: str,
+    variables: Sequence[str],
+    window: int,
+    min_periods: int | None = None,
+) -> pd.DataFrame:
+    """Pearson móvel ``target`` x cada variável, em O(n) por janela.
+
+    Usa somas acumuladas de x, y, x², y² e xy sobre os pares válidos, para
+    todas as variáveis de uma vez; cada janela de ``window`` linhas sai da
+    diferença de duas somas. Como no ``rolling(window).corr`` do pandas, a
+    janela exige ``min_periods`` pares válidos (por padrão, ``window``);
+    janelas em que uma das séries é constante ficam ``NaN``.
+    """
+    min_periods = window if min_periods is None else min_periods
+    valid, x, y = _centered_pairs(frame, target, variables)
+
+    def window_sums(values: np.ndarray) -> np.ndarray:
+        cumulative = np.vstack([np.zeros(values.shape[1]), np.cumsum(values, axis=0)])
+        stops = np.arange(1, len(values) + 1)
+        starts = np.maximum(stops - window, 0)
+        return cumulative[stops] - cumulative[starts]
+
+    count = window_sums(valid)
+    result = _pearson_from_sums(
+        count,
+        window_sums(x),
+        window_sums(y),
+        window_sums(x * y),
+        window_sums(x * x),
+        window_sums(y * y),
+    )
+    result = np.where(count >= min_periods, result, np.nan)
+    return pd.DataFrame(result, index=frame.index, columns=list(variables))
+
+
+def _circular_block_sums(values: np.ndarray, length: int) -> np.ndarray:
+    """Soma de cada bloco circular de ``length`` linhas, um por linha inicial."""
+    n = len(values)
+    wrapped = values[np.arange(n + length) % n]
+    cumulative = np.vstack([np.zeros(values.shape[1]), np.cumsum(wrapped, axis=0)])
+    return cumulative[length : n + length] - cumulative[:n]
+
+
+def block_bootstrap_correlations(
+    frame: pd.DataFrame,
+    target: str,
+    variables: Sequence[str],
+    block_length: int,
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int = 42,
+) -> pd.DataFrame:
+    """Pearson ``target`` x cada variável em reamostras por block bootstrap.
+
+    Os inícios dos blocos saem de um único ``rng.integers``, a mesma chamada de
+    ``robustness_analysis.moving_block_indices`` (mesma semente, mesmas
+    reamostras, qualquer que seja ``BOOTSTRAP_CHUNK``), mas os índices das
+    linhas nunca são materializados: as somas de
+    contagem, x, y, xy, x² e y² de cada bloco possível são calculadas uma vez,
+    e cada reamostra soma as estatísticas dos seus ``n_blocks`` blocos, em
+    O(``n_resamples`` x ``n_blocks``). O último bloco, truncado para fechar
+    ``n`` linhas, vem de uma tabela à parte.
+    """
+    n = len(frame)
+    if n <= 0 or n_resamples <= 0 or block_length <= 0:
+        raise ValueError("Os tamanhos do bootstrap devem ser positivos.")
+    valid, x, y = _centered_pairs(frame, target, variables)
+    moments = np.hstack([valid, x, y, x * y, x * x, y * y])
+    n_blocks = int(np.ceil(n / block_length))
+    full = _circular_block_sums(moments, block_length)
+    tail = _circular_block_sums(moments, n - (n_blocks - 1) * block_length)
+
+    starts = np.random.default_rng(seed).integers(0, n, size=(n_resamples, n_blocks))
+    totals = np.empty((n_resamples, moments.shape[1]))
+    for first in range(0, n_resamples, BOOTSTRAP_CHUNK):
+        chunk = starts[first : first + BOOTSTRAP_CHUNK]
+        totals[first : first + len(chunk)] = (
+            full[chunk[:, :-1]].sum(axis=1) + tail[chunk[:, -1]]
+        )
+
+    result = _pearson_from_sums(*np.split(totals, 6, axis=1))
+    return pd.DataFrame(result, columns=list(variables))
+
+
+def bootstrap_intervals(
+    frame: pd.DataFrame,
+    target: str,
+    variables: Sequence[str],
+    block_length: int,
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int = 42,
+    confidence: float = 0.95,
+) -> pd.DataFrame:
+    """Intervalo percentil do Pearson por block bootstrap, uma linha por variável."""
+    resamples = block_bootstrap_correlations(
+        frame, target, variables, block_length, n_resamples, seed
+    )
+    tail = 100 * (1 - confidence) / 2
+    low, high = np.nanpercentile(resamples.to_numpy(), [tail, 100 - tail], axis=0)
+    return pd.DataFrame(
+        {"ic_inferior": low, "ic_superior": high},
+        index=pd.Index(list(variables), name="variavel_y"),
+    )
@@ -0,0 +1,285 @@
+"""Especificação declarativa dos atributos e matriz ``float32`` resultante.
+
+``FeatureSpec`` descreve quais colunas recebem defasagens, médias móveis
+exponenciais e desvio-padrão móvel. ``build_feature_matrix`` compila a
+especificação em uma única passada vetorizada do NumPy sobre a base diária
+contínua, escrevendo cada grupo de atributos em blocos de uma matriz contígua
+pré-alocada, em vez de inserir colunas uma a uma em um DataFrame.
+
+A matriz é gravada como ``.npy`` com um índice JSON ao lado (nomes das colunas,
+primeiro dia e colunas inteiras). Como as datas são diárias e contínuas, o
+índice temporal é reconstruído a partir do primeiro dia e do número de linhas.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
+
+
+FEATURE_MATRIX_VERSION = 1
+CALENDAR_COLUMNS = ("mes", "dia_semana", "dia_ano", "mes_sin", "mes_cos")
+CALENDAR_INTEGER_COLUMNS = ("mes", "dia_semana", "dia_ano")
+
+
+@dataclass(frozen=True)
+class FeatureSpec:
+    """Atributos derivados da base diária, na ordem em que viram colunas."""
+
+    lag_columns: tuple[str, ...]
+    lag_days: tuple[int, ...]
+    ema_columns: tuple[str, ...]
+    ema_spans: tuple[int, ...]
+    std_columns: tuple[str, ...]
+    std_window: int
+
+    @property
+    def context_rows(self) -> int:
+        """Linhas anteriores necessárias para calcular um dia novo."""
+        return max(max(self.lag_days), self.std_window)
+
+    def lag_names(self) -> list[str]:
+        return [f"{col}_lag_{k}" for col in self.lag_columns for k in self.lag_days]
+
+    def ema_names(self) -> list[str]:
+        return [f"{col}_ema_{s}" for col in self.ema_columns for s in self.ema_spans]
+
+    def std_names(self) -> list[str]:
+        return [f"{col}_std_{self.std_window}d" for col in self.std_columns]
+
+    def feature_names(self, base_columns: list[str]) -> list[str]:
+        return [
+            *base_columns,
+            *CALENDAR_COLUMNS,
+            *self.lag_names(),
+            *self.ema_names(),
+            *self.std_names(),
+        ]
+
+
+# Atributos do dataset publicado; a ordem das colunas segue a ordem abaixo
+# (base, calendário, lags, EMAs, desvio móvel).
+FEATURE_SPEC = FeatureSpec(
+    lag_columns=(
+        "interrupcoes",
+        "precipitacao_total_mm",
+        "temperatura_media",
+        "vento_rajada_max_ms",
+    ),
+    lag_days=(1, 2, 3, 7),
+    ema_columns=("precipitacao_total_mm", "temperatura_media", "vento_rajada_max_ms"),
+    ema_spans=(3, 7, 14),
+    std_columns=("precipitacao_total_mm", "temperatura_media", "vento_rajada_max_ms"),
+    std_window=7,
+)
+
+
+class FeatureMatrix:
+    """Matriz de atributos com índice de colunas e datas diárias contínuas."""
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        columns: list[str],
+        start: pd.Timestamp,
+        integer_columns: list[str] | None = None,
+        metadata: dict[str, object] | None = None,
+    ) -> None:
+        if values.ndim != 2 or values.shape[1] != len(columns):
+            raise ValueError("A matriz não corresponde à lista de colunas.")
+        self.values = values
+        self.columns = list(columns)
+        self.start = pd.Timestamp(start)
+        self.integer_columns = list(integer_columns or [])
+        self.metadata = dict(metadata or {})
+        self.column_index = {name: position for position, name in enumerate(columns)}
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        return pd.date_range(self.start, periods=len(self.values), freq="D", name="data")
+
+    def column(self, name: str) -> np.ndarray:
+        return self.values[:, self.column_index[name]]
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame sobre a mesma matriz; colunas inteiras voltam a ``int64``."""
+        frame = pd.DataFrame(self.values, index=self.index, columns=self.columns)
+        if self.integer_columns:
+            frame = frame.astype({name: np.int64 for name in self.integer_columns})
+        return frame
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame: pd.DataFrame,
+        dtype: np.dtype | type = np.float32,
+        metadata: dict[str, object] | None = None,
+    ) -> "FeatureMatrix":
+        """Matriz a partir de um DataFrame com índice diário contínuo."""
+        if len(frame) and not frame.index.equals(
+            pd.date_range(frame.index[0], periods=len(frame), freq="D")
+        ):
+            raise ValueError("O índice do DataFrame não é diário e contínuo.")
+        integer_columns = [
+            name for name in frame.columns if pd.api.types.is_integer_dtype(frame[name])
+        ]
+        return cls(
+            np.ascontiguousarray(frame.to_numpy(dtype=dtype)),
+            list(frame.columns),
+            frame.index[0],
+            integer_columns,
+            metadata,
+        )
+
+    def save(self, path: Path | str) -> None:
+        """Grava ``path`` (``.npy``) e, por último, o índice ``.json``.
+
+        Cada arquivo é escrito ao lado e só então renomeado sobre o anterior,
+        para que uma interrupção não deixe um índice válido junto de uma
+        matriz truncada.
+        """
+        path = Path(path)
+        staging = path.with_name(f".{path.name}.tmp")
+        with staging.open("wb") as handle:
+            np.save(handle, np.ascontiguousarray(self.values), allow_pickle=False)
+        staging.replace(path)
+        index = {
+            "versao": FEATURE_MATRIX_VERSION,
+            "inicio": str(self.start.date()),
+            "dias": len(self.values),
+            "dtype": str(self.values.dtype),
+            "colunas": self.columns,
+            "inteiras": self.integer_columns,
+            "metadados": self.metadata,
+        }
+        index_path = path.with_suffix(".json")
+        staging = index_path.with_name(f".{index_path.name}.tmp")
+        staging.write_text(json.dumps(index, indent=2), encoding="utf-8")
+        staging.replace(index_path)
+
+    @classmethod
+    def load(cls, path: Path | str, mmap: bool = True) -> "FeatureMatrix":
+        path = Path(path)
+        index = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+        if index["versao"] != FEATURE_MATRIX_VERSION:
+            raise ValueError(f"Versão da matriz de atributos não suportada: {index['versao']}")
+        values = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+        if len(values) != index["dias"]:
+            raise ValueError(f"{path.name} não corresponde ao seu índice JSON.")
+        return cls(
+            values,
+            index["colunas"],
+            pd.Timestamp(index["inicio"]),
+            index["inteiras"],
+            index.get("metadados"),
+        )
+
+
+def _ema_block(
+    values: np.ndarray,
+    span: int,
+    initial: np.ndarray | None,
+) -> np.ndarray:
+    """EMA recursiva com ``adjust=False`` ao longo das linhas de ``values``.
+
+    Sem ``initial`` a recursão começa no primeiro valor, como no pandas; com
+    ``initial`` ela continua a partir da EMA do dia anterior ao bloco.
+    """
+    alpha = 2.0 / (span + 1.0)
+    start = values[0] if initial is None else alpha * values[0] + (1 - alpha) * initial
+    # y[t] = alpha * x[t] + (1 - alpha) * y[t-1], com y[0] fixado via estado inicial.
+    state = (1 - alpha) * start[np.newaxis, :]
+    result, _ = lfilter([alpha], [1.0, alpha - 1.0], values[1:], axis=0, zi=state)
+    return np.vstack([start, result])
+
+
+def build_feature_matrix(
+    spec: FeatureSpec,
+    base: pd.DataFrame,
+    dtype: np.dtype | type = np.float32,
+    keep_from: int = 0,
+    ema_initial: dict[str, float] | None = None,
+) -> FeatureMatrix:
+    """Calcula todos os atributos de ``base`` em uma matriz pré-alocada.
+
+    ``base`` deve ter índice diário contínuo e nenhuma lacuna nas variáveis
+    usadas pela especificação. As primeiras ``keep_from`` linhas servem apenas
+    de contexto para defasagens e desvio móvel; ``ema_initial`` traz a EMA do
+    dia anterior à linha ``keep_from``. Linhas com janela incompleta são
+    descartadas.
+    """
+    columns = spec.feature_names(list(base.columns))
+    data = base.to_numpy(dtype=np.float64)
+    position = {name: i for i, name in enumerate(base.columns)}
+    rows = len(base) - keep_from
+    out = np.full((rows, len(columns)), np.nan, dtype=dtype)
+
+    width = len(base.columns)
+    out[:, :width] = data[keep_from:]
+
+    dates = base.index[keep_from:]
+    month = dates.month.to_numpy()
+    out[:, width] = month
+    out[:, width + 1] = dates.dayofweek.to_numpy()
+    out[:, width + 2] = dates.dayofyear.to_numpy()
+    out[:, width + 3] = np.sin(2 * np.pi * month / 12)
+    out[:, width + 4] = np.cos(2 * np.pi * month / 12)
+    cursor = width + len(CALENDAR_COLUMNS)
+
+    lagged = data[:, [position[col] for col in spec.lag_columns]]
+    for i, _ in enumerate(spec.lag_columns):
+        for k in spec.lag_days:
+            source = lagged[:-k, i] if k else lagged[:, i]
+            first = max(k - keep_from, 0)
+            out[first:, cursor] = source[keep_from + first - k :]
+            cursor += 1
+
+    smoothed = data[keep_from:, [position[col] for col in spec.ema_columns]]
+    emas = {
+        span: _ema_block(
+            smoothed,
+            span,
+            None
+            if ema_initial is None
+            else np.array([ema_initial[f"{col}_ema_{span}"] for col in spec.ema_columns]),
+        )
+        for span in spec.ema_spans
+    }
+    for i, _ in enumerate(spec.ema_columns):
+        for span in spec.ema_spans:
+            out[:, cursor] = emas[span][:, i]
+            cursor += 1
+
+    window = spec.std_window
+    spread = data[:, [position[col] for col in spec.std_columns]]
+    if len(spread) >= window:
+        stds = sliding_window_view(spread, window, axis=0).std(axis=-1, ddof=1)
+        # stds[j] cobre as linhas j .. j + window - 1 da base.
+        first = max(window - 1 - keep_from, 0)
+        out[first:, cursor : cursor + len(spec.std_columns)] = stds[
+            keep_from + first - (window - 1) :
+        ]
+
+    complete = ~np.isnan(out).any(axis=1)
+    if not complete.any():
+        raise ValueError("A base é curta demais para completar as janelas de atributos.")
+    first_complete = int(np.argmax(complete))
+    if not complete[first_complete:].all():
+        raise ValueError("A base contém lacunas no meio do período de atributos.")
+    integer_columns = [
+        name
+        for name in [*base.columns, *CALENDAR_INTEGER_COLUMNS]
+        if name in CALENDAR_INTEGER_COLUMNS or pd.api.types.is_integer_dtype(base[name])
+    ]
+    return FeatureMatrix(
+        np.ascontiguousarray(out[first_complete:]),
+        columns,
+        dates[first_complete],
+        integer_columns,
+    )
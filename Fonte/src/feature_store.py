@@ -0,0 +1,199 @@
+"""Armazenamento versionado do dataset de atributos.
+
+``write_feature_store`` grava o dataset publicado por
+``03_feature_engineering.py`` em dois formatos binários ao lado do CSV:
+
+- ``dataset_engenharia_features.npy`` com o índice ``.json`` da
+  ``FeatureMatrix``, lido por mapeamento de memória;
+- ``dataset_engenharia_features.arrow`` (Arrow IPC, colunas tipadas e datas
+  nativas), gravado quando o ``pyarrow`` está instalado.
+
+Os dois carregam o hash da ``FeatureSpec`` e o SHA-256 da base diária que os
+originou. ``load_feature_matrix`` e ``load_features`` são o ponto único de
+leitura dos modelos: mapeiam a matriz em memória sem reinterpretar datas e
+recusam um armazenamento gerado com outra especificação ou outra base.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from feature_spec import FEATURE_MATRIX_VERSION, FEATURE_SPEC, FeatureMatrix, FeatureSpec
+from file_digest import sha256
+
+try:
+    import pyarrow as pa
+except ImportError:
+    PYARROW_AVAILABLE = False
+else:
+    PYARROW_AVAILABLE = True
+
+
+FEATURE_STORE_VERSION = 1
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+BASE_PATH = DATA_DIR / "base_diaria_interrupcoes_clima_vento.csv"
+FEATURE_STORE_PATH = DATA_DIR / "dataset_engenharia_features.npy"
+FEATURE_CSV_PATH = DATA_DIR / "dataset_engenharia_features.csv"
+
+
+def spec_hash(spec: FeatureSpec) -> str:
+    """SHA-256 da especificação e das versões do formato gravado."""
+    payload = {
+        "especificacao": asdict(spec),
+        "matriz": FEATURE_MATRIX_VERSION,
+        "armazenamento": FEATURE_STORE_VERSION,
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _store_metadata(path: Path, spec: FeatureSpec, base_path: Path) -> dict[str, object]:
+    return {
+        "armazenamento": FEATURE_STORE_VERSION,
+        "hash_especificacao": spec_hash(spec),
+        "base": os.path.relpath(base_path.resolve(), path.resolve().parent),
+        "hash_base": sha256(base_path),
+    }
+
+
+def _write_arrow(matrix: FeatureMatrix, path: Path) -> None:
+    """Grava a matriz como Arrow IPC com os metadados no esquema."""
+    frame = matrix.to_frame().reset_index()
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    metadata = {
+        **(table.schema.metadata or {}),
+        b"atributos": json.dumps(matrix.metadata).encode("utf-8"),
+    }
+    table = table.replace_schema_metadata(metadata)
+    staging = path.with_name(f".{path.name}.tmp")
+    with pa.OSFile(str(staging), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    staging.replace(path)
+
+
+def write_feature_store(
+    frame: pd.DataFrame,
+    path: Path | str = FEATURE_STORE_PATH,
+    *,
+    spec: FeatureSpec = FEATURE_SPEC,
+    base_path: Path | str = BASE_PATH,
+    append: bool = False,
+) -> FeatureMatrix:
+    """Grava ``frame`` como matriz ``float32`` e, se possível, Arrow IPC.
+
+    Com ``append``, as linhas de ``frame`` continuam o armazenamento existente;
+    os hashes passam a descrever a base atual em ``base_path``.
+    """
+    path = Path(path)
+    base_path = Path(base_path)
+    matrix = FeatureMatrix.from_frame(frame, metadata=_store_metadata(path, spec, base_path))
+    if append:
+        previous = FeatureMatrix.load(path, mmap=False)
+        if previous.columns != matrix.columns or (
+            previous.index[-1] + pd.Timedelta(days=1) != matrix.start
+        ):
+            raise ValueError(f"{path.name} não é continuado pelas novas linhas.")
+        matrix = FeatureMatrix(
+            np.vstack([previous.values, matrix.values]),
+            matrix.columns,
+            previous.start,
+            matrix.integer_columns,
+            matrix.metadata,
+        )
+    matrix.save(path)
+    if PYARROW_AVAILABLE:
+        _write_arrow(matrix, path.with_suffix(".arrow"))
+    return matrix
+
+
+def _validate(
+    metadata: dict[str, object],
+    path: Path,
+    spec: FeatureSpec,
+) -> None:
+    rerun = "execute novamente 03_feature_engineering.py"
+    if metadata.get("armazenamento") != FEATURE_STORE_VERSION:
+        raise ValueError(f"{path.name} não traz a versão esperada do armazenamento; {rerun}.")
+    if metadata.get("hash_especificacao") != spec_hash(spec):
+        raise ValueError(f"{path.name} foi gerado com outra especificação de atributos; {rerun}.")
+    base_path = path.parent / str(metadata["base"])
+    if base_path.exists() and metadata.get("hash_base") != sha256(base_path):
+        raise ValueError(f"{path.name} não corresponde à base atual {base_path.name}; {rerun}.")
+
+
+def load_feature_matrix(
+    path: Path | str = FEATURE_STORE_PATH,
+    *,
+    spec: FeatureSpec = FEATURE_SPEC,
+) -> FeatureMatrix:
+    """Mapeia a matriz em memória após conferir a especificação e a base.
+
+    A base é conferida apenas se o arquivo registrado no armazenamento ainda
+    existir, o que permite distribuir os atributos sem a base diária.
+    """
+    path = Path(path)
+    matrix = FeatureMatrix.load(path)
+    _validate(matrix.metadata, path, spec)
+    return matrix
+
+
+def _load_arrow(path: Path, spec: FeatureSpec) -> pd.DataFrame:
+    with pa.memory_map(str(path), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    _validate(json.loads(table.schema.metadata[b"atributos"]), path, spec)
+    return table.to_pandas().set_index("data")
+
+
+def _compile_csv(path: Path, spec: FeatureSpec | None = None) -> pd.DataFrame:
+    """Converte o CSV na mesma matriz ``float32`` gravada pela etapa 03.
+
+    O CSV não traz hashes; com ``spec``, confere-se ao menos que suas colunas
+    derivadas são as da especificação.
+    """
+    frame = pd.read_csv(path, index_col="data", parse_dates=True)
+    if spec is not None:
+        expected = spec.feature_names([])
+        if [name for name in frame.columns if name in expected] != expected:
+            raise ValueError(
+                f"{path.name} não contém os atributos da especificação atual; "
+                "execute novamente 03_feature_engineering.py."
+            )
+    return FeatureMatrix.from_frame(frame).to_frame()
+
+
+def load_features(
+    path: Path | str = FEATURE_STORE_PATH,
+    *,
+    spec: FeatureSpec = FEATURE_SPEC,
+) -> pd.DataFrame:
+    """Dataset de atributos indexado por ``data``.
+
+    ``path`` pode ser a matriz ``.npy``, o arquivo ``.arrow`` ou o CSV. O CSV
+    é compilado para a mesma matriz ``float32`` do armazenamento, sem
+    validação de hashes. Se a matriz não existir (por exemplo, em um checkout
+    sem a etapa 03), recorre com um aviso ao CSV de mesmo nome, que precisa
+    conter os atributos de ``spec``.
+    """
+    path = Path(path)
+    if path.suffix == ".npy" and not path.exists() and path.with_suffix(".csv").exists():
+        print(
+            f"[AVISO] {path.name} ausente; compilando {path.with_suffix('.csv').name} "
+            "para float32 (CSV em float64), sem validação de hashes."
+        )
+        return _compile_csv(path.with_suffix(".csv"), spec)
+    if path.suffix == ".csv":
+        return _compile_csv(path)
+    if path.suffix == ".arrow":
+        if not PYARROW_AVAILABLE:
+            raise ImportError("A leitura de arquivos .arrow requer o pacote pyarrow.")
+        return _load_arrow(path, spec)
+    return load_feature_matrix(path, spec=spec).to_frame()
@@ -0,0 +1,15 @@
+"""SHA-256 de arquivos, compartilhado pela base, pelos atributos e pelo pipeline."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+
+def sha256(path: Path) -> str:
+    """SHA-256 do conteúdo de ``path``, lido em blocos de 1 MiB."""
+    digest = hashlib.sha256()
+    with path.open("rb") as stream:
+        for block in iter(lambda: stream.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,191 @@
+"""Base horária de interrupções e clima em arrays NumPy mapeados em memória.
+
+Cada coluna é gravada como um arquivo ``.npy`` de tipo fixo sobre uma grade
+horária contínua no horário local de Brasília (UTC-3, sem horário de verão,
+mesma referência de ``DatInicioInterrupcao``). Como a grade não tem lacunas, o
+deslocamento de um instante é ``(instante - inicio) // 1 h`` e janelas como
+"chuva nas 6 horas anteriores à interrupção" são fatias do mapeamento, sem
+cópia e sem carregar o período inteiro no pandas.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+HOURLY_BASE_DIRNAME = "base_horaria"
+HOURLY_BASE_VERSION = 1
+LOCAL_UTC_OFFSET = pd.Timedelta(hours=-3)
+COUNT_COLUMN = "interrupcoes"
+HOUR = pd.Timedelta(hours=1)
+
+
+def write_hourly_base(
+    directory: Path,
+    event_starts: pd.Series,
+    weather: pd.DataFrame,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+) -> Path:
+    """Grava a grade horária de ``start`` 00h até ``end`` 23h, horário local.
+
+    ``event_starts`` contém o início de cada interrupção única e ``weather``
+    tem a coluna ``momento`` em horário local e uma coluna por variável.
+    Horas sem medição ficam como ``NaN``.
+    """
+    start = pd.Timestamp(start).floor("D")
+    hours = int((pd.Timestamp(end).floor("D") - start) // HOUR) + 24
+    columns = _hourly_columns(event_starts, weather, start, hours)
+    return _save_columns(directory, start, columns)
+
+
+def append_hourly_base(
+    directory: Path,
+    event_starts: pd.Series,
+    weather: pd.DataFrame,
+    end: pd.Timestamp,
+) -> Path:
+    """Estende a grade existente até ``end`` 23h sem recalcular as horas gravadas.
+
+    ``event_starts`` e ``weather`` cobrem apenas os dias novos. As medições
+    das 00h às 02h UTC do primeiro dia novo caem nas últimas horas locais do
+    dia anterior, que a grade existente deixou vazias; elas são preenchidas
+    como em uma gravação completa do período.
+    """
+    existing = HourlyBase(directory)
+    last_day = existing.start + existing.hours * HOUR - pd.Timedelta(days=1)
+    hours = int((pd.Timestamp(end).floor("D") - last_day) // HOUR) + 24
+    if hours <= 24:
+        return directory
+    recent = _hourly_columns(event_starts, weather, last_day, hours)
+    if list(recent) != existing.columns:
+        raise ValueError(
+            f"As colunas novas da base horária não coincidem com as existentes: "
+            f"{list(recent)} != {existing.columns}"
+        )
+    kept = existing.hours - 24
+    columns = {}
+    for name in existing.columns:
+        # Copia a coluna para liberar o mapeamento antes da troca do diretório.
+        previous = np.array(existing[name])
+        seam = previous[kept:]
+        if name != COUNT_COLUMN:
+            seam = np.where(np.isnan(seam), recent[name][:24], seam)
+        columns[name] = np.concatenate([previous[:kept], seam, recent[name][24:]])
+    start = existing.start
+    existing = None
+    return _save_columns(directory, start, columns)
+
+
+def _hourly_columns(
+    event_starts: pd.Series,
+    weather: pd.DataFrame,
+    start: pd.Timestamp,
+    hours: int,
+) -> dict[str, np.ndarray]:
+    columns: dict[str, np.ndarray] = {}
+    offsets = _offsets(event_starts.dt.floor("h"), start)
+    inside = (offsets >= 0) & (offsets < hours)
+    columns[COUNT_COLUMN] = np.bincount(offsets[inside], minlength=hours).astype(
+        np.int32
+    )
+
+    weather_offsets = _offsets(weather["momento"], start)
+    inside = (weather_offsets >= 0) & (weather_offsets < hours)
+    if pd.Series(weather_offsets[inside]).duplicated().any():
+        raise ValueError("A base horária recebeu mais de um registro por hora.")
+    for column in weather.columns.drop("momento"):
+        values = np.full(hours, np.nan, dtype=np.float32)
+        values[weather_offsets[inside]] = weather[column].to_numpy(dtype=np.float32)[
+            inside
+        ]
+        columns[column] = values
+    return columns
+
+
+def _save_columns(
+    directory: Path,
+    start: pd.Timestamp,
+    columns: dict[str, np.ndarray],
+) -> Path:
+    staging = directory.with_name(f".{directory.name}.tmp")
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+    for name, values in columns.items():
+        np.save(staging / f"{name}.npy", values, allow_pickle=False)
+    index = {
+        "versao": HOURLY_BASE_VERSION,
+        "inicio": start.isoformat(),
+        "horas": len(columns[COUNT_COLUMN]),
+        "fuso": "UTC-03:00",
+        "colunas": {name: str(values.dtype) for name, values in columns.items()},
+    }
+    (staging / "indice.json").write_text(json.dumps(index, indent=2), encoding="utf-8")
+    if directory.exists():
+        shutil.rmtree(directory)
+    staging.replace(directory)
+    return directory
+
+
+def _offsets(moments: pd.Series, start: pd.Timestamp) -> np.ndarray:
+    return ((moments - start) // HOUR).to_numpy(dtype=np.int64)
+
+
+class HourlyBase:
+    """Acesso somente leitura à base horária mapeada em memória."""
+
+    def __init__(self, directory: Path | str) -> None:
+        self.directory = Path(directory)
+        index = json.loads((self.directory / "indice.json").read_text(encoding="utf-8"))
+        if index["versao"] != HOURLY_BASE_VERSION:
+            raise ValueError(f"Versão da base horária não suportada: {index['versao']}")
+        self.start = pd.Timestamp(index["inicio"])
+        self.hours = int(index["horas"])
+        self.columns = list(index["colunas"])
+        self._arrays: dict[str, np.ndarray] = {}
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        if column not in self.columns:
+            raise KeyError(column)
+        if column not in self._arrays:
+            self._arrays[column] = np.load(
+                self.directory / f"{column}.npy", mmap_mode="r"
+            )
+        return self._arrays[column]
+
+    def offset(self, moment: pd.Timestamp | str) -> int:
+        """Posição da hora que contém ``moment`` na grade."""
+        position = int((pd.Timestamp(moment) - self.start) // HOUR)
+        if not 0 <= position < self.hours:
+            raise IndexError(f"{moment} está fora da base horária.")
+        return position
+
+    def slice(
+        self,
+        column: str,
+        start: pd.Timestamp | str,
+        end: pd.Timestamp | str,
+    ) -> np.ndarray:
+        """Horas de ``start`` (inclusive) a ``end`` (exclusive), sem cópia."""
+        first = self.offset(start)
+        last = first + int((pd.Timestamp(end) - pd.Timestamp(start)) // HOUR)
+        return self[column][first : min(last, self.hours)]
+
+    def window_before(
+        self,
+        column: str,
+        moment: pd.Timestamp | str,
+        hours: int,
+    ) -> np.ndarray:
+        """As ``hours`` horas completas anteriores à hora de ``moment``."""
+        last = self.offset(moment)
+        return self[column][max(0, last - hours) : last]
+
+    def timestamps(self) -> pd.DatetimeIndex:
+        return pd.date_range(self.start, periods=self.hours, freq="h", name="momento")
@@ -6,6 +6,7 @@ nos mesmos recortes usados pela avaliação principal e pela análise
 multi-horizonte.
 """
 
+import sys
 from pathlib import Path
 
 import numpy as np
@@ -17,7 +18,11 @@ from metric_utils import mean_absolute_percentage_error
 
 MODEL_DIR = Path(__file__).resolve().parent
 FONTE_DIR = MODEL_DIR.parents[1]
-DATA_PATH = FONTE_DIR / "data" / "dataset_engenharia_features.csv"
+sys.path.insert(0, str(MODEL_DIR.parent))
+
+from feature_store import FEATURE_STORE_PATH, load_features  # noqa: E402
+
+DATA_PATH = FEATURE_STORE_PATH
 OUTPUT_PATH = FONTE_DIR / "results" / "ml" / "metrics_persistence.csv"
 
 
@@ -82,7 +87,7 @@ def build_metrics(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def main() -> None:
-    df = pd.read_csv(DATA_PATH, index_col="data", parse_dates=True).sort_index()
+    df = load_features(DATA_PATH).sort_index()
     metrics = build_metrics(df)
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
     metrics.to_csv(OUTPUT_PATH, index=False)
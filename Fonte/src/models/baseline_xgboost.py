@@ -26,6 +26,7 @@ Execucao:
   cd Fonte/src/models && python baseline_xgboost.py
 """
 import os
+import sys
 import json
 import numpy as np
 import pandas as pd
@@ -36,6 +37,9 @@ from sklearn.model_selection import GridSearchCV, TimeSeriesSplit
 
 from metric_utils import mean_absolute_percentage_error
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from feature_store import FEATURE_STORE_PATH, load_features  # noqa: E402
+
 plt.style.use('seaborn-v0_8-whitegrid')
 plt.rcParams.update({'figure.dpi': 300, 'font.size': 12})
 
@@ -52,9 +56,13 @@ def load_and_split_data(filepath, target_col='interrupcoes', test_size_days=365)
     - y[t] = interrupcoes[t+1] (deslocado 1 passo a frente).
     - Divisao por data-alvo (t+1), nao por posicao de linha.
     - Conjunto de teste: 365 dias-alvo em [01/06/2024, 31/05/2025].
+
+    `filepath` pode ser o armazenamento `.npy` gravado por
+    03_feature_engineering.py (validado por feature_store.load_features; o
+    XGBoost ja trabalha internamente em float32) ou o CSV.
     """
     print("Carregando dataset com features avancadas...")
-    df = pd.read_csv(filepath, index_col='data', parse_dates=True)
+    df = load_features(filepath)
 
     # Previsao verdadeira h=1: alvo = interrupcoes do dia seguinte
     X = df.copy()                           # inclui interrupcoes[t] como feature historica
@@ -225,7 +233,7 @@ if __name__ == "__main__":
     SAVE_PATH = '../../results/ml'
     os.makedirs(SAVE_PATH, exist_ok=True)
 
-    data_path = '../../data/dataset_engenharia_features.csv'
+    data_path = FEATURE_STORE_PATH
 
     X_train, X_test, y_train, y_test = load_and_split_data(
         data_path, test_size_days=365
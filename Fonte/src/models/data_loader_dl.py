@@ -3,6 +3,10 @@ import numpy as np
 import torch
 from sklearn.preprocessing import MinMaxScaler
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from feature_store import load_feature_matrix, load_features  # noqa: E402
 
 def create_sequences(data, target_idx, seq_length):
     """
@@ -27,15 +31,27 @@ def prepare_data_dl(filepath, target_col='interrupcoes', seq_length=14, test_siz
     Para garantir que o DL seja avaliado nas mesmas 365 datas que o XGBoost,
     os ultimos seq_length dias do treino sao usados como contexto da primeira
     janela de teste, gerando exatamente test_size_days previsoes.
+
+    Aceita tambem o armazenamento float32 `.npy` gravado por
+    03_feature_engineering.py, validado e lido direto para NumPy sem passar
+    pelo pandas.
     """
-    print("Loading CSV into Pandas DataFrame...")
-    df = pd.read_csv(filepath, index_col='data', parse_dates=True)
-    target_idx = df.columns.get_loc(target_col)
+    if str(filepath).endswith('.npy') and os.path.exists(filepath):
+        print("Loading float32 feature matrix...")
+        matrix = load_feature_matrix(filepath)
+        values = np.asarray(matrix.values)
+        dates = matrix.index
+        target_idx = matrix.column_index[target_col]
+    else:
+        print("Loading CSV into Pandas DataFrame...")
+        values = load_features(filepath)
+        dates = values.index
+        target_idx = values.columns.get_loc(target_col)
 
     # Chronological Split (No random K-Fold to preserve temporal inertia)
-    split_index = len(df) - test_size_days
-    train_df = df.iloc[:split_index].copy()
-    test_df  = df.iloc[split_index:].copy()
+    split_index = len(values) - test_size_days
+    train_df = values[:split_index]
+    test_df  = values[split_index:]
 
     # Scale variables into [0, 1] range for Gradient Descent stability
     scaler = MinMaxScaler()
@@ -61,7 +77,7 @@ def prepare_data_dl(filepath, target_col='interrupcoes', seq_length=14, test_siz
     X_test_tensor  = torch.from_numpy(X_test).float()
     y_test_tensor  = torch.from_numpy(y_test).float().unsqueeze(1)
 
-    test_dates = test_df.index  # todas as 365 datas de teste
+    test_dates = dates[split_index:]  # todas as 365 datas de teste
 
     print(f"Train Tensor: {X_train_tensor.shape}")
     print(f"Test Tensor:  {X_test_tensor.shape}  ({len(test_dates)} datas)")
@@ -11,7 +11,7 @@ gera os artefatos:
   - results/ml/metrics_gru_bi.csv                   (MAE, RMSE, R², MAPE)
 
 Fonte de dados:
-  ../../data/dataset_engenharia_features.csv
+  ../../data/dataset_engenharia_features.npy (ou o .csv, se ausente)
 
 Dependências internas:
   - data_loader_dl.prepare_data_dl
@@ -30,6 +30,7 @@ import torch.nn as nn
 import torch.optim as optim
 
 from data_loader_dl import prepare_data_dl
+from feature_store import FEATURE_STORE_PATH
 from baseline_xgboost import evaluate_and_plot
 from lstm_bidirecional import reverse_scaling, plot_loss, set_seeds, SEED
 
@@ -113,7 +114,7 @@ def train_gru_model(model, X_train, y_train, epochs=150, batch_size=32, lr=0.001
 if __name__ == "__main__":
     set_seeds(SEED)
     os.makedirs('../../results/ml', exist_ok=True)
-    data_path = '../../data/dataset_engenharia_features.csv'
+    data_path = FEATURE_STORE_PATH
 
     SEQ_LENGTH = 14
     (X_train_t, y_train_t, X_test_t, y_test_t,
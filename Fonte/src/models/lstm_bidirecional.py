@@ -11,7 +11,7 @@ gera os artefatos:
   - results/ml/metrics_lstm_bi.csv                   (MAE, RMSE, R², MAPE)
 
 Fonte de dados:
-  ../../data/dataset_engenharia_features.csv
+  ../../data/dataset_engenharia_features.npy (ou o .csv, se ausente)
 
 Dependências internas:
   - data_loader_dl.prepare_data_dl
@@ -30,6 +30,7 @@ import torch.optim as optim
 import matplotlib.pyplot as plt
 
 from data_loader_dl import prepare_data_dl
+from feature_store import FEATURE_STORE_PATH
 from baseline_xgboost import evaluate_and_plot
 
 SEED = 42
@@ -144,7 +145,7 @@ def plot_loss(loss_history, model_name, save_path):
 if __name__ == "__main__":
     set_seeds(SEED)
     os.makedirs('../../results/ml', exist_ok=True)
-    data_path = '../../data/dataset_engenharia_features.csv'
+    data_path = FEATURE_STORE_PATH
 
     SEQ_LENGTH = 14   # janela de 14 dias de historico
     (X_train_t, y_train_t, X_test_t, y_test_t,
@@ -58,6 +58,7 @@ import xgboost as xgb
 from lstm_bidirecional import AdvancedLSTM, train_dl_model, reverse_scaling, set_seeds, SEED
 from gru_avancada import AdvancedGRU, train_gru_model
 from metric_utils import mean_absolute_percentage_error
+from feature_store import FEATURE_STORE_PATH, load_features
 
 plt.style.use('seaborn-v0_8-whitegrid')
 plt.rcParams.update({'figure.dpi': 300, 'font.size': 12})
@@ -65,7 +66,7 @@ plt.rcParams.update({'figure.dpi': 300, 'font.size': 12})
 HORIZONTES = [1, 3, 7, 14]
 SEQ_LENGTH  = 14
 TARGET_COL  = 'interrupcoes'
-DATA_PATH   = '../../data/dataset_engenharia_features.csv'
+DATA_PATH   = FEATURE_STORE_PATH
 SAVE_PATH   = '../../results/ml'
 
 TRAIN_TARGET_CUTOFF = pd.Timestamp('2024-06-01')
@@ -89,7 +90,7 @@ def calcular_metricas(y_true, y_pred):
 
 
 def carregar_dataset():
-    df = pd.read_csv(DATA_PATH, index_col='data', parse_dates=True)
+    df = load_features(DATA_PATH)
     print(f"Dataset: {len(df)} dias ({df.index.min().date()} -> {df.index.max().date()})")
     return df
 
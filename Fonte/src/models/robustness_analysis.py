@@ -24,12 +24,13 @@ from statsmodels.stats.diagnostic import acorr_ljungbox
 from statsmodels.tsa.stattools import acf
 
 from baseline_xgboost import load_and_split_data
+from feature_store import FEATURE_STORE_PATH, load_features
 from metric_utils import mean_absolute_percentage_error
 
 
 MODEL_DIR = Path(__file__).resolve().parent
 FONTE_DIR = MODEL_DIR.parents[1]
-DATA_PATH = FONTE_DIR / "data" / "dataset_engenharia_features.csv"
+DATA_PATH = FEATURE_STORE_PATH
 RESULTS_DIR = FONTE_DIR / "results" / "ml"
 PARAMS_PATH = RESULTS_DIR / "xgboost_best_params.json"
 
@@ -128,7 +129,7 @@ def load_official_predictions() -> pd.DataFrame:
     if len(aligned) != 365:
         raise ValueError(f"Esperadas 365 datas comuns; foram obtidas {len(aligned)}.")
 
-    data = pd.read_csv(DATA_PATH, index_col="data", parse_dates=True).sort_index()
+    data = load_features(DATA_PATH).sort_index()
     origins = aligned.index - pd.Timedelta(days=1)
     if not origins.isin(data.index).all():
         raise ValueError("Há datas de origem ausentes para a persistência.")
@@ -273,7 +274,7 @@ def run_xgboost_ablation(indices: np.ndarray) -> tuple[pd.DataFrame, pd.DataFram
         prediction_frame[variant] = prediction
 
     origins = y_test.index - pd.Timedelta(days=1)
-    raw = pd.read_csv(DATA_PATH, index_col="data", parse_dates=True).sort_index()
+    raw = load_features(DATA_PATH).sort_index()
     persistence = raw.loc[origins, "interrupcoes"].to_numpy(dtype=float)
     persistence_metrics = calculate_metrics(y_test.to_numpy(), persistence)
     persistence_absolute = np.abs(y_test.to_numpy(dtype=float) - persistence)
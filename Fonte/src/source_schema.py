@@ -0,0 +1,154 @@
+"""Esquema versionado das fontes padronizadas da ANEEL e do INMET.
+
+Os leitores declaram o tipo de cada coluna, o formato exato das datas e os
+sentinelas de ausência em vez de depender da inferência de tipos do pandas,
+que domina o custo de leitura dos arquivos grandes. Com o ``pyarrow``
+instalado, arquivos lidos por inteiro usam o seu motor multithread; leituras em
+blocos e ambientes sem ``pyarrow`` usam o motor C do pandas com os mesmos tipos.
+
+Alterar tipos, formatos ou sentinelas muda o resultado da leitura: incremente
+``SCHEMA_VERSION`` para invalidar os caches que dependem dela.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    PYARROW_AVAILABLE = False
+else:
+    PYARROW_AVAILABLE = True
+
+
+SCHEMA_VERSION = 1
+
+ANEEL_SCHEMA: dict[str, object] = {
+    "nome": "aneel_interrupcoes",
+    "tipos": {
+        "NumOrdemInterrupcao": "str",
+        "DatInicioInterrupcao": "str",
+    },
+    "datas": {"DatInicioInterrupcao": "%Y-%m-%d %H:%M:%S"},
+    "ausentes": [],
+}
+INMET_SCHEMA: dict[str, object] = {
+    "nome": "inmet_horario",
+    "tipos": {
+        "data": "str",
+        "hora_utc": "str",
+        "precipitacao_total_horario_mm": "float64",
+        "temperatura_ar_bulbo_seco_c": "float64",
+        "vento_direcao_horaria_gr": "float64",
+        "vento_rajada_max_ms": "float64",
+        "vento_velocidade_horaria_ms": "float64",
+    },
+    "datas": {"data": "%Y-%m-%d"},
+    "ausentes": ["-999", "-999.0", "-9999", "-9999.0"],
+}
+
+
+def csv_engine(chunked: bool = False) -> str:
+    """Motor usado pelo ``pandas.read_csv``; o ``pyarrow`` não lê em blocos."""
+    return "pyarrow" if PYARROW_AVAILABLE and not chunked else "c"
+
+
+def _read_options(
+    schema: dict[str, object],
+    usecols: list[str] | None,
+    names: list[str] | None,
+) -> dict[str, object]:
+    types = schema["tipos"]
+    columns = usecols or names or list(types)
+    options: dict[str, object] = {
+        "dtype": {column: types[column] for column in columns},
+        "na_values": schema["ausentes"],
+    }
+    if names is None:
+        options["usecols"] = columns
+    else:
+        # O motor pyarrow não combina ``names`` sem cabeçalho com ``usecols``.
+        options.update(header=None, names=names)
+        if usecols is not None:
+            options["usecols"] = usecols
+    return options
+
+
+def _coerce_numeric(frame: pd.DataFrame, schema: dict[str, object]) -> pd.DataFrame:
+    for column, dtype in schema["tipos"].items():
+        if column in frame and dtype != "str":
+            frame[column] = pd.to_numeric(frame[column], errors="coerce").astype(dtype)
+    return frame
+
+
+def read_typed_csv(
+    source: Path | IO[bytes],
+    schema: dict[str, object],
+    usecols: list[str] | None = None,
+    *,
+    names: list[str] | None = None,
+) -> pd.DataFrame:
+    """Lê ``source`` inteiro com os tipos declarados em ``schema``.
+
+    Um valor não numérico em coluna numérica invalida a leitura tipada; nesse
+    caso o arquivo é relido como texto e o valor é convertido em ``NaN``, como
+    faria ``pd.to_numeric(errors="coerce")``.
+    """
+    options = _read_options(schema, usecols, names)
+    engine = csv_engine() if isinstance(source, Path) else "c"
+    try:
+        return pd.read_csv(source, engine=engine, **options)
+    except ValueError:
+        if not isinstance(source, Path):
+            raise
+    options["dtype"] = str
+    return _coerce_numeric(pd.read_csv(source, engine=engine, **options), schema)
+
+
+def iter_typed_csv(
+    source: Path | IO[bytes],
+    schema: dict[str, object],
+    usecols: list[str] | None = None,
+    *,
+    chunksize: int,
+    names: list[str] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Lê ``source`` em blocos de ``chunksize`` linhas com o motor C."""
+    options = _read_options(schema, usecols, names)
+    yield from pd.read_csv(source, chunksize=chunksize, **options)
+
+
+def parse_datetimes(values: pd.Series, schema: dict[str, object]) -> pd.Series:
+    """Converte datas com o formato exato do esquema.
+
+    Se algum valor não seguir o formato declarado, recorre à inferência e
+    transforma valores inválidos em ``NaT``, o comportamento anterior ao esquema.
+    """
+    try:
+        return pd.to_datetime(values, format=schema["datas"][values.name])
+    except (TypeError, ValueError):
+        return pd.to_datetime(values, errors="coerce")
+
+
+def parse_throughput(
+    rows: int,
+    size_bytes: int,
+    started: float,
+    engine: str,
+) -> dict[str, object]:
+    """Resume o custo de uma leitura iniciada em ``started`` (``perf_counter``)."""
+    seconds = max(time.perf_counter() - started, 1e-9)
+    return {
+        "esquema": SCHEMA_VERSION,
+        "motor": engine,
+        "linhas": rows,
+        "segundos": round(seconds, 4),
+        "linhas_por_s": round(rows / seconds, 1),
+        "mb_por_s": round(size_bytes / (1024 * 1024) / seconds, 2),
+    }
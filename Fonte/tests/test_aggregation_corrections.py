@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -13,7 +14,33 @@ import pandas as pd
 SRC_DIR = Path(__file__).resolve().parents[1] / "src"
 sys.path.insert(0, str(SRC_DIR))
 
-from aggregation import aggregate_daily  # noqa: E402
+from aggregation import (  # noqa: E402
+    AggregationIndex,
+    ScaleCache,
+    ScaleProvider,
+    aggregate_daily,
+    build_correlation_table,
+    load_station_bases,
+)
+
+
+def resample_reference(frame: pd.DataFrame, frequency: str) -> pd.DataFrame:
+    grouped = frame.resample(frequency)
+    result = grouped.agg(
+        temperatura_media=("temperatura_media", "mean"),
+        vento_velocidade_media_ms=("vento_velocidade_media_ms", "mean"),
+        vento_velocidade_max_ms=("vento_velocidade_max_ms", "max"),
+        vento_rajada_max_ms=("vento_rajada_max_ms", "max"),
+        vento_dir_sin=("vento_dir_sin", "mean"),
+        vento_dir_cos=("vento_dir_cos", "mean"),
+    )
+    result["interrupcoes"] = grouped["interrupcoes"].sum(min_count=1)
+    result["precipitacao_total_mm"] = grouped["precipitacao_total_mm"].sum(min_count=1)
+    norm = np.hypot(result["vento_dir_sin"], result["vento_dir_cos"])
+    result[["vento_dir_sin", "vento_dir_cos"]] = result[
+        ["vento_dir_sin", "vento_dir_cos"]
+    ].div(norm.where(norm >= 1e-12), axis=0)
+    return result
 
 
 def aggregation_frame(index: pd.DatetimeIndex) -> pd.DataFrame:
@@ -34,6 +61,25 @@ def aggregation_frame(index: pd.DatetimeIndex) -> pd.DataFrame:
 
 
 class AggregationCorrectionTests(unittest.TestCase):
+    def test_correlation_intervals_can_be_omitted(self) -> None:
+        index = pd.date_range("2020-01-01", periods=120, freq="D", name="data")
+        rng = np.random.default_rng(4)
+        daily = aggregation_frame(index) + rng.uniform(0, 1, (120, 8))
+
+        with_intervals, _ = build_correlation_table(daily, n_resamples=200)
+        without, _ = build_correlation_table(daily, n_resamples=0)
+
+        self.assertEqual(
+            list(without.columns), ["nivel_temporal", "variavel", "pearson_r", "rotulo"]
+        )
+        self.assertEqual(
+            list(with_intervals.columns),
+            ["nivel_temporal", "variavel", "pearson_r", "ic95_inf", "ic95_sup", "rotulo"],
+        )
+        pd.testing.assert_frame_equal(
+            with_intervals.drop(columns=["ic95_inf", "ic95_sup"]), without
+        )
+
     def test_canonical_aggregation_rules(self) -> None:
         frame = aggregation_frame(pd.date_range("2025-01-01", periods=2, freq="D"))
         frame["precipitacao_total_mm"] = [4.0, 5.0]
@@ -67,6 +113,70 @@ class AggregationCorrectionTests(unittest.TestCase):
         result = aggregate_daily(frame, "MS").iloc[0]
         self.assertTrue(np.isnan(result["precipitacao_total_mm"]))
 
+    def test_index_matches_resample_with_gaps_and_missing_values(self) -> None:
+        rng = np.random.default_rng(3)
+        index = pd.date_range("2024-01-03", periods=200, freq="D").delete([40, 41, 90])
+        frame = aggregation_frame(index)
+        angle = rng.uniform(0, 2 * np.pi, len(index))
+        frame = frame.assign(
+            precipitacao_total_mm=rng.exponential(3, len(index)).round(1),
+            temperatura_media=rng.normal(21, 2, len(index)),
+            vento_rajada_max_ms=rng.uniform(5, 20, len(index)),
+            vento_dir_sin=np.sin(angle),
+            vento_dir_cos=np.cos(angle),
+        )
+        frame.iloc[60:75, frame.columns.get_loc("vento_rajada_max_ms")] = np.nan
+        frame.iloc[100, frame.columns.get_loc("temperatura_media")] = np.nan
+        aggregation = AggregationIndex(frame)
+
+        for frequency in ("W-MON", "MS", "9D"):
+            expected = resample_reference(frame, frequency)[list(aggregation_frame(index))]
+            pd.testing.assert_frame_equal(
+                aggregation.aggregate(frequency), expected, check_freq=False
+            )
+
+        window = aggregation.window("2024-02-10", "2024-03-20")
+        days = frame.loc["2024-02-10":"2024-03-20"]
+        self.assertEqual(window["interrupcoes"], days["interrupcoes"].sum())
+        self.assertAlmostEqual(window["temperatura_media"], days["temperatura_media"].mean())
+        self.assertEqual(window["vento_rajada_max_ms"], days["vento_rajada_max_ms"].max())
+        gusts = aggregation.window("2024-03-06", "2024-03-18")["vento_rajada_max_ms"]
+        self.assertTrue(np.isnan(gusts))
+
+    def test_scale_provider_is_lazy_and_shares_the_cache(self) -> None:
+        frame = aggregation_frame(pd.date_range("2025-01-01", periods=60, freq="D"))
+        cache = ScaleCache(maxsize=2)
+        scales = ScaleProvider(frame, cache=cache)
+        self.assertEqual(len(cache), 0)
+
+        monthly = scales["mensal"]
+        self.assertEqual(len(cache), 1)
+        self.assertIs(ScaleProvider(frame.copy(), cache=cache)["mensal"], monthly)
+        self.assertEqual(cache.hits, 1)
+        self.assertIs(scales["diario"], scales.frame)
+
+        changed = frame.copy()
+        changed.iloc[0, 0] += 1
+        self.assertEqual(ScaleProvider(changed, cache=cache)["mensal"].iloc[0, 0], 497)
+        scales.at("7D")
+        self.assertEqual(len(cache), 2)
+        self.assertIsNot(scales["mensal"], monthly)
+
+    def test_station_long_table_splits_into_daily_bases(self) -> None:
+        index = pd.date_range("2025-01-01", periods=3, freq="D")
+        frames = []
+        for station in ("A042", "A001"):
+            frame = aggregation_frame(index).rename_axis("data").reset_index()
+            frames.append(frame.assign(estacao=station))
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "clima_diario_estacoes.csv"
+            pd.concat(frames).to_csv(path, index=False)
+            bases = load_station_bases(path)
+
+        self.assertEqual(list(bases), ["A001", "A042"])
+        monthly = aggregate_daily(bases["A042"], "MS").iloc[0]
+        self.assertEqual(monthly["interrupcoes"], 6)
+
 
 if __name__ == "__main__":
     unittest.main()
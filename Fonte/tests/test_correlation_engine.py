@@ -0,0 +1,169 @@
+"""Regressões para o motor vetorizado de correlações."""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from scipy.stats import kendalltau
+
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import correlation_engine  # noqa: E402
+from correlation_engine import (  # noqa: E402
+    METHODS,
+    block_bootstrap_correlations,
+    bootstrap_intervals,
+    correlation_matrix,
+    correlation_pairs,
+    correlation_table,
+    kendall_tau_b,
+    lagged_correlations,
+    rolling_correlations,
+)
+
+
+def sample_frame(rows: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(2)
+    base = rng.normal(size=rows)
+    frame = pd.DataFrame(
+        {
+            "alvo": rng.poisson(20, rows) + (base > 0),
+            "chuva": np.maximum(base + rng.normal(size=rows), 0).round(1),
+            "temperatura": rng.normal(21, 2, rows).round(1),
+            "rajada": rng.integers(5, 15, rows).astype(float),
+        }
+    )
+    frame.loc[3, "chuva"] = np.nan
+    frame.loc[50:60, "temperatura"] = np.nan
+    return frame
+
+
+class CorrelationEngineTests(unittest.TestCase):
+    def test_matrices_match_pandas_with_pairwise_missing_values(self) -> None:
+        frame = sample_frame()
+        tidy = correlation_pairs(frame, methods=METHODS)
+
+        for method in METHODS:
+            np.testing.assert_allclose(
+                correlation_matrix(tidy, method).to_numpy(),
+                frame.corr(method=method).to_numpy(),
+                atol=1e-12,
+            )
+        pair = tidy[(tidy["variavel_x"] == "chuva") & (tidy["variavel_y"] == "temperatura")]
+        self.assertEqual(set(pair["n"]), {400 - 12})
+
+    def test_knight_kendall_matches_scipy_with_ties(self) -> None:
+        rng = np.random.default_rng(9)
+        for rows in (2, 3, 17, 256, 1001):
+            x = rng.integers(0, 6, rows)
+            y = rng.integers(0, 4, rows)
+            expected = kendalltau(x, y).statistic
+            result = kendall_tau_b(x, y)
+            if np.isnan(expected):
+                self.assertTrue(np.isnan(result))
+            else:
+                self.assertAlmostEqual(result, expected, places=12)
+        self.assertTrue(np.isnan(kendall_tau_b(np.ones(5), np.arange(5))))
+
+    def test_table_covers_every_scale_and_method(self) -> None:
+        frame = sample_frame()
+        frames = {"diario": frame, "parcial": frame.iloc[:100]}
+        table = correlation_table(frames, "alvo", ["chuva", "rajada"], METHODS)
+
+        self.assertEqual(len(table), 2 * 2 * len(METHODS))
+        row = table[
+            (table["nivel_temporal"] == "parcial")
+            & (table["variavel_y"] == "rajada")
+            & (table["metodo"] == "spearman")
+        ]
+        expected = frame.iloc[:100]["alvo"].corr(frame.iloc[:100]["rajada"], method="spearman")
+        self.assertAlmostEqual(float(row["r"].iloc[0]), expected, places=12)
+
+    def test_lag_window_matches_full_correlate_in_both_paths(self) -> None:
+        frame = sample_frame().drop(columns="temperatura").dropna()
+        target = frame["alvo"].to_numpy(dtype=float)
+        rain = frame["chuva"].to_numpy()
+        full = np.correlate(
+            (target - target.mean()) / target.std(),
+            (rain - rain.mean()) / (rain.std() * len(rain)),
+            mode="full",
+        )
+        lags = np.arange(-len(rain) + 1, len(rain))
+        expected = full[np.abs(lags) <= 20]
+
+        direct = lagged_correlations(frame, "alvo", ["chuva", "rajada"], 20, "direct")
+        fft = lagged_correlations(frame, "alvo", ["chuva", "rajada"], 20, "fft")
+
+        self.assertEqual(direct.index.tolist(), list(range(-20, 21)))
+        np.testing.assert_allclose(direct["chuva"], expected, atol=1e-12)
+        np.testing.assert_allclose(fft.to_numpy(), direct.to_numpy(), atol=1e-12)
+
+    def test_missing_rows_do_not_shift_the_time_axis(self) -> None:
+        days = np.arange(200, dtype=float)
+        frame = pd.DataFrame({"alvo": np.sin(days / 5), "chuva": np.sin((days - 3) / 5)})
+        frame.loc[100, "chuva"] = np.nan
+        lagged = lagged_correlations(frame, "alvo", ["chuva"], 6)
+
+        self.assertEqual(int(lagged["chuva"].idxmax()), -3)
+
+    def test_rolling_window_matches_pandas(self) -> None:
+        frame = sample_frame()
+        variables = ["chuva", "temperatura", "rajada"]
+        for window, min_periods in ((30, None), (90, 60)):
+            rolling = rolling_correlations(frame, "alvo", variables, window, min_periods)
+            expected = pd.DataFrame(
+                {
+                    name: frame["alvo"]
+                    .rolling(window, min_periods=min_periods)
+                    .corr(frame[name])
+                    for name in variables
+                }
+            )
+            pd.testing.assert_frame_equal(rolling, expected, atol=1e-10)
+
+    def test_constant_window_has_no_correlation(self) -> None:
+        frame = pd.DataFrame({"alvo": np.arange(60.0), "chuva": np.zeros(60)})
+        frame.loc[40:, "chuva"] = np.linspace(1, 4, 20)
+        rolling = rolling_correlations(frame, "alvo", ["chuva"], 10)
+
+        self.assertTrue(rolling["chuva"].iloc[:40].isna().all())
+        self.assertAlmostEqual(rolling["chuva"].iloc[-1], 1.0, places=12)
+
+    def test_block_bootstrap_matches_materialized_resamples(self) -> None:
+        frame = sample_frame(103)
+        variables = ["chuva", "temperatura", "rajada"]
+        resamples = block_bootstrap_correlations(frame, "alvo", variables, 7, 600, seed=3)
+
+        # Índices de moving_block_indices: blocos circulares truncados em n linhas.
+        starts = np.random.default_rng(3).integers(0, 103, size=(600, 15))
+        indices = ((starts[..., None] + np.arange(7)) % 103).reshape(600, -1)[:, :103]
+        expected = [
+            frame.iloc[rows][variables].corrwith(frame.iloc[rows]["alvo"])
+            for rows in indices
+        ]
+        np.testing.assert_allclose(resamples.to_numpy(), np.array(expected), atol=1e-12)
+
+        intervals = bootstrap_intervals(frame, "alvo", variables, 7, 600, seed=3)
+        self.assertTrue((intervals["ic_inferior"] <= intervals["ic_superior"]).all())
+
+    def test_block_bootstrap_does_not_depend_on_the_chunk_size(self) -> None:
+        frame = sample_frame(103)
+        variables = ["chuva", "temperatura"]
+        expected = block_bootstrap_correlations(frame, "alvo", variables, 7, 101, seed=3)
+        for chunk in (1, 3, 7, 1000):
+            with patch.object(correlation_engine, "BOOTSTRAP_CHUNK", chunk):
+                pd.testing.assert_frame_equal(
+                    block_bootstrap_correlations(frame, "alvo", variables, 7, 101, seed=3),
+                    expected,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Regressões para o motor declarativo de atributos e a matriz float32."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from feature_spec import FeatureMatrix, FeatureSpec, build_feature_matrix  # noqa: E402
+
+
+SPEC = FeatureSpec(
+    lag_columns=("interrupcoes", "chuva"),
+    lag_days=(1, 3),
+    ema_columns=("chuva",),
+    ema_spans=(3, 7),
+    std_columns=("chuva", "temperatura"),
+    std_window=4,
+)
+
+
+def daily_base(days: int = 60) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    return pd.DataFrame(
+        {
+            "interrupcoes": rng.integers(50, 300, days),
+            "chuva": rng.exponential(4, days),
+            "temperatura": rng.normal(21, 2, days),
+        },
+        index=pd.date_range("2021-01-01", periods=days, freq="D", name="data"),
+    )
+
+
+def pandas_reference(base: pd.DataFrame) -> pd.DataFrame:
+    frame = base.copy()
+    frame["mes"] = frame.index.month
+    frame["dia_semana"] = frame.index.dayofweek
+    frame["dia_ano"] = frame.index.dayofyear
+    frame["mes_sin"] = np.sin(2 * np.pi * frame["mes"] / 12)
+    frame["mes_cos"] = np.cos(2 * np.pi * frame["mes"] / 12)
+    for col in SPEC.lag_columns:
+        for k in SPEC.lag_days:
+            frame[f"{col}_lag_{k}"] = frame[col].shift(k)
+    for col in SPEC.ema_columns:
+        for span in SPEC.ema_spans:
+            frame[f"{col}_ema_{span}"] = frame[col].ewm(span=span, adjust=False).mean()
+    for col in SPEC.std_columns:
+        frame[f"{col}_std_4d"] = frame[col].rolling(window=4).std()
+    return frame.dropna()
+
+
+class FeatureSpecTests(unittest.TestCase):
+    def test_compiled_matrix_matches_column_by_column_pandas(self) -> None:
+        base = daily_base()
+        matrix = build_feature_matrix(SPEC, base, dtype=np.float64)
+        expected = pandas_reference(base)
+
+        self.assertEqual(matrix.columns, list(expected.columns))
+        self.assertTrue(matrix.values.flags["C_CONTIGUOUS"])
+        pd.testing.assert_frame_equal(
+            matrix.to_frame(), expected, check_dtype=False, check_freq=False
+        )
+
+    def test_context_rows_and_ema_state_continue_the_series(self) -> None:
+        base = daily_base()
+        full = build_feature_matrix(SPEC, base, dtype=np.float64).to_frame()
+        split = 40
+        initial = {name: full[name].loc[base.index[split - 1]] for name in SPEC.ema_names()}
+        tail = build_feature_matrix(
+            SPEC,
+            base.iloc[split - SPEC.context_rows :],
+            dtype=np.float64,
+            keep_from=SPEC.context_rows,
+            ema_initial=initial,
+        ).to_frame()
+
+        pd.testing.assert_frame_equal(
+            tail, full.iloc[full.index >= base.index[split]], check_freq=False
+        )
+
+    def test_saved_matrix_round_trips_with_integer_columns(self) -> None:
+        matrix = build_feature_matrix(SPEC, daily_base())
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "atributos.npy"
+            matrix.save(path)
+            loaded = FeatureMatrix.load(path)
+            frame = loaded.to_frame()
+
+            self.assertEqual(loaded.values.dtype, np.float32)
+            np.testing.assert_array_equal(loaded.values, matrix.values)
+        self.assertEqual(frame["interrupcoes"].dtype, np.int64)
+        self.assertEqual(frame.index[0], matrix.start)
+        self.assertEqual(loaded.column_index["chuva"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
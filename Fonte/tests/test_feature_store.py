@@ -0,0 +1,155 @@
+"""Regressões para o armazenamento versionado do dataset de atributos."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+sys.path.insert(0, str(SRC_DIR / "models"))
+
+from data_loader_dl import prepare_data_dl  # noqa: E402
+from feature_spec import FEATURE_SPEC, build_feature_matrix  # noqa: E402
+from feature_store import (  # noqa: E402
+    PYARROW_AVAILABLE,
+    load_feature_matrix,
+    load_features,
+    spec_hash,
+    write_feature_store,
+)
+
+
+def daily_base(days: int = 80) -> pd.DataFrame:
+    rng = np.random.default_rng(5)
+    return pd.DataFrame(
+        {
+            "interrupcoes": rng.integers(50, 300, days),
+            "precipitacao_total_mm": rng.exponential(4, days),
+            "temperatura_media": rng.normal(21, 2, days),
+            "vento_rajada_max_ms": rng.uniform(6, 15, days),
+        },
+        index=pd.date_range("2022-01-01", periods=days, freq="D", name="data"),
+    )
+
+
+class FeatureStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.root = Path(self.directory.name)
+        self.base_path = self.root / "base.csv"
+        self.store_path = self.root / "atributos.npy"
+        base = daily_base()
+        base.to_csv(self.base_path)
+        self.frame = build_feature_matrix(FEATURE_SPEC, base, dtype=np.float64).to_frame()
+
+    def write(self, frame: pd.DataFrame, **options) -> None:
+        write_feature_store(frame, self.store_path, base_path=self.base_path, **options)
+
+    def test_store_round_trips_with_hashes(self) -> None:
+        self.write(self.frame)
+        matrix = load_feature_matrix(self.store_path)
+        loaded = load_features(self.store_path)
+
+        self.assertIsInstance(matrix.values, np.memmap)
+        self.assertEqual(matrix.metadata["hash_especificacao"], spec_hash(FEATURE_SPEC))
+        self.assertEqual(matrix.metadata["base"], "base.csv")
+        self.assertEqual(loaded["interrupcoes"].dtype, np.int64)
+        pd.testing.assert_frame_equal(
+            loaded, self.frame, check_dtype=False, check_freq=False, rtol=1e-6
+        )
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow não instalado")
+    def test_arrow_file_matches_matrix(self) -> None:
+        self.write(self.frame)
+        from_arrow = load_features(self.store_path.with_suffix(".arrow"))
+
+        pd.testing.assert_frame_equal(
+            from_arrow, load_features(self.store_path), check_freq=False
+        )
+
+    def test_changed_base_or_spec_is_rejected(self) -> None:
+        self.write(self.frame)
+        other_spec = replace(FEATURE_SPEC, std_window=5)
+        with self.assertRaisesRegex(ValueError, "especificação"):
+            load_features(self.store_path, spec=other_spec)
+
+        daily_base(81).to_csv(self.base_path)
+        with self.assertRaisesRegex(ValueError, "base atual"):
+            load_feature_matrix(self.store_path)
+
+    def test_append_continues_the_store(self) -> None:
+        self.write(self.frame.iloc[:40])
+        self.write(self.frame.iloc[40:], append=True)
+        with self.assertRaises(ValueError):
+            self.write(self.frame.iloc[45:], append=True)
+
+        pd.testing.assert_frame_equal(
+            load_features(self.store_path),
+            self.frame,
+            check_dtype=False,
+            check_freq=False,
+            rtol=1e-6,
+        )
+
+    def test_interrupted_write_keeps_the_previous_store(self) -> None:
+        self.write(self.frame)
+        before = {
+            name: (self.root / name).read_bytes()
+            for name in ("atributos.npy", "atributos.json")
+        }
+
+        def interrupted(handle, values, **options) -> None:
+            handle.write(b"\x93NUMPY truncado")
+            raise KeyboardInterrupt
+
+        with patch("feature_spec.np.save", side_effect=interrupted):
+            with self.assertRaises(KeyboardInterrupt):
+                self.write(self.frame.iloc[:-5])
+
+        for name, content in before.items():
+            self.assertEqual((self.root / name).read_bytes(), content)
+        self.assertEqual(len(load_feature_matrix(self.store_path).values), len(self.frame))
+
+    def test_missing_store_falls_back_to_csv(self) -> None:
+        self.frame.to_csv(self.store_path.with_suffix(".csv"))
+        with contextlib.redirect_stdout(io.StringIO()) as log:
+            loaded = load_features(self.store_path)
+        self.write(self.frame)
+
+        self.assertIn("float32", log.getvalue())
+        pd.testing.assert_frame_equal(loaded, load_features(self.store_path))
+
+    def test_fallback_csv_with_other_spec_is_rejected(self) -> None:
+        self.frame.to_csv(self.store_path.with_suffix(".csv"))
+        with contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaisesRegex(ValueError, "especificação"):
+                load_features(self.store_path, spec=replace(FEATURE_SPEC, std_window=5))
+
+    def test_deep_learning_loader_reads_store_like_csv(self) -> None:
+        self.write(self.frame)
+        csv_path = self.root / "atributos_texto.csv"
+        self.frame.to_csv(csv_path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            from_store = prepare_data_dl(self.store_path, seq_length=5, test_size_days=10)
+            from_csv = prepare_data_dl(csv_path, seq_length=5, test_size_days=10)
+
+        for left, right in zip(from_store[:4], from_csv[:4]):
+            np.testing.assert_allclose(left.numpy(), right.numpy(), atol=1e-6)
+        self.assertEqual(from_store[5], from_csv[5])
+        self.assertTrue(from_store[6].equals(from_csv[6]))
+
+
+if __name__ == "__main__":
+    unittest.main()
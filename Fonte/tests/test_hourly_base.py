@@ -0,0 +1,93 @@
+"""Regressões para a base horária mapeada em memória."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from build_base_from_standardized import hourly_weather_moments  # noqa: E402
+from hourly_base import HourlyBase, write_hourly_base  # noqa: E402
+
+
+def hourly_weather() -> pd.DataFrame:
+    frame = pd.DataFrame(
+        {
+            "data": pd.to_datetime(["2025-01-01", "2025-01-01", "2025-01-02"]),
+            "hora_utc": ["0300 UTC", "0900 UTC", "0000 UTC"],
+            "precipitacao_total_horario_mm": [1.0, 2.0, 3.0],
+            "temperatura_ar_bulbo_seco_c": [20.0, 21.0, 22.0],
+            "vento_direcao_horaria_gr": [10.0, 20.0, 30.0],
+            "vento_rajada_max_ms": [8.0, 7.0, 6.0],
+            "vento_velocidade_horaria_ms": [2.0, 3.0, 1.0],
+        }
+    )
+    return hourly_weather_moments(frame)
+
+
+class HourlyBaseTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        events = pd.Series(
+            pd.to_datetime(
+                ["2025-01-01 06:10", "2025-01-01 06:50", "2025-01-01 21:05"]
+            )
+        )
+        write_hourly_base(
+            Path(self.directory.name) / "base_horaria",
+            events,
+            hourly_weather(),
+            pd.Timestamp("2025-01-01"),
+            pd.Timestamp("2025-01-02"),
+        )
+        self.base = HourlyBase(Path(self.directory.name) / "base_horaria")
+
+    def tearDown(self) -> None:
+        self.base = None
+        self.directory.cleanup()
+
+    def test_grid_is_continuous_in_local_time(self) -> None:
+        self.assertEqual(self.base.hours, 48)
+        counts = self.base["interrupcoes"]
+        self.assertEqual(counts.dtype, np.int32)
+        self.assertEqual(counts[6], 2)
+        self.assertEqual(counts[21], 1)
+        self.assertEqual(int(counts.sum()), 3)
+
+    def test_utc_weather_is_shifted_to_local_hours(self) -> None:
+        rain = self.base["precipitacao_total_horario_mm"]
+        self.assertEqual(rain.dtype, np.float32)
+        self.assertEqual(rain[self.base.offset("2025-01-01 00:00")], 1.0)
+        self.assertEqual(rain[self.base.offset("2025-01-01 06:00")], 2.0)
+        self.assertEqual(rain[self.base.offset("2025-01-01 21:00")], 3.0)
+        self.assertTrue(np.isnan(rain[1]))
+
+    def test_window_before_is_a_zero_copy_view(self) -> None:
+        window = self.base.window_before(
+            "precipitacao_total_horario_mm", "2025-01-01 06:50", 6
+        )
+        self.assertEqual(len(window), 6)
+        self.assertEqual(window[0], 1.0)
+        self.assertTrue(
+            np.shares_memory(window, self.base["precipitacao_total_horario_mm"])
+        )
+        self.assertEqual(
+            len(self.base.slice("interrupcoes", "2025-01-02 00:00", "2025-01-03 00:00")),
+            24,
+        )
+
+    def test_offsets_outside_the_grid_are_rejected(self) -> None:
+        with self.assertRaises(IndexError):
+            self.base.offset("2025-01-03 00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+"""Regressões para a engenharia de atributos incremental."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+def load_feature_engineering_module():
+    path = SRC_DIR / "03_feature_engineering.py"
+    spec = importlib.util.spec_from_file_location("feature_engineering", path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+feature_engineering = load_feature_engineering_module()
+
+
+def synthetic_base(days: int) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    angle = rng.uniform(0, 2 * np.pi, days)
+    base = pd.DataFrame(
+        {
+            "data": pd.date_range("2020-01-01", periods=days, freq="D"),
+            "interrupcoes": rng.integers(100, 400, days),
+            "temperatura_media": rng.normal(21, 2, days),
+            "precipitacao_total_mm": rng.exponential(3, days).round(1),
+            "vento_velocidade_media_ms": rng.uniform(1, 4, days),
+            "vento_velocidade_max_ms": rng.uniform(4, 9, days),
+            "vento_rajada_max_ms": rng.uniform(6, 15, days),
+            "vento_dir_sin": np.sin(angle),
+            "vento_dir_cos": np.cos(angle),
+            "n_registros": 24,
+        }
+    )
+    base.loc[10, "temperatura_media"] = np.nan
+    return base
+
+
+class IncrementalFeatureTests(unittest.TestCase):
+    def run_quietly(self, function, *args):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return function(*args)
+
+    def test_appended_days_match_full_recompute(self) -> None:
+        base = synthetic_base(90)
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            base_path = root / "base.csv"
+            output = root / "features.csv"
+            state = root / "estado.json"
+
+            base.iloc[:40].to_csv(base_path, index=False)
+            self.run_quietly(
+                feature_engineering.build_feature_dataset, base_path, output, state
+            )
+            for rows in (41, 70, 90):
+                base.iloc[:rows].to_csv(base_path, index=False)
+                self.run_quietly(
+                    feature_engineering.update_feature_dataset,
+                    base_path,
+                    output,
+                    state,
+                )
+
+            self.run_quietly(
+                feature_engineering.check_against_full_recompute, base_path, output
+            )
+            written = pd.read_csv(output)
+            self.assertEqual(len(written), 90 - 7)
+            self.assertEqual(written["data"].iloc[-1], "2020-03-30")
+            self.assertEqual(written["interrupcoes"].dtype, np.int64)
+
+    def test_interpolated_tail_forces_full_recompute(self) -> None:
+        base = synthetic_base(40)
+        base.loc[29, "precipitacao_total_mm"] = np.nan
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            base_path = root / "base.csv"
+            output = root / "features.csv"
+            state = root / "estado.json"
+
+            base.iloc[:30].to_csv(base_path, index=False)
+            self.run_quietly(
+                feature_engineering.build_feature_dataset, base_path, output, state
+            )
+            self.assertTrue(
+                json.loads(state.read_text(encoding="utf-8"))["cauda_interpolada"]
+            )
+            base.to_csv(base_path, index=False)
+            with contextlib.redirect_stdout(io.StringIO()) as log:
+                feature_engineering.update_feature_dataset(base_path, output, state)
+
+            self.assertIn("recalculo completo", log.getvalue())
+            self.run_quietly(
+                feature_engineering.check_against_full_recompute, base_path, output
+            )
+
+
+    def test_causal_update_never_revisits_history(self) -> None:
+        base = synthetic_base(60)
+        base.loc[39, ["precipitacao_total_mm", "vento_dir_sin", "vento_dir_cos"]] = np.nan
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            base_path = root / "base.csv"
+            output = root / "features.csv"
+            state = root / "estado.json"
+
+            base.iloc[:40].to_csv(base_path, index=False)
+            self.run_quietly(
+                feature_engineering.build_feature_dataset,
+                base_path, output, state, None, "kalman",
+            )
+            first = pd.read_csv(output)
+            base.to_csv(base_path, index=False)
+            with contextlib.redirect_stdout(io.StringIO()) as log:
+                feature_engineering.update_feature_dataset(
+                    base_path, output, state, None, "kalman"
+                )
+            self.assertNotIn("recalculo completo", log.getvalue())
+            self.run_quietly(
+                feature_engineering.check_against_full_recompute,
+                base_path, output, 1e-9, 1e-9, "kalman",
+            )
+            written = pd.read_csv(output)
+
+        pd.testing.assert_frame_equal(written.iloc[: len(first)], first)
+        last = written.set_index("data").loc["2020-02-09"]
+        self.assertAlmostEqual(
+            np.hypot(last["vento_dir_sin"], last["vento_dir_cos"]), 1.0
+        )
+
+    def test_streaming_days_match_batch_imputation(self) -> None:
+        base = synthetic_base(30).set_index("data").drop(columns="n_registros")
+        base = base.drop(index=base.index[[12, 13]])
+        base.loc[base.index[20], "temperatura_media"] = np.nan
+        columns = feature_engineering.METEO_COLUMNS
+
+        batch = pd.concat(
+            feature_engineering.impute_causal(
+                [base], feature_engineering.CausalImputer(columns, "locf")
+            )
+        )
+        imputer = feature_engineering.CausalImputer(columns, "locf")
+        days = [base.iloc[[row]] for row in range(len(base))]
+        streamed = pd.concat(feature_engineering.impute_causal(days, imputer))
+
+        pd.testing.assert_frame_equal(streamed, batch, check_freq=False)
+        self.assertEqual(len(batch), 30)
+        temperature = batch["temperatura_media"]
+        self.assertEqual(temperature.iloc[10], temperature.iloc[9])
+        self.assertEqual(temperature.iloc[13], base["temperatura_media"].iloc[11])
+        self.assertEqual(temperature.iloc[22], temperature.iloc[21])
+        self.assertTrue(np.isnan(batch["interrupcoes"].iloc[12]))
+        restored = feature_engineering.CausalImputer.from_state(imputer.to_state())
+        self.assertEqual(restored.last_day, base.index[-1])
+        np.testing.assert_array_equal(restored.level, imputer.level)
+
+
+if __name__ == "__main__":
+    unittest.main()
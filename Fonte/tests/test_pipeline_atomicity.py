@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import argparse
+import contextlib
+import io
 import sys
 import tempfile
 import unittest
@@ -61,6 +64,88 @@ class PipelineAtomicityTests(unittest.TestCase):
                 "old",
             )
 
+    def test_linked_workspace_never_writes_through_to_the_sources(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "source"
+            src = make_directory(source / "src", "script.py", "pass")
+            tests = make_directory(source / "tests", "test_example.py", "pass")
+            interface = make_directory(source / "interface", "model_service.py", "pass")
+            data = make_directory(source / "data", "raw.csv", "raw")
+            (data / "estado.json").write_text("{}", encoding="utf-8")
+            images = make_directory(source / "images", "figura.png", "old")
+            fonte_dir = make_directory(source / "Fonte", "run_pipeline.py", "pass")
+            stages = (run_pipeline.Stage("etapa", None, outputs=("data/estado.json",)),)
+
+            with (
+                patch.object(run_pipeline, "SRC_DIR", src),
+                patch.object(run_pipeline, "TESTS_DIR", tests),
+                patch.object(run_pipeline, "INTERFACE_DIR", interface),
+                patch.object(run_pipeline, "DATA_DIR", data),
+                patch.object(run_pipeline, "FONTE_DIR", fonte_dir),
+                patch.object(run_pipeline, "MONOGRAPH_IMAGES", images),
+                patch.object(run_pipeline, "PIPELINE_STAGES", stages),
+                contextlib.redirect_stdout(io.StringIO()),
+            ):
+                project, fonte = run_pipeline.prepare_workspace(root / "stage", "link")
+
+            self.assertEqual((fonte / "data" / "raw.csv").read_text(), "raw")
+            (fonte / "data" / "estado.json").write_text("novo", encoding="utf-8")
+            self.assertEqual((data / "estado.json").read_text(), "{}")
+
+            (fonte / "results" / "eda" / "figura.png").write_text("new", encoding="utf-8")
+            run_pipeline.synchronize_figures(project, fonte)
+            self.assertEqual((images / "figura.png").read_text(), "old")
+            self.assertEqual(
+                (project / "Monografia" / "img" / "figura.png").read_text(), "new"
+            )
+
+    def test_in_place_write_to_a_hardlink_fails_the_stage(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "source"
+            src = make_directory(
+                source / "src",
+                "grava.py",
+                "with open('../data/raw.csv', 'a') as stream:\n"
+                "    stream.write(',alterado')\n",
+            )
+            tests = make_directory(source / "tests", "test_example.py", "pass")
+            interface = make_directory(source / "interface", "model_service.py", "pass")
+            data = make_directory(source / "data", "raw.csv", "raw")
+            (data / "substituido.csv").write_text("antigo", encoding="utf-8")
+            images = make_directory(source / "images", "figura.png", "old")
+            fonte_dir = make_directory(source / "Fonte", "run_pipeline.py", "pass")
+            stages = (run_pipeline.Stage("grava", "src/grava.py"),)
+            args = argparse.Namespace(
+                interruptions=data / "raw.csv",
+                inmet_dir=data,
+                no_cache=True,
+                clear_cache=False,
+                workers=1,
+                runner="subprocess",
+            )
+
+            with (
+                patch.object(run_pipeline, "SRC_DIR", src),
+                patch.object(run_pipeline, "TESTS_DIR", tests),
+                patch.object(run_pipeline, "INTERFACE_DIR", interface),
+                patch.object(run_pipeline, "DATA_DIR", data),
+                patch.object(run_pipeline, "FONTE_DIR", fonte_dir),
+                patch.object(run_pipeline, "MONOGRAPH_IMAGES", images),
+                patch.object(run_pipeline, "PIPELINE_STAGES", stages),
+                patch.object(run_pipeline.TreeStager, "_reflink", return_value=False),
+                contextlib.redirect_stdout(io.StringIO()),
+            ):
+                project, fonte = run_pipeline.prepare_workspace(root / "stage", "link")
+                replacement = fonte / "data" / "novo.tmp"
+                replacement.write_text("novo", encoding="utf-8")
+                replacement.replace(fonte / "data" / "substituido.csv")
+                self.assertEqual(run_pipeline.altered_hardlinks(project), [])
+
+                with self.assertRaisesRegex(RuntimeError, "Fonte/data/raw.csv"):
+                    run_pipeline.execute_pipeline(project, fonte, args)
+
     def test_successful_promotion_replaces_every_directory(self) -> None:
         with tempfile.TemporaryDirectory() as directory:
             root = Path(directory)
@@ -0,0 +1,135 @@
+"""Regressões para o cache de etapas do pipeline."""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+FONTE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(FONTE_DIR))
+
+import run_pipeline  # noqa: E402
+from run_pipeline import Stage, StageCache, stage_key  # noqa: E402
+
+
+STAGE = Stage(
+    "grafico",
+    "src/models/grafico.py",
+    inputs=("data/base.csv",),
+    outputs=("results/ml/grafico.png", "results/ml/metricas.csv"),
+)
+
+
+def make_fonte(root: Path) -> Path:
+    fonte = root / "Fonte"
+    (fonte / "src" / "models").mkdir(parents=True)
+    (fonte / "data").mkdir()
+    (fonte / "src" / "models" / "grafico.py").write_text(
+        "import numpy\nfrom apoio import rotulo\n", encoding="utf-8"
+    )
+    (fonte / "src" / "apoio.py").write_text("import base\nrotulo = 'a'\n", encoding="utf-8")
+    (fonte / "src" / "base.py").write_text("", encoding="utf-8")
+    (fonte / "src" / "outro.py").write_text("", encoding="utf-8")
+    (fonte / "data" / "base.csv").write_text("x\n1\n", encoding="utf-8")
+    return fonte
+
+
+class PipelineCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+        self.fonte = make_fonte(self.root)
+
+    def test_key_follows_script_imports_inputs_and_parameters(self) -> None:
+        key = stage_key(STAGE, self.fonte)
+        self.assertEqual(stage_key(STAGE, self.fonte), key)
+        self.assertIsNone(stage_key(Stage("testes", None), self.fonte))
+
+        (self.fonte / "src" / "outro.py").write_text("valor = 1\n", encoding="utf-8")
+        self.assertEqual(stage_key(STAGE, self.fonte), key)
+
+        keys = {key, stage_key(STAGE, self.fonte, ("--rapido",))}
+        for path, content in (
+            ("src/base.py", "valor = 2\n"),
+            ("data/base.csv", "x\n2\n"),
+            ("src/models/grafico.py", "from apoio import rotulo\n"),
+        ):
+            (self.fonte / path).write_text(content, encoding="utf-8")
+            keys.add(stage_key(STAGE, self.fonte))
+        self.assertEqual(len(keys), 5)
+
+    def test_key_follows_threads_of_heavy_stages_only(self) -> None:
+        heavy = Stage(STAGE.name, STAGE.script, STAGE.inputs, STAGE.outputs, heavy=True)
+        self.assertEqual(
+            stage_key(STAGE, self.fonte, threads=1), stage_key(STAGE, self.fonte, threads=8)
+        )
+        self.assertNotEqual(
+            stage_key(heavy, self.fonte, threads=1), stage_key(heavy, self.fonte, threads=8)
+        )
+
+    def test_key_follows_library_versions(self) -> None:
+        key = stage_key(STAGE, self.fonte)
+        upgraded = {**run_pipeline.library_versions(), "pandas": "99.0"}
+        with patch.object(run_pipeline, "library_versions", return_value=upgraded):
+            self.assertNotEqual(stage_key(STAGE, self.fonte), key)
+
+    def test_prune_drops_least_recently_used_entries_first(self) -> None:
+        cache = StageCache(self.root / "cache")
+        results = self.fonte / "results" / "ml"
+        results.mkdir(parents=True)
+        keys = ("antiga", "usada", "recente")
+        for age, key in enumerate(keys):
+            (results / "grafico.png").write_bytes(key.encode() * 100)
+            (results / "metricas.csv").write_text("compartilhado\n", encoding="utf-8")
+            cache.store(STAGE, key, self.fonte)
+            entry = self.root / "cache" / "etapas" / STAGE.name / f"{key}.json"
+            os.utime(entry, (1000 + age, 1000 + age))
+        self.assertTrue(cache.restore(STAGE, "antiga", self.fonte))
+
+        self.assertEqual(cache.prune(2000), (0, 0))
+        removed, freed = cache.prune(1400)
+
+        self.assertEqual((removed, freed), (1, 500))
+        self.assertFalse(cache.restore(STAGE, "usada", self.fonte))
+        self.assertTrue(cache.restore(STAGE, "recente", self.fonte))
+        self.assertTrue(cache.restore(STAGE, "antiga", self.fonte))
+        self.assertEqual(cache.prune(0)[0], 2)
+        objects = (self.root / "cache" / "objetos").rglob("*")
+        self.assertFalse(any(path.is_file() for path in objects))
+
+    def test_outputs_are_restored_into_a_fresh_workspace(self) -> None:
+        cache = StageCache(self.root / "cache")
+        key = stage_key(STAGE, self.fonte)
+        self.assertFalse(cache.restore(STAGE, key, self.fonte))
+
+        results = self.fonte / "results" / "ml"
+        results.mkdir(parents=True)
+        (results / "grafico.png").write_bytes(b"png")
+        (results / "metricas.csv").write_text("mae\n1\n", encoding="utf-8")
+        cache.store(STAGE, key, self.fonte)
+
+        fresh = make_fonte(self.root / "nova")
+        self.assertEqual(stage_key(STAGE, fresh), key)
+        self.assertTrue(cache.restore(STAGE, key, fresh))
+        self.assertEqual((fresh / "results" / "ml" / "grafico.png").read_bytes(), b"png")
+
+        for stored in (self.root / "cache" / "objetos").rglob("*"):
+            if stored.is_file():
+                stored.unlink()
+        self.assertFalse(cache.restore(STAGE, key, make_fonte(self.root / "terceira")))
+
+    def test_declared_stages_have_keys_in_the_source_tree(self) -> None:
+        for stage in run_pipeline.PIPELINE_STAGES:
+            if stage.script is not None:
+                self.assertTrue((FONTE_DIR / stage.script).is_file(), stage.script)
+                self.assertEqual(len(stage_key(stage, FONTE_DIR)), 64)
+
+
+if __name__ == "__main__":
+    unittest.main()
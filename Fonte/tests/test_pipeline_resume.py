@@ -0,0 +1,182 @@
+"""Regressões para a retomada de uma execução interrompida do pipeline."""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+FONTE_DIR = Path(__file__).resolve().parents[1]
+PROJECT_ROOT = FONTE_DIR.parent
+sys.path.insert(0, str(FONTE_DIR))
+
+import run_pipeline  # noqa: E402
+from run_pipeline import Stage, StageJournal  # noqa: E402
+
+
+STAGES = [
+    Stage("a", "src/a.py", outputs=("data/a.csv",)),
+    Stage("b", "src/b.py", inputs=("data/a.csv",), outputs=("data/b.csv",)),
+]
+FIRST = (
+    "import pathlib\n"
+    "data = pathlib.Path('../data')\n"
+    "with (data / 'chamadas.txt').open('a') as calls:\n"
+    "    calls.write('a')\n"
+    "(data / 'a.csv').write_text('x\\n1\\n')\n"
+)
+FAILING = "raise SystemExit('falha simulada')\n"
+FIXED = (
+    "import pathlib\n"
+    "data = pathlib.Path('../data')\n"
+    "(data / 'b.csv').write_text((data / 'a.csv').read_text())\n"
+)
+
+
+class PipelineResumeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+
+    def write_sources(self, src: Path, second: str) -> None:
+        src.mkdir(parents=True, exist_ok=True)
+        (src / "a.py").write_text(FIRST, encoding="utf-8")
+        (src / "b.py").write_text(second, encoding="utf-8")
+
+    def test_journal_rejects_changed_keys_outputs_and_truncated_lines(self) -> None:
+        fonte = self.root / "Fonte"
+        (fonte / "data").mkdir(parents=True)
+        (fonte / "data" / "a.csv").write_text("x\n1\n", encoding="utf-8")
+        journal = StageJournal(self.root / run_pipeline.JOURNAL_FILENAME)
+        journal.record(STAGES[0], "chave", fonte)
+        journal.record(Stage("testes", None), None, fonte)
+        with journal.path.open("a", encoding="utf-8") as handle:
+            handle.write('{"etapa": "b", "cha')
+
+        reopened = StageJournal(journal.path)
+        self.assertEqual(set(reopened.entries), {"a"})
+        self.assertTrue(reopened.completed(STAGES[0], "chave", fonte))
+        self.assertFalse(reopened.completed(STAGES[0], "outra", fonte))
+        self.assertFalse(reopened.completed(Stage("testes", None), None, fonte))
+        (fonte / "data" / "a.csv").write_text("x\n2\n", encoding="utf-8")
+        self.assertFalse(reopened.completed(STAGES[0], "chave", fonte))
+
+    def test_resume_reruns_only_the_failed_stage_with_fixed_sources(self) -> None:
+        stage_root = self.root / "stage"
+        staged_project = stage_root / "project"
+        staged_fonte = staged_project / "Fonte"
+        self.write_sources(staged_fonte / "src", FAILING)
+        for name in ("data", "tests", "interface"):
+            (staged_fonte / name).mkdir()
+        repository = self.root / "repo"
+        self.write_sources(repository / "src", FIXED)
+        (repository / "tests").mkdir()
+        (repository / "interface").mkdir()
+        (repository / "run_pipeline.py").write_text("", encoding="utf-8")
+        (self.root / "fonte.csv").write_text("x\n", encoding="utf-8")
+        args = argparse.Namespace(
+            interruptions=self.root / "fonte.csv",
+            inmet_dir=self.root,
+            no_cache=True,
+            clear_cache=False,
+            workers=1,
+            runner="subprocess",
+        )
+
+        with (
+            patch.object(run_pipeline, "PIPELINE_STAGES", STAGES),
+            patch.object(run_pipeline, "FONTE_DIR", repository),
+            patch.object(run_pipeline, "SRC_DIR", repository / "src"),
+            patch.object(run_pipeline, "TESTS_DIR", repository / "tests"),
+            patch.object(run_pipeline, "INTERFACE_DIR", repository / "interface"),
+            contextlib.redirect_stdout(io.StringIO()),
+            contextlib.redirect_stderr(io.StringIO()),
+        ):
+            with self.assertRaises(subprocess.CalledProcessError):
+                run_pipeline.execute_pipeline(staged_project, staged_fonte, args)
+            (stage_root / "rollback").mkdir()
+            project, fonte = run_pipeline.resume_workspace(stage_root)
+            telemetry = run_pipeline.execute_pipeline(project, fonte, args)
+
+        self.assertEqual((fonte / "data" / "chamadas.txt").read_text(), "a")
+        self.assertTrue(telemetry["etapas"]["a"]["retomada"])
+        self.assertNotIn("retomada", telemetry["etapas"]["b"])
+        self.assertEqual((fonte / "data" / "b.csv").read_text(), "x\n1\n")
+        self.assertFalse((stage_root / "rollback").exists())
+
+        with self.assertRaisesRegex(FileNotFoundError, "diário"):
+            run_pipeline.resume_workspace(self.root / "vazia")
+
+    def test_main_resumes_the_area_preserved_by_a_failed_run(self) -> None:
+        project = self.root / "projeto"
+        fonte = project / "Fonte"
+        self.write_sources(fonte / "src", FAILING)
+        for path in ("tests", "interface", "data", "results/eda", "results/ml"):
+            (fonte / path).mkdir(parents=True)
+            (fonte / path / ".gitkeep").write_text("", encoding="utf-8")
+        (project / "Monografia" / "img").mkdir(parents=True)
+        (project / "Monografia" / "img" / ".gitkeep").write_text("", encoding="utf-8")
+        (fonte / "run_pipeline.py").write_text("", encoding="utf-8")
+        (project / ".gitignore").write_bytes((PROJECT_ROOT / ".gitignore").read_bytes())
+        (self.root / "fonte.csv").write_text("x\n", encoding="utf-8")
+
+        def git(*arguments: str) -> None:
+            identity = ["-c", "user.name=teste", "-c", "user.email=teste@exemplo"]
+            subprocess.run(
+                ["git", *identity, *arguments],
+                cwd=project,
+                check=True,
+                capture_output=True,
+            )
+
+        git("init", "-q")
+        git("add", "-A")
+        git("commit", "-q", "-m", "base")
+        argv = [
+            "--interruptions",
+            str(self.root / "fonte.csv"),
+            "--inmet-dir",
+            str(self.root),
+            "--workers",
+            "1",
+            "--no-cache",
+        ]
+        with (
+            patch.object(run_pipeline, "PIPELINE_STAGES", STAGES),
+            patch.object(run_pipeline, "GENERATED_DATA_FILES", ("a.csv", "b.csv")),
+            patch.object(run_pipeline, "REQUIRED_EDA_FILES", ()),
+            patch.object(run_pipeline, "REQUIRED_ML_FILES", ()),
+            patch.object(run_pipeline, "PROJECT_ROOT", project),
+            patch.object(run_pipeline, "FONTE_DIR", fonte),
+            patch.object(run_pipeline, "SRC_DIR", fonte / "src"),
+            patch.object(run_pipeline, "TESTS_DIR", fonte / "tests"),
+            patch.object(run_pipeline, "INTERFACE_DIR", fonte / "interface"),
+            patch.object(run_pipeline, "DATA_DIR", fonte / "data"),
+            patch.object(run_pipeline, "RESULTS_DIR", fonte / "results"),
+            patch.object(run_pipeline, "MONOGRAPH_IMAGES", project / "Monografia" / "img"),
+            contextlib.redirect_stdout(io.StringIO()),
+            contextlib.redirect_stderr(io.StringIO()),
+        ):
+            with self.assertRaises(subprocess.CalledProcessError):
+                run_pipeline.main(argv)
+            (stage_root,) = project.glob(".pipeline-*")
+            (fonte / "src" / "b.py").write_text(FIXED, encoding="utf-8")
+            git("commit", "-q", "-am", "corrige b")
+
+            run_pipeline.main([*argv, "--resume", str(stage_root)])
+
+        self.assertFalse(stage_root.exists())
+        self.assertEqual((fonte / "data" / "chamadas.txt").read_text(), "a")
+        self.assertEqual((fonte / "data" / "b.csv").read_text(), "x\n1\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
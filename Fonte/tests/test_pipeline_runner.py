@@ -0,0 +1,64 @@
+"""Regressões para a execução das etapas em workers pré-aquecidos."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+FONTE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(FONTE_DIR))
+
+from run_pipeline import WarmRunner  # noqa: E402
+
+
+STAGE_SCRIPT = """\
+import os
+import sys
+
+import matplotlib
+import numpy as np
+
+import estado
+
+estado.chamadas.append(sys.argv[1])
+print(os.getpid(), os.getcwd(), estado.chamadas, np.random.random(),
+      matplotlib.rcParams["font.size"], os.environ["OMP_NUM_THREADS"])
+matplotlib.rcParams["font.size"] = 31
+if sys.argv[1] == "falha":
+    raise RuntimeError("etapa com erro")
+"""
+
+
+class WarmRunnerTests(unittest.TestCase):
+    def test_stages_share_a_worker_but_not_their_state(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            script = root / "src" / "etapa.py"
+            script.parent.mkdir()
+            script.write_text(STAGE_SCRIPT, encoding="utf-8")
+            (root / "src" / "estado.py").write_text("chamadas = []\n", encoding="utf-8")
+
+            with WarmRunner(1, modules=("numpy", "matplotlib.pyplot")) as runner:
+                codes = [
+                    runner.run_script(script, (name,), root / f"{name}.log", 2, root)[0]
+                    for name in ("primeira", "segunda", "falha")
+                ]
+
+            self.assertEqual(codes, [0, 0, 1])
+            first, second = (
+                (root / f"{name}.log").read_text().split()
+                for name in ("primeira", "segunda")
+            )
+            self.assertEqual(first[0], second[0])
+            self.assertEqual(first[1], str(script.parent))
+            self.assertEqual(second[2], "['segunda']")
+            self.assertEqual(first[3:5], second[3:5])
+            self.assertEqual(first[5], "2")
+            self.assertIn("etapa com erro", (root / "falha.log").read_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""Regressões para o grafo de etapas e o escalonador do pipeline."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+
+FONTE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(FONTE_DIR))
+
+import run_pipeline  # noqa: E402
+from run_pipeline import Stage  # noqa: E402
+
+
+def chain_stages() -> list[Stage]:
+    """``a`` alimenta ``b`` e ``c``, que alimentam ``d``."""
+    return [
+        Stage("a", None, outputs=("data/a.csv",)),
+        Stage("b", None, inputs=("data/a.csv",), outputs=("data/b.csv",)),
+        Stage("c", None, inputs=("data/a.csv",), outputs=("data/c.csv",)),
+        Stage("d", None, inputs=("data/b.csv", "data/c.csv")),
+    ]
+
+
+class PipelineScheduleTests(unittest.TestCase):
+    def test_declared_graph_produces_every_required_artifact(self) -> None:
+        required = {f"data/{name}" for name in run_pipeline.GENERATED_DATA_FILES}
+        required |= {f"results/eda/{name}" for name in run_pipeline.REQUIRED_EDA_FILES}
+        required |= {f"results/ml/{name}" for name in run_pipeline.REQUIRED_ML_FILES}
+        produced = {
+            path for stage in run_pipeline.PIPELINE_STAGES for path in stage.outputs
+        }
+        self.assertLessEqual(required, produced)
+
+        dependencies = run_pipeline.stage_dependencies(run_pipeline.PIPELINE_STAGES)
+        self.assertEqual(
+            dependencies["01_eda_sazonalidade"], {"build_base_from_standardized"}
+        )
+        self.assertNotIn("lstm_bidirecional", dependencies["gru_avancada"])
+        self.assertIn("testes", dependencies["baseline_xgboost"])
+        self.assertIn("baseline_xgboost", dependencies["previsao_multihorizonte"])
+
+    def test_independent_stages_run_concurrently_after_their_inputs(self) -> None:
+        both_running = threading.Barrier(2, timeout=5)
+        order: list[str] = []
+        lock = threading.Lock()
+
+        def run_stage(stage: Stage, threads: int) -> None:
+            if stage.name in ("b", "c"):
+                both_running.wait()
+            with lock:
+                order.append(stage.name)
+
+        run_pipeline.schedule_stages(chain_stages(), run_stage, workers=2)
+
+        self.assertEqual(order[0], "a")
+        self.assertEqual(set(order[1:3]), {"b", "c"})
+        self.assertEqual(order[3], "d")
+
+    def test_failure_stops_dependent_stages(self) -> None:
+        started: list[str] = []
+
+        def run_stage(stage: Stage, threads: int) -> None:
+            started.append(stage.name)
+            if stage.name == "b":
+                raise subprocess.CalledProcessError(1, ["b"])
+
+        with self.assertRaises(subprocess.CalledProcessError):
+            run_pipeline.schedule_stages(chain_stages(), run_stage, workers=1)
+        self.assertNotIn("d", started)
+
+    def test_budget_follows_the_stages_running_when_each_starts(self) -> None:
+        stages = [
+            Stage("modelo", None, outputs=("data/m.csv",), heavy=True),
+            Stage("grafico", None, inputs=("data/m.csv",)),
+        ]
+        budgets: dict[str, int] = {}
+
+        def run_stage(stage: Stage, threads: int) -> None:
+            budgets[stage.name] = threads
+
+        run_pipeline.schedule_stages(stages, run_stage, workers=4, cpus=8)
+
+        self.assertEqual(budgets, {"modelo": 8, "grafico": 8})
+
+    def test_graph_rejects_cycles_and_shared_outputs(self) -> None:
+        cycle = [
+            Stage("a", None, inputs=("data/b.csv",), outputs=("data/a.csv",)),
+            Stage("b", None, inputs=("data/a.csv",), outputs=("data/b.csv",)),
+        ]
+        with self.assertRaisesRegex(ValueError, "Ciclo"):
+            run_pipeline.stage_dependencies(cycle)
+        shared = [
+            Stage("a", None, outputs=("data/x.csv",)),
+            Stage("b", None, outputs=("data/x.csv",)),
+        ]
+        with self.assertRaisesRegex(ValueError, "gravado"):
+            run_pipeline.stage_dependencies(shared)
+
+    def test_heavy_stages_share_the_cores_and_see_their_budget(self) -> None:
+        heavy = Stage("modelo", "src/modelo.py", heavy=True)
+        other = Stage("outro", "src/outro.py", heavy=True)
+        light = Stage("leve", None)
+        budget = run_pipeline.thread_budget
+        self.assertEqual(budget(heavy, [heavy], cpus=16), 16)
+        self.assertEqual(budget(light, [light], cpus=16), 16)
+        self.assertEqual(budget(heavy, [other, light, heavy], cpus=16), 7)
+        self.assertEqual(budget(light, [other, light], cpus=16), 1)
+        self.assertEqual(budget(heavy, [other, heavy], cpus=1), 1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            script = root / "fonte" / "src" / "modelo.py"
+            script.parent.mkdir(parents=True)
+            script.write_text(
+                "import os, sys\nprint(os.environ['OMP_NUM_THREADS'], *sys.argv[1:])\n",
+                encoding="utf-8",
+            )
+            with contextlib.redirect_stdout(io.StringIO()):
+                run_pipeline.run_stage(heavy, root, root / "fonte", root, 3, ("--x",))
+
+            self.assertEqual((root / "modelo.log").read_text().strip(), "3 --x")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""Regressões para a telemetria das etapas do pipeline."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+FONTE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(FONTE_DIR))
+
+import run_pipeline  # noqa: E402
+from run_pipeline import Stage  # noqa: E402
+
+
+def telemetry(**stages: dict[str, object]) -> dict[str, object]:
+    return {"tempo_total_s": 60.0, "etapas": stages}
+
+
+class PipelineTelemetryTests(unittest.TestCase):
+    def test_stage_reports_time_cpu_memory_and_output_sizes(self) -> None:
+        stage = Stage("modelo", "src/modelo.py", outputs=("data/saida.bin",))
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            script = root / "fonte" / "src" / "modelo.py"
+            script.parent.mkdir(parents=True)
+            script.write_text(
+                "import pathlib\n"
+                "data = pathlib.Path('../data')\n"
+                "data.mkdir()\n"
+                "(data / 'saida.bin').write_bytes(bytearray(64 * 2**20))\n"
+                "sum(range(3_000_000))\n",
+                encoding="utf-8",
+            )
+            with contextlib.redirect_stdout(io.StringIO()):
+                measured = run_pipeline.run_stage(stage, root, root / "fonte", root, 1)
+
+            self.assertGreater(measured["tempo_s"], 0)
+            self.assertGreater(measured["cpu_usuario_s"] + measured["cpu_sistema_s"], 0)
+            self.assertGreaterEqual(measured["rss_pico_mb"], 64)
+            self.assertEqual(
+                run_pipeline.stage_output_sizes(stage, root / "fonte"),
+                {"data/saida.bin": 64 * 2**20},
+            )
+
+    def test_comparison_flags_slower_or_heavier_stages_only(self) -> None:
+        previous = telemetry(
+            lenta={"tempo_s": 100.0, "rss_pico_mb": 500.0},
+            pesada={"tempo_s": 100.0, "rss_pico_mb": 500.0},
+            curta={"tempo_s": 1.0, "rss_pico_mb": 100.0},
+            cache={"tempo_s": 0.1, "cache": True},
+            estavel={"tempo_s": 100.0, "rss_pico_mb": 500.0},
+        )
+        current = telemetry(
+            lenta={"tempo_s": 150.0, "rss_pico_mb": 500.0},
+            pesada={"tempo_s": 90.0, "rss_pico_mb": 800.0},
+            curta={"tempo_s": 3.0, "rss_pico_mb": 100.0},
+            cache={"tempo_s": 80.0, "rss_pico_mb": 900.0},
+            estavel={"tempo_s": 110.0, "rss_pico_mb": 550.0},
+            nova={"tempo_s": 30.0},
+        )
+        regressions = run_pipeline.compare_telemetry(current, previous)
+
+        self.assertEqual(
+            regressions, {"lenta": ["tempo +50%"], "pesada": ["memória +60%"]}
+        )
+        table = run_pipeline.format_telemetry(current, regressions)
+        lines = table.splitlines()
+        self.assertTrue(lines[1].startswith("lenta"))
+        self.assertIn("[REGRESSÃO: tempo +50%]", lines[1])
+
+    def test_warm_runs_compare_time_only(self) -> None:
+        previous = telemetry(modelo={"tempo_s": 100.0, "rss_pico_mb": 500.0})
+        current = telemetry(modelo={"tempo_s": 100.0, "rss_pico_mb": 900.0})
+        previous["runner"] = current["runner"] = "warm"
+        self.assertEqual(run_pipeline.compare_telemetry(current, previous), {})
+
+        current["etapas"]["modelo"]["tempo_s"] = 200.0
+        self.assertEqual(
+            run_pipeline.compare_telemetry(current, previous), {"modelo": ["tempo +100%"]}
+        )
+
+    def test_runs_with_other_runner_workers_or_threads_are_not_compared(self) -> None:
+        previous = telemetry(modelo={"tempo_s": 100.0, "threads": 4})
+        slower = {"tempo_s": 300.0, "threads": 4}
+        for key, value in (("runner", "warm"), ("workers", 4)):
+            current = {**telemetry(modelo=slower), key: value}
+            with contextlib.redirect_stdout(io.StringIO()) as log:
+                self.assertEqual(run_pipeline.compare_telemetry(current, previous), {})
+            self.assertIn(f"outro {key}", log.getvalue())
+
+        current = telemetry(modelo={**slower, "threads": 1})
+        self.assertEqual(run_pipeline.compare_telemetry(current, previous), {})
+
+    def test_report_is_written_and_compared_with_the_previous_run(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            previous = root / "anterior.json"
+            previous.write_text(
+                json.dumps(telemetry(modelo={"tempo_s": 10.0})), encoding="utf-8"
+            )
+            current = telemetry(modelo={"tempo_s": 20.0, "saidas": {"a.csv": 2**20}})
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                regressions = run_pipeline.report_telemetry(
+                    current, root / "atual.json", previous
+                )
+                run_pipeline.report_telemetry(current, root / "outra.json", root / "x.json")
+
+            self.assertEqual(regressions, {"modelo": ["tempo +100%"]})
+            self.assertEqual(json.loads((root / "atual.json").read_text()), current)
+            self.assertIn("Telemetria anterior não encontrada", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Regressões para as dependências declaradas em ``requirements.txt``."""
+
+from __future__ import annotations
+
+import ast
+import re
+import sys
+import unittest
+from pathlib import Path
+
+
+FONTE_DIR = Path(__file__).resolve().parents[1]
+REQUIREMENTS = FONTE_DIR.parent / "requirements.txt"
+# Nome de importação -> nome do pacote, quando diferem.
+DISTRIBUTIONS = {"sklearn": "scikit-learn"}
+
+
+def top_level_imports(path: Path) -> set[str]:
+    """Pacotes importados no corpo do módulo; os opcionais, em ``try``, ficam de fora."""
+    modules = set()
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Import):
+            modules.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules.add(node.module.split(".")[0])
+    return modules
+
+
+class RequirementsTests(unittest.TestCase):
+    def test_direct_imports_are_pinned(self) -> None:
+        pinned = {
+            match.group(1).lower()
+            for match in re.finditer(
+                r"^([A-Za-z0-9_.-]+)==", REQUIREMENTS.read_text(encoding="utf-8"), re.M
+            )
+        }
+        sources = [
+            path
+            for directory in ("src", "interface")
+            for path in (FONTE_DIR / directory).rglob("*.py")
+        ]
+        local = {path.stem for path in sources}
+        for path in sources:
+            for module in top_level_imports(path) - local - set(sys.stdlib_module_names):
+                with self.subTest(script=path.name, module=module):
+                    self.assertIn(DISTRIBUTIONS.get(module, module), pinned)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,459 @@
+"""Regressões para a ingestão incremental e em cache das fontes padronizadas."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import build_base_from_standardized  # noqa: E402
+from build_base_from_standardized import (  # noqa: E402
+    append_base,
+    build_base,
+    build_daily_target,
+    build_daily_target_from_counts,
+    build_daily_weather,
+    cached_sha256,
+    count_unique_events_bounded,
+    event_index_digest,
+    load_unique_interruption_events,
+    update_event_index,
+)
+from hourly_base import HourlyBase  # noqa: E402
+
+
+def event_lines(rows: list[tuple[str, str]]) -> str:
+    return "".join(f"{event_id},{start},X\n" for event_id, start in rows)
+
+
+HEADER = "NumOrdemInterrupcao,DatInicioInterrupcao,DscCausa\n"
+INITIAL = [
+    ("100", "2017-01-01 08:00:00"),
+    ("101", "2017-01-01 09:00:00"),
+    ("100", "2017-01-01 08:00:00"),
+    ("102", "2017-01-02 10:00:00"),
+]
+APPENDED = [
+    ("101", "2017-01-01 09:00:00"),
+    ("103", "2017-01-02 11:00:00"),
+    ("104", "2017-01-03 12:00:00"),
+    ("104", "2017-01-03 12:00:00"),
+]
+
+
+def full_target(path: Path) -> pd.DataFrame:
+    events, _ = load_unique_interruption_events(path)
+    return build_daily_target(events)[0]
+
+
+class IncrementalIngestionTests(unittest.TestCase):
+    def test_appended_tail_matches_full_recompute(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "eventos.csv"
+            index_dir = root / "indice"
+            source.write_text(HEADER + event_lines(INITIAL), encoding="utf-8")
+            update_event_index(source, index_dir)
+
+            with source.open("a", encoding="utf-8") as stream:
+                stream.write(event_lines(APPENDED))
+            counts, raw_rows = update_event_index(source, index_dir)
+
+            incremental = build_daily_target_from_counts(counts)[0]
+            pd.testing.assert_frame_equal(incremental, full_target(source))
+            self.assertEqual(raw_rows, len(INITIAL) + len(APPENDED))
+
+    def test_appended_ids_longer_than_the_index_are_not_truncated(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "eventos.csv"
+            index_dir = root / "indice"
+            initial = [("11", "2017-01-01 08:00:00"), ("12", "2017-01-01 09:00:00")]
+            source.write_text(HEADER + event_lines(initial), encoding="utf-8")
+            update_event_index(source, index_dir)
+
+            for _ in range(2):
+                with source.open("a", encoding="utf-8") as stream:
+                    stream.write(event_lines([("123456", "2017-01-02 10:00:00")]))
+                counts, _ = update_event_index(source, index_dir)
+
+            incremental = build_daily_target_from_counts(counts)[0]
+            pd.testing.assert_frame_equal(incremental, full_target(source))
+            self.assertEqual(counts.to_dict()[pd.Timestamp("2017-01-02")], 1)
+
+    def test_delta_file_is_merged_without_reading_history(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "eventos.csv"
+            delta = root / "delta.csv"
+            index_dir = root / "indice"
+            source.write_text(HEADER + event_lines(INITIAL), encoding="utf-8")
+            delta.write_text(HEADER + event_lines(APPENDED), encoding="utf-8")
+            update_event_index(source, index_dir)
+
+            counts, _ = update_event_index(source, index_dir, delta)
+
+            self.assertEqual(counts.to_dict()[pd.Timestamp("2017-01-01")], 2)
+            self.assertEqual(counts.to_dict()[pd.Timestamp("2017-01-02")], 2)
+            self.assertEqual(counts.to_dict()[pd.Timestamp("2017-01-03")], 1)
+
+    def test_appended_tail_is_hashed_without_rereading_history(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "eventos.csv"
+            index_dir = root / "indice"
+            source.write_text(HEADER + event_lines(INITIAL), encoding="utf-8")
+            update_event_index(source, index_dir)
+            initial_size = source.stat().st_size
+            self.assertEqual(
+                event_index_digest(index_dir),
+                hashlib.sha256(source.read_bytes()).hexdigest(),
+            )
+
+            with source.open("a", encoding="utf-8") as stream:
+                stream.write(event_lines(APPENDED))
+            ranges = []
+            original = build_base_from_standardized._range_sha256
+
+            def recorded(path: Path, start: int, stop: int) -> str:
+                ranges.append((start, stop))
+                return original(path, start, stop)
+
+            with (
+                patch.object(build_base_from_standardized, "sha256") as full_hash,
+                patch.object(build_base_from_standardized, "_range_sha256", recorded),
+            ):
+                update_event_index(source, index_dir)
+
+            full_hash.assert_not_called()
+            self.assertEqual(ranges, [(initial_size, source.stat().st_size)])
+            self.assertNotEqual(
+                event_index_digest(index_dir),
+                hashlib.sha256(source.read_bytes()).hexdigest(),
+            )
+
+    def test_same_delta_is_not_applied_twice(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "eventos.csv"
+            delta = root / "delta.csv"
+            index_dir = root / "indice"
+            source.write_text(HEADER + event_lines(INITIAL), encoding="utf-8")
+            delta.write_text(
+                HEADER + event_lines([("200", "2017-01-03 12:00:00")]), encoding="utf-8"
+            )
+            update_event_index(source, index_dir)
+
+            first, _ = update_event_index(source, index_dir, delta)
+            digest = event_index_digest(index_dir)
+            second, _ = update_event_index(source, index_dir, delta)
+
+            pd.testing.assert_series_equal(second, first)
+            self.assertEqual(event_index_digest(index_dir), digest)
+            self.assertEqual(first.to_dict()[pd.Timestamp("2017-01-03")], 1)
+
+    def test_appends_add_segments_without_rewriting_history(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "eventos.csv"
+            index_dir = root / "indice"
+            history_rows = [(str(number), "2017-01-01 08:00:00") for number in range(64)]
+            source.write_text(HEADER + event_lines(history_rows), encoding="utf-8")
+            update_event_index(source, index_dir)
+            history = index_dir / "ids-000000.npy"
+            history_inode = history.stat().st_ino
+
+            for number in range(200, 208):
+                with source.open("a", encoding="utf-8") as stream:
+                    stream.write(
+                        event_lines(
+                            [(str(number), "2017-01-03 12:00:00"), history_rows[0]]
+                        )
+                    )
+                counts, _ = update_event_index(source, index_dir)
+
+            meta = json.loads((index_dir / "meta.json").read_text(encoding="utf-8"))
+            self.assertEqual(history.stat().st_ino, history_inode)
+            self.assertEqual(len(meta["segmentos"]), 2)
+            self.assertEqual(
+                sorted(path.name for path in index_dir.glob("*.npy")),
+                sorted(
+                    [*meta["segmentos"], f"dias-{meta['geracao']:06d}.npy",
+                     f"contagens-{meta['geracao']:06d}.npy"]
+                ),
+            )
+            self.assertEqual(counts.to_dict()[pd.Timestamp("2017-01-03")], 8)
+            pd.testing.assert_frame_equal(
+                build_daily_target_from_counts(counts)[0], full_target(source)
+            )
+
+    def test_rewritten_source_rebuilds_index(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "eventos.csv"
+            index_dir = root / "indice"
+            source.write_text(HEADER + event_lines(INITIAL), encoding="utf-8")
+            update_event_index(source, index_dir)
+
+            source.write_text(HEADER + event_lines(APPENDED), encoding="utf-8")
+            counts, raw_rows = update_event_index(source, index_dir)
+
+            self.assertEqual(int(counts.sum()), 3)
+            self.assertEqual(raw_rows, len(APPENDED))
+
+
+class BoundedMemoryIngestionTests(unittest.TestCase):
+    def test_partitioned_deduplication_matches_in_memory_target(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "eventos.csv"
+            source.write_text(
+                HEADER + event_lines(INITIAL + APPENDED), encoding="utf-8"
+            )
+
+            counts, raw_rows, stats = count_unique_events_bounded(
+                source, memory_budget_mb=0.0001, spill_dir=root
+            )
+
+            pd.testing.assert_frame_equal(
+                build_daily_target_from_counts(counts)[0], full_target(source)
+            )
+            self.assertEqual(raw_rows, len(INITIAL) + len(APPENDED))
+            self.assertGreater(stats["particoes"], 1)
+            self.assertEqual([path.name for path in root.iterdir()], ["eventos.csv"])
+
+    def test_nonpositive_budget_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            count_unique_events_bounded(Path("eventos.csv"), memory_budget_mb=0)
+
+
+class SourceCacheTests(unittest.TestCase):
+    def test_cached_events_skip_csv_parsing(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "eventos.csv"
+            source.write_text(HEADER + event_lines(INITIAL), encoding="utf-8")
+            first, first_rows = load_unique_interruption_events(
+                source, root / "cache", "digest"
+            )
+            source.unlink()
+
+            second, second_rows = load_unique_interruption_events(
+                source, root / "cache", "digest"
+            )
+
+            pd.testing.assert_frame_equal(
+                first.reset_index(drop=True), second.reset_index(drop=True)
+            )
+            self.assertEqual(first_rows, second_rows)
+
+    def test_cached_weather_matches_csv_parsing(self) -> None:
+        frame = pd.DataFrame(
+            {
+                "data": ["2025-01-01", "2025-01-01", "2025-01-02"],
+                "hora_utc": ["0000 UTC", "0100 UTC", "0000 UTC"],
+                "precipitacao_total_horario_mm": [1.0, -9999.0, 0.5],
+                "temperatura_ar_bulbo_seco_c": [20.0, 21.0, 19.0],
+                "vento_direcao_horaria_gr": [10.0, 20.0, 30.0],
+                "vento_rajada_max_ms": [8.0, 7.0, 6.0],
+                "vento_velocidade_horaria_ms": [2.0, 3.0, 1.0],
+            }
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            path = root / "weather.csv"
+            frame.to_csv(path, index=False)
+            digests = {path: "digest"}
+            parsed = build_daily_weather([path], root / "cache", digests)
+            path.unlink()
+
+            cached = build_daily_weather([path], root / "cache", digests)
+
+        pd.testing.assert_frame_equal(parsed, cached)
+
+
+    def test_pruning_keeps_the_latest_versions_of_each_source(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            cache = root / "cache"
+            source = root / "eventos.csv"
+            other = root / "outros.csv"
+            other.write_text(HEADER + event_lines(INITIAL), encoding="utf-8")
+            load_unique_interruption_events(other, cache, "outros")
+            for version in range(4):
+                source.write_text(
+                    HEADER + event_lines(INITIAL[: version + 1]), encoding="utf-8"
+                )
+                load_unique_interruption_events(source, cache, f"v{version}")
+                meta_path = next(cache.glob(f"*/eventos/v{version}/meta.json"))
+                os.utime(meta_path, (version + 1, version + 1))
+            # Reler a versão mais antiga a torna a usada mais recentemente.
+            load_unique_interruption_events(source, cache, "v0")
+            (cache / "v0-esquema0" / "eventos").mkdir(parents=True)
+
+            removed, freed = build_base_from_standardized.prune_source_cache(cache, 2)
+
+            kept = sorted(path.name for path in cache.glob("*/eventos/*"))
+            self.assertEqual(kept, ["outros", "v0", "v3"])
+            self.assertEqual(removed, 3)
+            self.assertGreater(freed, 0)
+            self.assertFalse((cache / "v0-esquema0").exists())
+
+
+class HashMemoizationTests(unittest.TestCase):
+    def test_digest_is_reused_until_metadata_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "fonte.csv"
+            path.write_text("a,b\n1,2\n", encoding="utf-8")
+            cache: dict[str, dict[str, object]] = {}
+            original = cached_sha256(path, cache)
+            entry = cache[str(path.resolve())]
+            entry["sha256"] = "memorizado"
+
+            self.assertEqual(cached_sha256(path, cache), "memorizado")
+
+            path.write_text("a,b\n1,3\n", encoding="utf-8")
+            os.utime(path, ns=(entry["mtime_ns"] + 1, entry["mtime_ns"] + 1))
+            self.assertNotEqual(cached_sha256(path, cache), original)
+
+    def test_verification_forces_full_rehash(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "fonte.csv"
+            path.write_text("a,b\n1,2\n", encoding="utf-8")
+            cache: dict[str, dict[str, object]] = {}
+            original = cached_sha256(path, cache)
+            cache[str(path.resolve())]["sha256"] = "memorizado"
+
+            self.assertEqual(cached_sha256(path, cache, verify=True), original)
+
+
+WEATHER_ROWS = [
+    (day, hour, 1.0, 20.0 + index, 90.0, 8.0, 2.0)
+    for index, day in enumerate(["2017-01-01", "2017-01-02", "2017-01-03"])
+    for hour in ("0000 UTC", "1200 UTC")
+]
+
+
+def write_sources(root: Path) -> tuple[Path, Path]:
+    source = root / "eventos.csv"
+    source.write_text(HEADER + event_lines(INITIAL + APPENDED), encoding="utf-8")
+    inmet_dir = root / "inmet"
+    (inmet_dir / "2017").mkdir(parents=True)
+    pd.DataFrame(
+        WEATHER_ROWS,
+        columns=[
+            "data",
+            "hora_utc",
+            "precipitacao_total_horario_mm",
+            "temperatura_ar_bulbo_seco_c",
+            "vento_direcao_horaria_gr",
+            "vento_rajada_max_ms",
+            "vento_velocidade_horaria_ms",
+        ],
+    ).to_csv(
+        inmet_dir / "2017" / "INMET_CO_DF_A001_BRASILIA_01-01-2017_A_31-12-2017.CSV",
+        index=False,
+    )
+    return source, inmet_dir
+
+
+class AppendBaseTests(unittest.TestCase):
+    def test_appended_days_match_full_rebuild(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source, inmet_dir = write_sources(root)
+            start = pd.Timestamp("2017-01-01")
+            end = pd.Timestamp("2017-01-03")
+            extras = {"all_stations": True, "hourly": True}
+            build_base(
+                source, inmet_dir, root / "completa", start=start, end=end, **extras
+            )
+            build_base(
+                source,
+                inmet_dir,
+                root / "anexada",
+                start=start,
+                end=pd.Timestamp("2017-01-02"),
+                **extras,
+            )
+            manifest = append_base(source, inmet_dir, root / "anexada", end=end)
+
+            for name in (
+                "base_diaria_interrupcoes_clima_vento.csv",
+                "vento_diario_brasilia.csv",
+                "clima_diario_estacoes.csv",
+            ):
+                pd.testing.assert_frame_equal(
+                    pd.read_csv(root / "anexada" / name),
+                    pd.read_csv(root / "completa" / name),
+                )
+            appended = HourlyBase(root / "anexada" / "base_horaria")
+            complete = HourlyBase(root / "completa" / "base_horaria")
+            self.assertEqual(appended.hours, complete.hours)
+            for column in complete.columns:
+                np.testing.assert_array_equal(appended[column], complete[column])
+            appended = complete = None
+
+        self.assertEqual(manifest["periodo"]["fim"], "2017-01-03")
+        self.assertEqual(
+            manifest["saidas"],
+            [
+                "base_diaria_interrupcoes_clima_vento.csv",
+                "vento_diario_brasilia.csv",
+                "base_horaria/",
+                "clima_diario_estacoes.csv",
+            ],
+        )
+        self.assertEqual(len(manifest["inmet_estacoes"]), 1)
+        self.assertEqual(manifest["anexacoes"][-1]["inicio"], "2017-01-03")
+        self.assertEqual(manifest["interrupcoes"]["eventos_unicos"], 5)
+
+    def test_up_to_date_base_is_left_untouched(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source, inmet_dir = write_sources(root)
+            end = pd.Timestamp("2017-01-03")
+            build_base(
+                source, inmet_dir, root, start=pd.Timestamp("2017-01-01"), end=end
+            )
+            base_path = root / "base_diaria_interrupcoes_clima_vento.csv"
+            before = base_path.read_bytes()
+            manifest = append_base(source, inmet_dir, root, end=end)
+
+            self.assertEqual(base_path.read_bytes(), before)
+        self.assertNotIn("anexacoes", manifest)
+
+    def test_gap_in_existing_base_is_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source, inmet_dir = write_sources(root)
+            build_base(
+                source,
+                inmet_dir,
+                root,
+                start=pd.Timestamp("2017-01-01"),
+                end=pd.Timestamp("2017-01-02"),
+            )
+            base_path = root / "base_diaria_interrupcoes_clima_vento.csv"
+            base = pd.read_csv(base_path)
+            base.drop(index=0).to_csv(base_path, index=False)
+            base.iloc[[0]].to_csv(base_path, mode="a", header=False, index=False)
+
+            with self.assertRaisesRegex(ValueError, "lacunas"):
+                append_base(source, inmet_dir, root, end=pd.Timestamp("2017-01-03"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Regressões para o esquema tipado das fontes padronizadas."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from build_base_from_standardized import read_inmet_hourly  # noqa: E402
+from source_schema import (  # noqa: E402
+    ANEEL_SCHEMA,
+    INMET_SCHEMA,
+    iter_typed_csv,
+    parse_datetimes,
+    parse_throughput,
+    read_typed_csv,
+)
+
+
+INMET_HEADER = ",".join(INMET_SCHEMA["tipos"]) + "\n"
+
+
+class SourceSchemaTests(unittest.TestCase):
+    def test_sentinels_become_missing_and_throughput_is_reported(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "inmet.csv"
+            path.write_text(
+                INMET_HEADER
+                + "2025-01-01,0000 UTC,-9999,20.5,90,8,2\n"
+                + "2025-01-01,0100 UTC,1.5,-999,180,9,3\n",
+                encoding="utf-8",
+            )
+            stats: dict[str, object] = {}
+            hourly = read_inmet_hourly(path, parse_stats=stats)
+
+        self.assertTrue(np.isnan(hourly.loc[0, "precipitacao_total_horario_mm"]))
+        self.assertTrue(np.isnan(hourly.loc[1, "temperatura_ar_bulbo_seco_c"]))
+        self.assertEqual(hourly["hora_utc"].tolist(), ["0000 UTC", "0100 UTC"])
+        self.assertEqual(hourly["data"].dt.day.tolist(), [1, 1])
+        self.assertEqual(stats["linhas"], 2)
+        self.assertGreater(stats["linhas_por_s"], 0)
+
+    def test_non_numeric_value_falls_back_to_coercion(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "inmet.csv"
+            path.write_text(
+                INMET_HEADER + "2025-01-01,0000 UTC,abc,20.5,90,8,2\n",
+                encoding="utf-8",
+            )
+            frame = read_typed_csv(path, INMET_SCHEMA)
+
+        self.assertTrue(np.isnan(frame.loc[0, "precipitacao_total_horario_mm"]))
+        self.assertEqual(frame["temperatura_ar_bulbo_seco_c"].dtype, np.float64)
+
+    def test_unexpected_datetime_format_falls_back_to_inference(self) -> None:
+        values = pd.Series(
+            ["2017-01-01T08:00:00", "invalida"], name="DatInicioInterrupcao"
+        )
+        parsed = parse_datetimes(values, ANEEL_SCHEMA)
+
+        self.assertEqual(parsed.iloc[0], pd.Timestamp("2017-01-01 08:00:00"))
+        self.assertTrue(pd.isna(parsed.iloc[1]))
+
+    def test_chunked_and_whole_reads_agree(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "eventos.csv"
+            path.write_text(
+                "NumOrdemInterrupcao,DatInicioInterrupcao,DscCausa\n"
+                + "".join(f"{n},2017-01-01 08:00:00,X\n" for n in range(5)),
+                encoding="utf-8",
+            )
+            columns = ["NumOrdemInterrupcao", "DatInicioInterrupcao"]
+            whole = read_typed_csv(path, ANEEL_SCHEMA, columns)
+            chunked = pd.concat(
+                iter_typed_csv(path, ANEEL_SCHEMA, columns, chunksize=2),
+                ignore_index=True,
+            )
+
+        pd.testing.assert_frame_equal(whole, chunked, check_dtype=False)
+        self.assertEqual(whole["NumOrdemInterrupcao"].iloc[0], "0")
+
+    def test_throughput_uses_elapsed_time(self) -> None:
+        stats = parse_throughput(1000, 2 * 1024 * 1024, time.perf_counter() - 2, "c")
+
+        self.assertAlmostEqual(stats["linhas_por_s"], 500, delta=5)
+        self.assertAlmostEqual(stats["mb_por_s"], 1, delta=0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,7 +18,9 @@ sys.path.insert(0, str(SRC_DIR))
 
 from build_base_from_standardized import (  # noqa: E402
     build_daily_weather,
+    build_daily_weather_stations,
     circular_mean_degrees,
+    find_inmet_station_files,
 )
 
 
@@ -102,6 +104,91 @@ class WeatherReconstructionTests(unittest.TestCase):
         self.assertTrue(np.isnan(daily["vento_dir_sin"]))
         self.assertTrue(np.isnan(daily["vento_dir_cos"]))
 
+    def test_parallel_yearly_aggregation_matches_serial(self) -> None:
+        years = [
+            hourly_frame(
+                [
+                    (f"{year}-01-01", "0000 UTC", 1.0, 20.0, 350.0, 8.0, 2.0),
+                    (f"{year}-01-01", "0100 UTC", -9999.0, 22.0, 10.0, 9.0, 3.0),
+                    (f"{year}-01-02", "0000 UTC", 0.0, 18.0, 90.0, -9999.0, 1.0),
+                ]
+            )
+            for year in (2018, 2019)
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for year, frame in zip((2018, 2019), years):
+                path = Path(temp_dir) / f"weather_{year}.csv"
+                frame.to_csv(path, index=False)
+                paths.append(path)
+            serial = build_daily_weather(paths)
+            parallel = build_daily_weather(paths, workers=2)
+
+        pd.testing.assert_frame_equal(serial, parallel)
+
+    def test_parallel_aggregation_rejects_dates_split_across_files(self) -> None:
+        frame = hourly_frame(
+            [("2025-01-01", "0000 UTC", 1.0, 20.0, 10.0, 8.0, 2.0)]
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = [Path(temp_dir) / "a.csv", Path(temp_dir) / "b.csv"]
+            for path in paths:
+                frame.to_csv(path, index=False)
+            with self.assertRaisesRegex(ValueError, "mais de um arquivo"):
+                build_daily_weather(paths, workers=2)
+
+    def test_station_discovery_groups_yearly_files(self) -> None:
+        names = [
+            "2018/INMET_CO_DF_A001_BRASILIA_01-01-2018_A_31-12-2018.CSV",
+            "2019/INMET_CO_DF_A001_BRASILIA_01-01-2019_A_31-12-2019.CSV",
+            "2019/INMET_CO_DF_A042_BRAZLANDIA_01-01-2019_A_31-12-2019.CSV",
+            "2019/INMET_CO_GO_A002_GOIANIA_01-01-2019_A_31-12-2019.CSV",
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            for name in names:
+                (root / name).parent.mkdir(exist_ok=True)
+                (root / name).write_text("", encoding="utf-8")
+            found = find_inmet_station_files(root)
+
+        self.assertEqual(list(found), ["A001", "A042"])
+        self.assertEqual([path.parent.name for path in found["A001"]], ["2018", "2019"])
+
+    def test_grouped_station_pass_matches_single_station_weather(self) -> None:
+        stations = {
+            "A001": hourly_frame(
+                [
+                    ("2025-01-01", "0000 UTC", 1.0, 20.0, 359.0, 8.0, 2.0),
+                    ("2025-01-01", "0100 UTC", 2.0, 22.0, 1.0, 10.0, 4.0),
+                ]
+            ),
+            "A042": hourly_frame(
+                [
+                    ("2025-01-01", "0000 UTC", 0.0, 18.0, 90.0, 5.0, 1.0),
+                    ("2025-01-02", "0000 UTC", -9999.0, 17.0, 180.0, 6.0, 2.0),
+                ]
+            ),
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = {}
+            for station, frame in stations.items():
+                path = Path(temp_dir) / f"{station}.csv"
+                frame.to_csv(path, index=False)
+                paths[station] = [path]
+            combined = build_daily_weather_stations(paths)
+            separate = {
+                station: build_daily_weather(station_paths)
+                for station, station_paths in paths.items()
+            }
+
+        for station, expected in separate.items():
+            result = combined.loc[combined["estacao"] == station].drop(
+                columns="estacao"
+            )
+            pd.testing.assert_frame_equal(
+                result.reset_index(drop=True), expected, check_dtype=False
+            )
+
     def test_interpolated_direction_is_renormalized(self) -> None:
         index = pd.date_range("2025-01-01", periods=3, freq="D")
         frame = pd.DataFrame(
@@ -16,7 +16,7 @@ DELIVERY_ROOT = Path(__file__).resolve().parents[1]
 SOURCE_DIR = PROJECT_ROOT / "Fonte" / "src"
 sys.path.insert(0, str(SOURCE_DIR))
 
-from aggregation import aggregate_daily, load_daily_base  # noqa: E402
+from aggregation import ScaleProvider, load_daily_base  # noqa: E402
 
 
 DEFAULT_BASE = PROJECT_ROOT / "Fonte" / "data" / "base_diaria_interrupcoes_clima_vento.csv"
@@ -24,8 +24,9 @@ DEFAULT_DATA_DIR = DELIVERY_ROOT / "dados"
 DEFAULT_FIGURE_DIR = DELIVERY_ROOT / "graficos" / "T9_vento_agregados"
 
 
-def add_display_fields(frame: pd.DataFrame, frequency: str) -> pd.DataFrame:
-    result = aggregate_daily(frame, frequency).copy()
+def add_display_fields(scales: ScaleProvider, frequency: str) -> pd.DataFrame:
+    frame = scales.frame
+    result = scales.at(frequency).copy()
     result["vento_direcao_media_circular_gr"] = (
         np.degrees(np.arctan2(result["vento_dir_sin"], result["vento_dir_cos"]))
         % 360.0
@@ -70,14 +71,14 @@ def plot_dual_axis(
 
 
 def generate_scale(
-    frame: pd.DataFrame,
+    scales: ScaleProvider,
     frequency: str,
     slug: str,
     label: str,
     data_dir: Path,
     figure_dir: Path,
 ) -> pd.DataFrame:
-    aggregated = add_display_fields(frame, frequency)
+    aggregated = add_display_fields(scales, frequency)
     aggregated.rename_axis("data_referencia").to_csv(
         data_dir / f"aggregados_{slug}_interrupcoes_vento.csv"
     )
@@ -119,12 +120,12 @@ def parse_args() -> argparse.Namespace:
 def main() -> None:
     args = parse_args()
     args.data_dir.mkdir(parents=True, exist_ok=True)
-    frame = load_daily_base(args.base)
+    scales = ScaleProvider(load_daily_base(args.base))
     weekly = generate_scale(
-        frame, "W-MON", "semanal", "semanais", args.data_dir, args.figure_dir
+        scales, "W-MON", "semanal", "semanais", args.data_dir, args.figure_dir
     )
     monthly = generate_scale(
-        frame, "MS", "mensal", "mensais", args.data_dir, args.figure_dir
+        scales, "MS", "mensal", "mensais", args.data_dir, args.figure_dir
     )
     print(
         f"[OK] Artefatos agregados regenerados: {len(weekly)} semanas e "